@@ -0,0 +1,32 @@
+# benchmarks/fixtures.py
+
+import gzip
+import json
+import typing as t
+from functools import lru_cache
+
+from benchmarks.make_fixtures import DATA_DIR
+
+FIXTURES = (
+    "schedule",
+    "game",
+    "game_boxscore",
+    "game_playByPlay",
+    "team_roster",
+    "schedule_games",
+    "boxscore_data",
+)
+
+
+@lru_cache(maxsize=None)
+def fixture_bytes(name: str) -> bytes:
+    path = DATA_DIR / f"{name}.json.gz"
+    if not path.exists():
+        raise FileNotFoundError(
+            f"Missing fixture {path}; run `python -m benchmarks.make_fixtures`"
+        )
+    return gzip.decompress(path.read_bytes())
+
+
+def fixture(name: str) -> t.Any:
+    return json.loads(fixture_bytes(name))
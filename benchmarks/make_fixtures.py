@@ -0,0 +1,48 @@
+# benchmarks/make_fixtures.py
+#
+# Writes the benchmark fixtures in benchmarks/data. The payloads follow the field
+# layout of real statsapi.mlb.com responses (schedule, game, game_boxscore,
+# game_playByPlay, team_roster) and the statsapi helper outputs validated by
+# ScheduleGame and BoxscoreResponse, with deterministic synthetic values.
+#
+#     python -m benchmarks.make_fixtures
+
+import gzip
+import json
+import random
+import typing as t
+from pathlib import Path
+
+from utils.services.simulator import payloads
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def build(seed: int = 2024) -> dict[str, t.Any]:
+    rng = random.Random(seed)
+    schedule_payload = payloads.schedule(rng)
+    feed, play_by_play = payloads.game(rng)
+    boxscore_payload = {"copyright": feed["copyright"], **feed["liveData"]["boxscore"]}
+    return {
+        "schedule": schedule_payload,
+        "game": feed,
+        "game_boxscore": boxscore_payload,
+        "game_playByPlay": play_by_play,
+        "team_roster": payloads.team_roster(rng),
+        "schedule_games": payloads.schedule_games(schedule_payload),
+        "boxscore_data": payloads.boxscore_data(boxscore_payload),
+    }
+
+
+def main():
+    DATA_DIR.mkdir(exist_ok=True)
+    for name, payload in build().items():
+        path = DATA_DIR / f"{name}.json.gz"
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        # mtime=0 keeps the archives byte-identical across regenerations.
+        path.write_bytes(gzip.compress(body, mtime=0))
+        print(f"{path}: {len(body):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+# benchmarks/run.py
+#
+#     python -m benchmarks.run                      # run everything
+#     python -m benchmarks.run -k validate          # only matching benchmarks
+#     python -m benchmarks.run --save               # store as results/<version>.json
+#     python -m benchmarks.run --compare 0.1.0      # fail on regressions vs 0.1.0
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+import tomllib
+import typing as t
+from pathlib import Path
+
+from config import with_base_url
+from benchmarks.fixtures import fixture, fixture_bytes
+from benchmarks.stub_server import StubServer
+from schemas.responses import (
+    GenericResponse,
+    LazyGameFeed,
+    ScheduleGame,
+    ScheduleResponse,
+)
+from schemas.responses.objects.boxscore_response import BoxscoreResponse
+from utils.services.getters.getter_service import GetterService
+from utils.services.metrics.endpoint_metrics import EndpointMetrics
+from utils.services.stats.pitch_table import parse_pitches
+
+ROOT = Path(__file__).parent.parent
+RESULTS_DIR = Path(__file__).parent / "results"
+
+GAME_PK = 745804
+
+Benchmark = t.Callable[[], t.Any]
+
+
+def _url_benchmarks(service: GetterService) -> dict[str, Benchmark]:
+    return {
+        "url.game": lambda: service._build_url(
+            "game", {"gamePk": GAME_PK, "timecode": "20240705_021500"}
+        ),
+        "url.schedule": lambda: service._build_url(
+            "schedule",
+            {
+                "sportId": 1,
+                "startDate": "2024-03-28",
+                "endDate": "2024-09-29",
+                "teamId": 147,
+                "hydrate": "linescore,probablePitcher,decisions,team",
+            },
+        ),
+        "url.team_roster": lambda: service._build_url(
+            "team_roster", {"teamId": 147, "rosterType": "active"}
+        ),
+    }
+
+
+def _decode_benchmarks() -> dict[str, Benchmark]:
+    benchmarks = {}
+    for name in ("schedule", "game", "game_boxscore", "game_playByPlay"):
+        body = fixture_bytes(name)
+        benchmarks[f"decode.{name}"] = lambda body=body: json.loads(body)
+    return benchmarks
+
+
+def _validate_benchmarks() -> dict[str, Benchmark]:
+    games = fixture("schedule_games")
+    boxscore = fixture("boxscore_data")
+    feed = fixture("game")
+    play_by_play = fixture("game_playByPlay")
+    return {
+        "validate.schedule_games": lambda: ScheduleResponse(
+            data=[ScheduleGame.model_validate(x) for x in games]
+        ),
+        "validate.boxscore": lambda: BoxscoreResponse.model_validate(boxscore),
+        "validate.generic_game": lambda: GenericResponse.model_validate({"data": feed}),
+        "validate.lazy_game_linescore": lambda: LazyGameFeed(feed).linescore,
+        "parse.pitch_table": lambda: parse_pitches(play_by_play, game_pk=GAME_PK),
+    }
+
+
+def _end_to_end_benchmarks(service: GetterService) -> dict[str, Benchmark]:
+    calls = {
+        "schedule": {"sportId": 1, "date": "2024-07-04"},
+        "game": {"gamePk": GAME_PK},
+        "game_boxscore": {"gamePk": GAME_PK},
+        "game_playByPlay": {"gamePk": GAME_PK},
+        "team_roster": {"teamId": 147},
+    }
+    return {
+        f"e2e.{endpoint}": lambda endpoint=endpoint, params=params: service._get(
+            endpoint, params
+        )
+        for endpoint, params in calls.items()
+    }
+
+
+def measure(fn: Benchmark, repeat: int) -> dict[str, float]:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    runs = [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "mean": statistics.fmean(runs),
+        "number": number,
+    }
+
+
+def project_version() -> str:
+    with open(ROOT / "pyproject.toml", "rb") as f:
+        return tomllib.load(f)["project"]["version"]
+
+
+def run(pattern: str = "", repeat: int = 5) -> dict[str, dict[str, float]]:
+    results = {}
+    with StubServer() as stub:
+        service = GetterService(
+            endpoints=with_base_url(stub.base_url), metrics=EndpointMetrics()
+        )
+        benchmarks = {
+            **_url_benchmarks(service),
+            **_decode_benchmarks(),
+            **_validate_benchmarks(),
+            **_end_to_end_benchmarks(service),
+        }
+        for name, fn in benchmarks.items():
+            if pattern and pattern not in name:
+                continue
+            results[name] = measure(fn, repeat)
+            print(f"{name:<32} {results[name]['median'] * 1e6:>12.1f} us")
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]], baseline_label: str, threshold: float
+) -> list[str]:
+    baseline = json.loads((RESULTS_DIR / f"{baseline_label}.json").read_text())
+    regressions = []
+    print(f"\nCompared with {baseline_label}:")
+    for name, current in results.items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        ratio = current["median"] / previous["median"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<32} {ratio:>8.2f}x{flag}")
+    return regressions
+
+
+def main(argv: t.Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="mlbstats benchmark suite")
+    parser.add_argument("-k", dest="pattern", default="", help="name substring")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--save",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="LABEL",
+        help="store results under LABEL (defaults to the project version)",
+    )
+    parser.add_argument("--compare", metavar="LABEL", help="baseline to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="allowed slowdown before a benchmark counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern, args.repeat)
+
+    if args.save is not None:
+        label = args.save or project_version()
+        RESULTS_DIR.mkdir(exist_ok=True)
+        path = RESULTS_DIR / f"{label}.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "label": label,
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": results,
+                },
+                indent=2,
+            )
+        )
+        print(f"\nSaved {path}")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
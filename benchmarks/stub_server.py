@@ -0,0 +1,59 @@
+# benchmarks/stub_server.py
+
+import re
+import threading
+import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.fixtures import fixture_bytes
+
+ROUTES = [
+    (re.compile(r"^/api/v1/schedule$"), "schedule"),
+    (re.compile(r"^/api/v1\.1/game/\d+/feed/live$"), "game"),
+    (re.compile(r"^/api/v1/game/\d+/boxscore$"), "game_boxscore"),
+    (re.compile(r"^/api/v1/game/\d+/playByPlay$"), "game_playByPlay"),
+    (re.compile(r"^/api/v1/teams/\d+/roster$"), "team_roster"),
+]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        for pattern, name in ROUTES:
+            if pattern.match(path):
+                body = fixture_bytes(name)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json;charset=UTF-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+        self.send_error(404)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    # Serves the benchmark fixtures on 127.0.0.1 in a background thread.
+
+    def __init__(self, port: int = 0):
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        self._thread: t.Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/"
+
+    def __enter__(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -1,3 +1,3 @@
-from .endpoints import ENDPOINTS, EndpointConfig
+from .endpoints import BASE_URL, ENDPOINTS, EndpointConfig, with_base_url
 
-__all__ = ["ENDPOINTS", "EndpointConfig"]
+__all__ = ["BASE_URL", "ENDPOINTS", "EndpointConfig", "with_base_url"]
@@ -1396,3 +1396,20 @@ ENDPOINTS: dict[str, EndpointConfig] = {
     ),
     # v1/analytics and v1/game/{gamePk}/guids endpoints (statcast data) require authentication.
 }
+
+
+def with_base_url(
+    base_url: str, endpoints: t.Optional[dict[str, EndpointConfig]] = None
+) -> dict[str, EndpointConfig]:
+    # Points every endpoint at another host, e.g. a local stub or caching proxy.
+    if endpoints is None:
+        endpoints = ENDPOINTS
+    if not base_url.endswith("/"):
+        base_url += "/"
+
+    return {
+        key: config.model_copy(
+            update={"url": base_url + config.url.removeprefix(BASE_URL)}
+        )
+        for key, config in endpoints.items()
+    }
@@ -1,11 +1,43 @@
 # main.py
+#
+#     python main.py 2023 2024 --out backfill/2023-2024 --workers 16
+#
+# Rerunning the same command resumes from backfill/2023-2024/checkpoint.jsonl.
 
-import statsapi as mlb
+import argparse
+import logging
+import typing as t
 
+from utils.services.backfill.backfill import GAME_ENDPOINTS, Backfill
 
-def main():
-    response = mlb.schedule(team=116, start_date="03/01/2025", end_date="04/08/2025")
-    print(response)
+
+def main(argv: t.Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Resumable season backfill")
+    parser.add_argument("start_season", type=int)
+    parser.add_argument("end_season", type=int, nargs="?", help="inclusive")
+    parser.add_argument("--out", required=True, help="output and checkpoint directory")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--endpoints", default=",".join(GAME_ENDPOINTS))
+    parser.add_argument(
+        "--game-types", default="R,F,D,L,W", help="schedule game types to include"
+    )
+    parser.add_argument("--report-every", type=float, default=5.0, help="seconds")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    seasons = range(args.start_season, (args.end_season or args.start_season) + 1)
+
+    with Backfill(
+        args.out,
+        endpoints=args.endpoints.split(","),
+        max_workers=args.workers,
+        report_every=args.report_every,
+    ) as backfill:
+        game_pks = backfill.games(seasons, set(args.game_types.split(",")))
+        progress = backfill.run(game_pks)
+
+    if progress.failed:
+        raise SystemExit(f"{progress.failed} units failed; rerun to retry them")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,17 @@
-from objects import (
+from .objects import (
     Team,
     LookupTeamResponse,
     ScheduleResponse,
     ScheduleGame,
     GenericResponse,
+    LazyGameFeed,
+    LazyPlayList,
+    Linescore,
+    Play,
+    PeopleResponse,
+    Person,
+    RosterEntry,
+    RosterResponse,
 )
 
 __all__ = [
@@ -12,4 +20,12 @@ __all__ = [
     "ScheduleResponse",
     "ScheduleGame",
     "GenericResponse",
+    "LazyGameFeed",
+    "LazyPlayList",
+    "Linescore",
+    "Play",
+    "PeopleResponse",
+    "Person",
+    "RosterEntry",
+    "RosterResponse",
 ]
@@ -1,6 +1,9 @@
 from .lookup_team_response import LookupTeamResponse, Team
 from .schedule_response import ScheduleResponse, ScheduleGame
 from .generic_response import GenericResponse
+from .game_feed_response import LazyGameFeed, LazyPlayList, Linescore, Play
+from .people_response import PeopleResponse, Person
+from .roster_response import RosterEntry, RosterResponse
 
 __all__ = [
     "Team",
@@ -8,4 +11,12 @@ __all__ = [
     "ScheduleResponse",
     "ScheduleGame",
     "GenericResponse",
+    "LazyGameFeed",
+    "LazyPlayList",
+    "Linescore",
+    "Play",
+    "PeopleResponse",
+    "Person",
+    "RosterEntry",
+    "RosterResponse",
 ]
@@ -92,3 +92,70 @@ class BoxscoreResponse(BaseModel):
     gameBoxInfo: list[str] = Field(
         default_factory=list, description="Additional game boxscore information"
     )
+
+
+# The raw game_boxscore API body, before statsapi.boxscore_data() reshapes it.
+
+
+class BoxscorePlayerRef(BaseModel):
+    id: int = Field(..., description="Unique player identifier")
+    fullName: t.Optional[str] = Field(None, description="Player's full name")
+
+
+class BoxscorePlayer(BaseModel):
+    person: BoxscorePlayerRef = Field(..., description="The player")
+    jerseyNumber: t.Optional[str] = Field(None, description="Uniform number")
+    position: dict[str, t.Any] = Field(
+        default_factory=dict, description="Position played in this game"
+    )
+    battingOrder: t.Optional[str] = Field(
+        None, description="Lineup slot, e.g. 100, or 101 for a substitute"
+    )
+    stats: dict[str, dict[str, t.Any]] = Field(
+        default_factory=dict, description="Game batting, pitching and fielding"
+    )
+    seasonStats: dict[str, dict[str, t.Any]] = Field(
+        default_factory=dict, description="Season batting, pitching and fielding"
+    )
+    gameStatus: dict[str, t.Any] = Field(
+        default_factory=dict, description="Current batter/pitcher and bench flags"
+    )
+
+
+class BoxscoreTeam(BaseModel):
+    team: dict[str, t.Any] = Field(..., description="Team reference")
+    teamStats: dict[str, dict[str, t.Any]] = Field(
+        default_factory=dict, description="Team batting, pitching and fielding"
+    )
+    players: dict[str, BoxscorePlayer] = Field(
+        default_factory=dict, description="Players keyed by ID<personId>"
+    )
+    batters: list[int] = Field(default_factory=list, description="Batter ids")
+    pitchers: list[int] = Field(default_factory=list, description="Pitcher ids")
+    bench: list[int] = Field(default_factory=list, description="Unused bench ids")
+    bullpen: list[int] = Field(default_factory=list, description="Unused bullpen ids")
+    battingOrder: list[int] = Field(
+        default_factory=list, description="Starting lineup ids in batting order"
+    )
+    info: list[dict[str, t.Any]] = Field(
+        default_factory=list, description="Titled batting/fielding notes"
+    )
+    note: list[dict[str, t.Any]] = Field(
+        default_factory=list, description="Lineup footnotes"
+    )
+
+
+class BoxscoreTeams(BaseModel):
+    away: BoxscoreTeam = Field(..., description="Away team boxscore")
+    home: BoxscoreTeam = Field(..., description="Home team boxscore")
+
+
+class GameBoxscoreResponse(BaseModel):
+    teams: BoxscoreTeams = Field(..., description="Both teams' boxscores")
+    officials: list[dict[str, t.Any]] = Field(
+        default_factory=list, description="Umpires and their positions"
+    )
+    info: list[dict[str, t.Any]] = Field(
+        default_factory=list, description="Label/value game notes, e.g. weather"
+    )
+    pitchingNotes: list[str] = Field(default_factory=list, description="Pitching notes")
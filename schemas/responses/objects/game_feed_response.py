@@ -0,0 +1,194 @@
+# schemas/responses/objects/game_feed_response.py
+
+import typing as t
+from functools import cached_property
+
+from pydantic import BaseModel, Field
+
+
+class LinescoreTeam(BaseModel):
+    runs: t.Optional[int] = Field(None, description="Runs scored")
+    hits: t.Optional[int] = Field(None, description="Hits")
+    errors: t.Optional[int] = Field(None, description="Errors committed")
+    leftOnBase: t.Optional[int] = Field(None, description="Runners left on base")
+
+
+class LinescoreInning(BaseModel):
+    num: int = Field(..., description="Inning number")
+    ordinalNum: t.Optional[str] = Field(None, description="Inning ordinal (e.g. 1st)")
+    home: LinescoreTeam = Field(
+        default_factory=LinescoreTeam, description="Home team line for the inning"
+    )
+    away: LinescoreTeam = Field(
+        default_factory=LinescoreTeam, description="Away team line for the inning"
+    )
+
+
+class LinescoreTeams(BaseModel):
+    home: LinescoreTeam = Field(
+        default_factory=LinescoreTeam, description="Home team totals"
+    )
+    away: LinescoreTeam = Field(
+        default_factory=LinescoreTeam, description="Away team totals"
+    )
+
+
+class Linescore(BaseModel):
+    currentInning: t.Optional[int] = Field(None, description="Current inning")
+    currentInningOrdinal: t.Optional[str] = Field(
+        None, description="Current inning ordinal"
+    )
+    inningState: t.Optional[str] = Field(
+        None, description="Inning state (e.g., Top, Middle, Bottom, End)"
+    )
+    isTopInning: t.Optional[bool] = Field(
+        None, description="Indicator if the top of the inning is in progress"
+    )
+    scheduledInnings: int = Field(9, description="Number of scheduled innings")
+    innings: list[LinescoreInning] = Field(
+        default_factory=list, description="Line for each inning played"
+    )
+    teams: LinescoreTeams = Field(
+        default_factory=LinescoreTeams, description="Game totals for each team"
+    )
+    balls: t.Optional[int] = Field(None, description="Balls in the current count")
+    strikes: t.Optional[int] = Field(None, description="Strikes in the current count")
+    outs: t.Optional[int] = Field(None, description="Outs in the current inning")
+
+
+class PlayResult(BaseModel):
+    type: t.Optional[str] = Field(None, description="Result type")
+    event: t.Optional[str] = Field(None, description="Result event (e.g. Single)")
+    eventType: t.Optional[str] = Field(None, description="Result event code")
+    description: t.Optional[str] = Field(None, description="Play description")
+    rbi: int = Field(0, description="Runs batted in on the play")
+    awayScore: int = Field(0, description="Away team score after the play")
+    homeScore: int = Field(0, description="Home team score after the play")
+
+
+class PlayAbout(BaseModel):
+    atBatIndex: int = Field(..., description="Index of the plate appearance")
+    halfInning: str = Field(..., description="Half inning (top or bottom)")
+    isTopInning: bool = Field(..., description="Indicator if top of the inning")
+    inning: int = Field(..., description="Inning number")
+    startTime: t.Optional[str] = Field(None, description="Play start time")
+    endTime: t.Optional[str] = Field(None, description="Play end time")
+    isComplete: bool = Field(False, description="Indicator if the play is complete")
+    isScoringPlay: t.Optional[bool] = Field(
+        None, description="Indicator if a run scored on the play"
+    )
+
+
+class PlayCount(BaseModel):
+    balls: int = Field(0, description="Balls")
+    strikes: int = Field(0, description="Strikes")
+    outs: int = Field(0, description="Outs")
+
+
+class PlayPerson(BaseModel):
+    id: int = Field(..., description="Unique player identifier")
+    fullName: t.Optional[str] = Field(None, description="Player's full name")
+
+
+class PlayMatchup(BaseModel):
+    batter: PlayPerson = Field(..., description="Batter in the plate appearance")
+    pitcher: PlayPerson = Field(..., description="Pitcher in the plate appearance")
+
+
+class Play(BaseModel):
+    result: PlayResult = Field(
+        default_factory=PlayResult, description="Outcome of the play"
+    )
+    about: PlayAbout = Field(..., description="Inning and timing context")
+    count: PlayCount = Field(
+        default_factory=PlayCount, description="Count at the end of the play"
+    )
+    matchup: PlayMatchup = Field(..., description="Batter and pitcher")
+    playEvents: list[dict[str, t.Any]] = Field(
+        default_factory=list, description="Raw pitch and action events"
+    )
+
+
+class LazyPlayList(t.Sequence[Play]):
+    # Validates individual plays on access so a poll that only reads the current
+    # play never pays for the rest of ``allPlays``.
+
+    def __init__(self, raw: list[dict[str, t.Any]]):
+        self._raw = raw
+        self._cache: dict[int, Play] = {}
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    @t.overload
+    def __getitem__(self, index: int) -> Play: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> list[Play]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw)))]
+
+        if index < 0:
+            index += len(self._raw)
+        if not 0 <= index < len(self._raw):
+            raise IndexError("play index out of range")
+
+        play = self._cache.get(index)
+        if play is None:
+            play = Play.model_validate(self._raw[index])
+            self._cache[index] = play
+        return play
+
+    @property
+    def raw(self) -> list[dict[str, t.Any]]:
+        return self._raw
+
+
+class LazyGameFeed:
+    def __init__(self, data: dict[str, t.Any]):
+        self._data = data
+        self._subtrees: dict[tuple[str, type[BaseModel]], BaseModel] = {}
+
+    @property
+    def raw(self) -> dict[str, t.Any]:
+        return self._data
+
+    @property
+    def game_pk(self) -> t.Optional[int]:
+        return self._data.get("gamePk")
+
+    @property
+    def timecode(self) -> t.Optional[str]:
+        return self._data.get("metaData", {}).get("timeStamp")
+
+    def node(self, path: str) -> t.Any:
+        node: t.Any = self._data
+        for key in path.split("."):
+            if not isinstance(node, dict) or key not in node:
+                raise KeyError(f"Path not found in game feed: {path}")
+            node = node[key]
+        return node
+
+    def subtree(self, path: str, model: type[BaseModel]) -> BaseModel:
+        key = (path, model)
+        if key not in self._subtrees:
+            self._subtrees[key] = model.model_validate(self.node(path))
+        return self._subtrees[key]
+
+    @cached_property
+    def linescore(self) -> Linescore:
+        return t.cast(Linescore, self.subtree("liveData.linescore", Linescore))
+
+    @cached_property
+    def current_play(self) -> t.Optional[Play]:
+        raw = self._data.get("liveData", {}).get("plays", {}).get("currentPlay")
+        if not raw:
+            return None
+        return t.cast(Play, self.subtree("liveData.plays.currentPlay", Play))
+
+    @cached_property
+    def all_plays(self) -> LazyPlayList:
+        raw = self._data.get("liveData", {}).get("plays", {}).get("allPlays", [])
+        return LazyPlayList(raw)
@@ -4,4 +4,4 @@ from pydantic import BaseModel
 
 
 class GenericResponse(BaseModel):
-    data: dict[str, t.Any]
+    data: t.Union[dict[str, t.Any], list[t.Any]]
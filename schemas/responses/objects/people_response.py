@@ -0,0 +1,42 @@
+# schemas/responses/objects/people_response.py
+
+import typing as t
+
+from pydantic import BaseModel, Field
+
+
+class PersonCode(BaseModel):
+    code: str = Field(..., description="Short code, e.g. R or L")
+    description: t.Optional[str] = Field(None, description="Long form of the code")
+
+
+class PersonPosition(BaseModel):
+    code: str = Field(..., description="Position code")
+    name: t.Optional[str] = Field(None, description="Position name")
+    type: t.Optional[str] = Field(None, description="Position type, e.g. Pitcher")
+    abbreviation: t.Optional[str] = Field(None, description="Position abbreviation")
+
+
+class Person(BaseModel):
+    id: int = Field(..., description="Unique player identifier")
+    fullName: str = Field(..., description="Player's full name")
+    firstName: t.Optional[str] = Field(None, description="First name")
+    lastName: t.Optional[str] = Field(None, description="Last name")
+    useName: t.Optional[str] = Field(None, description="Name the player goes by")
+    boxscoreName: t.Optional[str] = Field(None, description="Name in box scores")
+    primaryNumber: t.Optional[str] = Field(None, description="Uniform number")
+    birthDate: t.Optional[str] = Field(None, description="Date of birth")
+    currentAge: t.Optional[int] = Field(None, description="Current age")
+    height: t.Optional[str] = Field(None, description="Height, e.g. 6' 2\"")
+    weight: t.Optional[int] = Field(None, description="Weight in pounds")
+    active: t.Optional[bool] = Field(None, description="Whether the player is active")
+    primaryPosition: t.Optional[PersonPosition] = Field(
+        None, description="Primary position"
+    )
+    batSide: t.Optional[PersonCode] = Field(None, description="Batting side")
+    pitchHand: t.Optional[PersonCode] = Field(None, description="Throwing hand")
+    mlbDebutDate: t.Optional[str] = Field(None, description="MLB debut date")
+
+
+class PeopleResponse(BaseModel):
+    people: list[Person] = Field(default_factory=list)
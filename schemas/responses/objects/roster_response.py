@@ -0,0 +1,31 @@
+# schemas/responses/objects/roster_response.py
+
+import typing as t
+
+from pydantic import BaseModel, Field
+
+from .people_response import PersonPosition
+
+
+class RosterPerson(BaseModel):
+    id: int = Field(..., description="Unique player identifier")
+    fullName: str = Field(..., description="Player's full name")
+
+
+class RosterStatus(BaseModel):
+    code: str = Field(..., description="Roster status code, e.g. A")
+    description: t.Optional[str] = Field(None, description="Roster status")
+
+
+class RosterEntry(BaseModel):
+    person: RosterPerson = Field(..., description="The rostered player")
+    jerseyNumber: t.Optional[str] = Field(None, description="Uniform number")
+    position: t.Optional[PersonPosition] = Field(None, description="Roster position")
+    status: t.Optional[RosterStatus] = Field(None, description="Roster status")
+    parentTeamId: t.Optional[int] = Field(None, description="Organization team id")
+
+
+class RosterResponse(BaseModel):
+    teamId: t.Optional[int] = Field(None, description="Team the roster belongs to")
+    rosterType: t.Optional[str] = Field(None, description="Roster type, e.g. active")
+    roster: list[RosterEntry] = Field(default_factory=list)
@@ -1,6 +1,8 @@
 # utils/__init__.py
 
+from .game_feed import game_feed
 from .lookup_team import lookup_team
+from .pitches import pitches
 from .schedule import schedule
 
-__all__ = ["lookup_team", "schedule"]
+__all__ = ["game_feed", "lookup_team", "pitches", "schedule"]
@@ -0,0 +1,15 @@
+# utils/files.py
+
+import os
+from pathlib import Path
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    # Readers see either the old file or the complete new one, never a partial
+    # write, even if the process dies midway.
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
@@ -0,0 +1,19 @@
+# utils/game_feed.py
+
+import typing as t
+
+import statsapi as mlb
+
+from schemas.responses import LazyGameFeed
+
+
+def game_feed(gamePk, timecode=None, fields=None) -> LazyGameFeed:
+    params: dict[str, t.Any] = {"gamePk": gamePk}
+    if timecode:
+        params["timecode"] = timecode
+    if fields:
+        params["fields"] = fields
+
+    res: dict[str, t.Any] = mlb.get("game", params)
+
+    return LazyGameFeed(res)
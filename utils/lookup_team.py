@@ -1,20 +1,29 @@
 # utils/lookup_team.py
 
-import typing as t
+from schemas.responses import LookupTeamResponse
+from utils.services.metrics.tracing import get_tracer, span_attributes
+from utils.services.teams.team_index import TeamIndexCache
 
-import statsapi as mlb
-
-from schemas.responses import Team, LookupTeamResponse
+# Teams are fetched once per season and searched in memory afterwards.
+TEAM_INDEXES = TeamIndexCache()
 
 
 def lookup_team(
     lookup_value, activeStatus="Y", season=None, sportIds=1
 ) -> LookupTeamResponse:
-    res: dict[str, t.Any] = mlb.lookup_team(
+    params = dict(
         lookup_value=lookup_value,
         activeStatus=activeStatus,
         season=season,
         sportIds=sportIds,
     )
 
-    return LookupTeamResponse(data=[Team.model_validate(x) for x in res])
+    tracer = get_tracer()
+    with tracer.start_as_current_span(
+        "utils.lookup_team", attributes=span_attributes("teams", params)
+    ):
+        with tracer.start_as_current_span("team_index.load"):
+            index = TEAM_INDEXES.index(season, activeStatus, sportIds)
+
+        with tracer.start_as_current_span("team_index.lookup"):
+            return index.lookup(lookup_value)
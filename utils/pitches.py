@@ -0,0 +1,17 @@
+# utils/pitches.py
+
+import typing as t
+
+import statsapi as mlb
+
+from utils.services.stats.pitch_table import PitchTable, parse_pitches
+
+
+def pitches(gamePk, timecode=None) -> PitchTable:
+    params: dict[str, t.Any] = {"gamePk": gamePk}
+    if timecode:
+        params["timecode"] = timecode
+
+    res: dict[str, t.Any] = mlb.get("game_playByPlay", params)
+
+    return parse_pitches(res, game_pk=int(gamePk))
@@ -5,6 +5,7 @@ import typing as t
 import statsapi as mlb
 
 from schemas.responses import ScheduleResponse, ScheduleGame
+from utils.services.metrics.tracing import get_tracer, span_attributes
 
 
 def schedule(
@@ -19,7 +20,7 @@ def schedule(
     season=None,
     include_series_status=True,
 ) -> ScheduleResponse:
-    res: dict[str, t.Any] = mlb.schedule(
+    params = dict(
         date=date,
         start_date=start_date,
         end_date=end_date,
@@ -32,4 +33,12 @@ def schedule(
         include_series_status=include_series_status,
     )
 
-    return ScheduleResponse(data=[ScheduleGame.model_validate(x) for x in res])
+    tracer = get_tracer()
+    with tracer.start_as_current_span(
+        "utils.schedule", attributes=span_attributes("schedule", params)
+    ):
+        with tracer.start_as_current_span("statsapi.schedule"):
+            res: dict[str, t.Any] = mlb.schedule(**params)
+
+        with tracer.start_as_current_span("model.validate"):
+            return ScheduleResponse(data=[ScheduleGame.model_validate(x) for x in res])
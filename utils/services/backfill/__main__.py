@@ -0,0 +1,69 @@
+# utils/services/backfill/__main__.py
+#
+# One coordinator fills the queue; any number of workers drain it:
+#
+#     python -m utils.services.backfill coordinate --queue q.db 1990 2024 --shards 8
+#     python -m utils.services.backfill work --queue q.db --out data --shards 0,1,2,3
+#     python -m utils.services.backfill status --queue q.db
+
+import argparse
+import json
+import logging
+import typing as t
+
+from utils.services.backfill.backfill import GAME_ENDPOINTS
+from utils.services.backfill.work_queue import SqliteWorkQueue, Worker, coordinate
+
+
+def main(argv: t.Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Sharded backfill work queue")
+    parser.add_argument("--queue", required=True, help="SQLite work queue file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    coord = commands.add_parser("coordinate", help="enqueue games for seasons")
+    coord.add_argument("start_season", type=int)
+    coord.add_argument("end_season", type=int, nargs="?", help="inclusive")
+    coord.add_argument("--shards", type=int, default=1)
+    coord.add_argument("--endpoints", default=",".join(GAME_ENDPOINTS))
+    coord.add_argument("--game-types", default="R,F,D,L,W")
+
+    work = commands.add_parser("work", help="lease, fetch and ack units")
+    work.add_argument("--out", required=True, help="shared output directory")
+    work.add_argument("--shards", default=None, help="comma-separated shard ids")
+    work.add_argument("--workers", type=int, default=8)
+    work.add_argument("--lease-seconds", type=float, default=300.0)
+    work.add_argument("--follow", action="store_true", help="keep polling when idle")
+
+    status = commands.add_parser("status", help="print unit counts by state")
+    status.add_argument("--retry-failed", action="store_true")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    queue = SqliteWorkQueue(args.queue)
+
+    if args.command == "coordinate":
+        seasons = range(args.start_season, (args.end_season or args.start_season) + 1)
+        coordinate(
+            queue,
+            seasons,
+            args.endpoints.split(","),
+            args.shards,
+            set(args.game_types.split(",")),
+        )
+    elif args.command == "work":
+        shards = [int(s) for s in args.shards.split(",")] if args.shards else None
+        Worker(
+            queue,
+            args.out,
+            shards=shards,
+            max_workers=args.workers,
+            lease_seconds=args.lease_seconds,
+        ).run(drain=not args.follow)
+    else:
+        if args.retry_failed:
+            queue.retry_failed()
+    print(json.dumps(queue.counts()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+# utils/services/backfill/backfill.py
+
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from utils.files import write_atomic
+from utils.schedule import schedule
+from utils.services.getters.getter_service import GetterService
+from utils.services.metrics.tracing import propagate
+
+logger = logging.getLogger(__name__)
+
+GAME_ENDPOINTS = ("game_boxscore", "game_linescore", "game_playByPlay")
+
+# Statuses whose payloads will not change any more. Detailed statuses may carry
+# a reason ("Final: Tied", "Completed Early: Rain"), so these are prefixes.
+FINAL_STATUSES = ("Final", "Game Over", "Completed Early")
+
+
+def season_game_pks(
+    season: int, game_types: t.Optional[t.Container[str]] = None
+) -> list[int]:
+    games = schedule(start_date=f"{season}-01-01", end_date=f"{season}-12-31").data
+    pks = {
+        g.game_id
+        for g in games
+        if g.status.startswith(FINAL_STATUSES)
+        and (game_types is None or g.game_type in game_types)
+    }
+    return sorted(pks)
+
+
+class CheckpointLedger:
+    # Append-only JSON lines file of finished (gamePk, endpoint) units. A unit is
+    # only recorded after its output is on disk, so a crash can at worst repeat
+    # the units that were in flight; a torn last line is ignored on load.
+
+    def __init__(self, path: t.Union[str, Path]):
+        self.path = Path(path)
+        self._done: set[tuple[int, str]] = set()
+        self._lock = threading.Lock()
+        if self.path.exists():
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self._done.add((entry["gamePk"], entry["endpoint"]))
+        self._file = open(self.path, "a")
+
+    def __contains__(self, unit: tuple[int, str]) -> bool:
+        return unit in self._done
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def mark(self, game_pk: int, endpoint: str) -> None:
+        with self._lock:
+            self._file.write(
+                json.dumps({"gamePk": game_pk, "endpoint": endpoint, "ts": time.time()})
+                + "\n"
+            )
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._done.add((game_pk, endpoint))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class Progress:
+    # Throughput over the whole run and ETA for the units still pending.
+
+    def __init__(self, total: int, skipped: int = 0):
+        self.total = total
+        self.skipped = skipped
+        self.done = 0
+        self.failed = 0
+        self.started = time.monotonic()
+
+    @property
+    def remaining(self) -> int:
+        return self.total - self.skipped - self.done - self.failed
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self.started
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> t.Optional[float]:
+        return self.remaining / self.rate if self.rate else None
+
+    def format(self) -> str:
+        eta = self.eta
+        eta_text = (
+            "--:--:--" if eta is None else time.strftime("%H:%M:%S", time.gmtime(eta))
+        )
+        finished = self.skipped + self.done
+        return (
+            f"{finished}/{self.total} units ({self.skipped} from checkpoint), "
+            f"{self.failed} failed, {self.rate:.1f} units/s, ETA {eta_text}"
+        )
+
+
+class Backfill:
+    # Fetches GAME_ENDPOINTS for every game into
+    #     {directory}/{gamePk}/{endpoint}.json.gz
+    # and records each finished unit in {directory}/checkpoint.jsonl. Rerunning
+    # with the same directory skips everything already in the ledger; failed
+    # units are not recorded and are retried on the next run.
+
+    def __init__(
+        self,
+        directory: t.Union[str, Path],
+        service: t.Optional[GetterService] = None,
+        endpoints: t.Sequence[str] = GAME_ENDPOINTS,
+        max_workers: int = 8,
+        report_every: float = 5.0,
+        report: t.Callable[[str], None] = logger.info,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.service = service or GetterService()
+        self.endpoints = tuple(endpoints)
+        self.max_workers = max_workers
+        self.report_every = report_every
+        self.report = report
+        self.ledger = CheckpointLedger(self.directory / "checkpoint.jsonl")
+
+    def games(
+        self,
+        seasons: t.Iterable[int],
+        game_types: t.Optional[t.Container[str]] = None,
+    ) -> list[int]:
+        # The enumerated game list is saved with the ledger so a resumed run works
+        # on exactly the same units without re-querying the schedule.
+        manifest = self.directory / "games.json"
+        seasons = list(seasons)
+        types = None if game_types is None else sorted(game_types)
+        if manifest.exists():
+            saved = json.loads(manifest.read_text())
+            if saved["seasons"] == seasons and saved.get("gameTypes") == types:
+                return saved["gamePks"]
+            raise ValueError(
+                f"{self.directory} holds a backfill for seasons {saved['seasons']}, "
+                f"game types {saved.get('gameTypes')}"
+            )
+
+        game_pks = []
+        for season in seasons:
+            pks = season_game_pks(season, game_types)
+            self.report(f"season {season}: {len(pks)} games")
+            game_pks += pks
+        write_atomic(
+            manifest,
+            json.dumps(
+                {"seasons": seasons, "gameTypes": types, "gamePks": game_pks}
+            ).encode(),
+        )
+        return game_pks
+
+    def output_path(self, game_pk: int, endpoint: str) -> Path:
+        return self.directory / str(game_pk) / f"{endpoint}.json.gz"
+
+    def _fetch(self, game_pk: int, endpoint: str) -> None:
+        content = self.service._get_raw(endpoint, {"gamePk": game_pk}).content
+        path = self.output_path(game_pk, endpoint)
+        path.parent.mkdir(exist_ok=True)
+        write_atomic(path, gzip.compress(content, mtime=0))
+        self.ledger.mark(game_pk, endpoint)
+
+    def run(self, game_pks: t.Iterable[int]) -> Progress:
+        units = [(pk, e) for pk in game_pks for e in self.endpoints]
+        pending = [u for u in units if u not in self.ledger]
+        progress = Progress(len(units), skipped=len(units) - len(pending))
+        self.report(progress.format())
+
+        last_report = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(propagate(self._fetch), *u): u for u in pending}
+            for future in as_completed(futures):
+                error = future.exception()
+                if error is None:
+                    progress.done += 1
+                else:
+                    progress.failed += 1
+                    logger.warning(
+                        "%s for %s failed: %s", *futures[future][::-1], error
+                    )
+                if time.monotonic() - last_report >= self.report_every:
+                    last_report = time.monotonic()
+                    self.report(progress.format())
+
+        self.report(progress.format())
+        return progress
+
+    def close(self) -> None:
+        self.ledger.close()
+
+    def __enter__(self) -> "Backfill":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
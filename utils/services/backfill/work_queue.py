@@ -0,0 +1,311 @@
+# utils/services/backfill/work_queue.py
+
+import gzip
+import logging
+import socket
+import sqlite3
+import threading
+import time
+import typing as t
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from utils.files import write_atomic
+from utils.services.backfill.backfill import GAME_ENDPOINTS, season_game_pks
+from utils.services.getters.getter_service import GetterService
+from utils.services.metrics.tracing import propagate
+
+logger = logging.getLogger(__name__)
+
+
+class Lease(t.NamedTuple):
+    game_pk: int
+    endpoint: str
+    token: str
+
+
+class WorkQueue(t.Protocol):
+    # Anything that can hand out (gamePk, endpoint) units under an expiring lease.
+    # SqliteWorkQueue is the local stand-in; a broker-backed queue only needs
+    # these methods to drop in.
+
+    def enqueue(
+        self, game_pks: t.Iterable[int], endpoints: t.Sequence[str], shards: int
+    ) -> int: ...
+
+    def lease(
+        self,
+        worker: str,
+        limit: int,
+        lease_seconds: float,
+        shards: t.Optional[t.Collection[int]] = None,
+    ) -> list[Lease]: ...
+
+    def ack(self, lease: Lease) -> bool: ...
+
+    def fail(self, lease: Lease, error: str) -> None: ...
+
+    def counts(self) -> dict[str, int]: ...
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS units (
+    game_pk INTEGER NOT NULL,
+    endpoint TEXT NOT NULL,
+    shard INTEGER NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    token TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    PRIMARY KEY (game_pk, endpoint)
+);
+CREATE INDEX IF NOT EXISTS units_ready ON units (state, shard, lease_expires);
+"""
+
+
+class SqliteWorkQueue:
+    # Units move pending -> leased -> done. A leased unit whose lease has expired
+    # (its worker crashed or stalled) is leased again by the next caller, and its
+    # old token no longer acks. Units that fail max_attempts times become failed.
+    # WAL mode lets many worker processes on one host share the file; spread
+    # across machines, put a broker behind the WorkQueue protocol instead of
+    # sharing the file over a network filesystem.
+
+    def __init__(
+        self,
+        path: t.Union[str, Path],
+        max_attempts: int = 5,
+        clock: t.Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self.clock = clock
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        with self._connect() as db:
+            db.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            # Each connection is used by one thread only; check_same_thread is
+            # off so that close() can close them all from any thread.
+            db = sqlite3.connect(
+                self.path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+            with self._connections_lock:
+                self._connections.append(db)
+        return db
+
+    def enqueue(
+        self,
+        game_pks: t.Iterable[int],
+        endpoints: t.Sequence[str] = GAME_ENDPOINTS,
+        shards: int = 1,
+    ) -> int:
+        rows = [(pk, e, pk % shards) for pk in game_pks for e in endpoints]
+        db = self._connect()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            before = db.total_changes
+            db.executemany(
+                "INSERT OR IGNORE INTO units (game_pk, endpoint, shard) VALUES (?, ?, ?)",
+                rows,
+            )
+            added = db.total_changes - before
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return added
+
+    def lease(
+        self,
+        worker: str,
+        limit: int = 16,
+        lease_seconds: float = 300.0,
+        shards: t.Optional[t.Collection[int]] = None,
+    ) -> list[Lease]:
+        now = self.clock()
+        query = (
+            "SELECT game_pk, endpoint FROM units WHERE "
+            "(state = 'pending' OR (state = 'leased' AND lease_expires < ?))"
+        )
+        args: list[t.Any] = [now]
+        if shards is not None:
+            query += f" AND shard IN ({','.join('?' * len(shards))})"
+            args += list(shards)
+        query += " ORDER BY game_pk LIMIT ?"
+        args.append(limit)
+
+        db = self._connect()
+        # BEGIN IMMEDIATE takes the write lock up front, so two workers cannot
+        # select the same rows.
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            # A unit whose worker died on its last allowed attempt would
+            # otherwise be leased again forever (a poison unit crashing every
+            # worker that takes it), so it fails here instead.
+            db.execute(
+                "UPDATE units SET state = 'failed', lease_expires = NULL, "
+                "last_error = 'lease expired' "
+                "WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, self.max_attempts),
+            )
+            rows = db.execute(query, args).fetchall()
+            leases = [Lease(pk, e, uuid.uuid4().hex) for pk, e in rows]
+            db.executemany(
+                "UPDATE units SET state = 'leased', worker = ?, token = ?, "
+                "lease_expires = ?, attempts = attempts + 1 "
+                "WHERE game_pk = ? AND endpoint = ?",
+                [
+                    (worker, l.token, now + lease_seconds, l.game_pk, l.endpoint)
+                    for l in leases
+                ],
+            )
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return leases
+
+    def ack(self, lease: Lease) -> bool:
+        # False when the lease expired and the unit was handed to someone else.
+        cursor = self._connect().execute(
+            "UPDATE units SET state = 'done', lease_expires = NULL, last_error = NULL "
+            "WHERE game_pk = ? AND endpoint = ? AND token = ? AND state = 'leased'",
+            (lease.game_pk, lease.endpoint, lease.token),
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, lease: Lease, error: str) -> None:
+        self._connect().execute(
+            "UPDATE units SET "
+            "state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "lease_expires = NULL, last_error = ? "
+            "WHERE game_pk = ? AND endpoint = ? AND token = ? AND state = 'leased'",
+            (self.max_attempts, error, lease.game_pk, lease.endpoint, lease.token),
+        )
+
+    def retry_failed(self) -> int:
+        cursor = self._connect().execute(
+            "UPDATE units SET state = 'pending', attempts = 0 WHERE state = 'failed'"
+        )
+        return cursor.rowcount
+
+    def counts(self) -> dict[str, int]:
+        counts = {"pending": 0, "leased": 0, "done": 0, "failed": 0}
+        for state, n in self._connect().execute(
+            "SELECT state, COUNT(*) FROM units GROUP BY state"
+        ):
+            counts[state] = n
+        return counts
+
+    def close(self) -> None:
+        # Closes the connections opened by every thread, not just this one.
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for db in connections:
+            db.close()
+        self._local = threading.local()
+
+
+def coordinate(
+    queue: WorkQueue,
+    seasons: t.Iterable[int],
+    endpoints: t.Sequence[str] = GAME_ENDPOINTS,
+    shards: int = 1,
+    game_types: t.Optional[t.Container[str]] = None,
+) -> int:
+    # Enqueueing is idempotent, so the coordinator can be rerun to pick up
+    # games that became final since the last run.
+    added = 0
+    for season in seasons:
+        game_pks = season_game_pks(season, game_types)
+        n = queue.enqueue(game_pks, endpoints, shards)
+        logger.info("season %s: %d games, %d new units", season, len(game_pks), n)
+        added += n
+    return added
+
+
+class Worker:
+    # Leases batches of units, fetches them through GetterService into the same
+    # {directory}/{gamePk}/{endpoint}.json.gz layout as Backfill, and acks each
+    # one once its file is written. Leases are not renewed, so lease_seconds
+    # must cover a whole batch.
+
+    def __init__(
+        self,
+        queue: WorkQueue,
+        directory: t.Union[str, Path],
+        service: t.Optional[GetterService] = None,
+        worker_id: t.Optional[str] = None,
+        shards: t.Optional[t.Collection[int]] = None,
+        max_workers: int = 8,
+        batch_size: t.Optional[int] = None,
+        lease_seconds: float = 300.0,
+        idle_sleep: float = 5.0,
+    ):
+        self.queue = queue
+        self.directory = Path(directory)
+        self.service = service or GetterService()
+        self.worker_id = worker_id or f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+        self.shards = shards
+        self.max_workers = max_workers
+        self.batch_size = batch_size or max_workers * 4
+        self.lease_seconds = lease_seconds
+        self.idle_sleep = idle_sleep
+        self.done = 0
+        self.failed = 0
+        self._counts_lock = threading.Lock()  # _process runs on pool threads
+
+    def _process(self, lease: Lease) -> None:
+        try:
+            content = self.service._get_raw(
+                lease.endpoint, {"gamePk": lease.game_pk}
+            ).content
+            path = self.directory / str(lease.game_pk) / f"{lease.endpoint}.json.gz"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(path, gzip.compress(content, mtime=0))
+        except Exception as e:
+            with self._counts_lock:
+                self.failed += 1
+            logger.warning("%s for %s failed: %s", lease.endpoint, lease.game_pk, e)
+            self.queue.fail(lease, str(e))
+            return
+        if self.queue.ack(lease):
+            with self._counts_lock:
+                self.done += 1
+        else:
+            logger.warning(
+                "lease for %s %s expired before ack", lease.endpoint, lease.game_pk
+            )
+
+    def run(self, drain: bool = True) -> None:
+        # drain=True returns once nothing is leasable and nothing is leased by
+        # others; otherwise the worker keeps polling for new units.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while True:
+                leases = self.queue.lease(
+                    self.worker_id, self.batch_size, self.lease_seconds, self.shards
+                )
+                if not leases:
+                    if drain and self.queue.counts()["leased"] == 0:
+                        return
+                    time.sleep(self.idle_sleep)
+                    continue
+                list(pool.map(propagate(self._process), leases))
+                logger.info(
+                    "%s: %d done, %d failed, queue %s",
+                    self.worker_id,
+                    self.done,
+                    self.failed,
+                    self.queue.counts(),
+                )
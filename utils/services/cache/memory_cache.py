@@ -0,0 +1,63 @@
+# utils/services/cache/memory_cache.py
+
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+
+class CacheEntry(t.NamedTuple):
+    value: t.Any
+    stored_at: float  # time.time() when the value was fetched
+
+    def age(self, now: t.Optional[float] = None) -> float:
+        return (time.time() if now is None else now) - self.stored_at
+
+
+class ResponseCache(t.Protocol):
+    def get(self, key: str) -> t.Optional[CacheEntry]: ...
+
+    def set(
+        self, key: str, value: t.Any, stored_at: t.Optional[float] = None
+    ) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryCache:
+    # Thread-safe LRU keyed by request URL. Entries never expire on their own;
+    # callers decide from CacheEntry.age() whether a value is fresh or stale, so
+    # an old value stays available to serve during an outage.
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> t.Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: t.Any, stored_at: t.Optional[float] = None) -> None:
+        entry = CacheEntry(value, time.time() if stored_at is None else stored_at)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,143 @@
+# utils/services/cache/sqlite_cache.py
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import typing as t
+from pathlib import Path
+
+from utils.services.cache.memory_cache import CacheEntry
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+"""
+
+
+class SqliteCache:
+    # A ResponseCache shared by every process on the host that opens the same
+    # file, so pre-forked web workers see each other's fetches instead of each
+    # holding and refilling its own copy. WAL mode lets readers proceed while
+    # one process writes, and the file is memory-mapped so hot reads come from
+    # the shared page cache.
+    #
+    # Values are pickled; the file must only be writable by trusted processes.
+    # Eviction is approximately LRU: reads refresh an entry's access time at
+    # most once per touch_interval seconds so hits stay read-only, and the
+    # oldest entries beyond max_entries are trimmed every trim_every writes.
+    # Connections are opened per thread and per process, so a cache created
+    # before fork() is safe to use in the children.
+
+    def __init__(
+        self,
+        path: t.Union[str, Path],
+        max_entries: int = 10_000,
+        touch_interval: float = 60.0,
+        trim_every: int = 100,
+        mmap_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.touch_interval = touch_interval
+        self.trim_every = trim_every
+        self.mmap_bytes = mmap_bytes
+        self._local = threading.local()
+        # (pid, connection) for every connection opened, so close() reaches
+        # the ones opened by other threads.
+        self._connections: list[tuple[int, sqlite3.Connection]] = []
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None or self._local.pid != os.getpid():
+            # A connection inherited across fork() must not be used; the
+            # child opens its own.
+            db = sqlite3.connect(
+                self.path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(f"PRAGMA mmap_size={int(self.mmap_bytes)}")
+            self._local.db = db
+            self._local.pid = os.getpid()
+            with self._lock:
+                self._connections.append((os.getpid(), db))
+        return db
+
+    def get(self, key: str) -> t.Optional[CacheEntry]:
+        db = self._connect()
+        row = db.execute(
+            "SELECT value, stored_at, accessed_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, stored_at, accessed_at = row
+        try:
+            entry = CacheEntry(pickle.loads(value), stored_at)
+        except Exception as e:
+            # Written by an incompatible version of the code; treat as a miss.
+            logger.warning("Dropping unreadable cache entry %s: %s", key, e)
+            self.delete(key)
+            return None
+
+        now = time.time()
+        if now - accessed_at > self.touch_interval:
+            db.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        return entry
+
+    def set(self, key: str, value: t.Any, stored_at: t.Optional[float] = None) -> None:
+        now = time.time()
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        db = self._connect()
+        db.execute(
+            "INSERT OR REPLACE INTO entries (key, value, stored_at, accessed_at) "
+            "VALUES (?, ?, ?, ?)",
+            (key, blob, now if stored_at is None else stored_at, now),
+        )
+        with self._lock:
+            self._writes += 1
+            trim = self._writes % self.trim_every == 0
+        if trim:
+            self.trim()
+
+    def trim(self) -> int:
+        # Deletes the least recently used entries beyond max_entries.
+        db = self._connect()
+        before = db.total_changes
+        db.execute(
+            "DELETE FROM entries WHERE key IN (SELECT key FROM entries "
+            "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        return db.total_changes - before
+
+    def delete(self, key: str) -> None:
+        self._connect().execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM entries")
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self) -> None:
+        # Closes this process's connections from every thread. Ones inherited
+        # across fork() belong to the parent and are only forgotten.
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for pid, db in connections:
+            if pid == os.getpid():
+                db.close()
+        self._local = threading.local()
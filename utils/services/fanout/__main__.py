@@ -0,0 +1,50 @@
+# utils/services/fanout/__main__.py
+#
+#     python -m utils.services.fanout --port 8090
+#     curl -N 'http://127.0.0.1:8090/events?topics=scoreboard,game:745123'
+
+import argparse
+import logging
+import threading
+import typing as t
+
+from config import with_base_url
+from utils.services.fanout.pollers import FanoutHub
+from utils.services.fanout.server import FanoutServer
+from utils.services.getters.getter_service import GetterService
+
+
+def main(argv: t.Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Live game update fan-out server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--upstream", default=None, help="base URL, e.g. a proxy")
+    parser.add_argument("--scoreboard-interval", type=float, default=10.0)
+    parser.add_argument("--game-interval", type=float, default=5.0)
+    parser.add_argument("--max-queue", type=int, default=256)
+    parser.add_argument("--date", default=None, help="slate date (YYYY-MM-DD)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    endpoints = with_base_url(args.upstream) if args.upstream else None
+    service = GetterService(endpoints=endpoints)
+
+    with FanoutServer(args.host, args.port, args.max_queue) as server:
+        hub = FanoutHub(
+            service,
+            server.broker,
+            args.scoreboard_interval,
+            args.game_interval,
+            args.date,
+        ).start()
+        logging.info("Serving on %s", server.base_url)
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            hub.stop()
+
+
+if __name__ == "__main__":
+    main()
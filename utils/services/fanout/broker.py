@@ -0,0 +1,162 @@
+# utils/services/fanout/broker.py
+
+import asyncio
+import itertools
+import json
+import logging
+import threading
+import typing as t
+
+logger = logging.getLogger(__name__)
+
+
+class Event(t.NamedTuple):
+    topic: str
+    seq: int
+    kind: str
+    payload: bytes  # JSON, encoded once and shared by every subscriber
+
+    def sse(self) -> bytes:
+        return (
+            f"id: {self.seq}\nevent: {self.kind}\ndata: ".encode()
+            + self.payload
+            + b"\n\n"
+        )
+
+
+class Subscription:
+    # A bounded queue of events for one client. When the client falls behind by
+    # max_queue events it is dropped: the queue is emptied and closed, and the
+    # client must reconnect (and receives each topic's latest state again).
+
+    def __init__(self, topics: t.Iterable[str], max_queue: int):
+        self.topics = frozenset(topics)
+        self.queue: asyncio.Queue[t.Optional[Event]] = asyncio.Queue(max_queue)
+        self.dropped = False
+        self.closed = False
+        # Called when the subscription is dropped, e.g. to abort the client's
+        # connection, which may be stuck waiting on a full socket buffer.
+        self.on_drop: t.Optional[t.Callable[[], None]] = None
+
+    def _offer(self, event: Event) -> bool:
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self.dropped = True
+            self._close()
+            if self.on_drop is not None:
+                self.on_drop()
+            return False
+
+    def _close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Event:
+        event = await self.queue.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+
+class Broker:
+    # In-process topic fan-out owned by one event loop. publish() may be called
+    # from any thread (pollers run on threads); delivery always happens on the
+    # loop, one put_nowait per subscriber, so a slow client never blocks the
+    # publisher or other clients.
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_queue: int = 256):
+        self.loop = loop
+        self.max_queue = max_queue
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._latest: dict[str, Event] = {}
+        self._seq = itertools.count(1)
+        self._seq_lock = threading.Lock()
+        self.dropped = 0
+        # Hooks run on the loop: a topic gained a subscriber, a topic lost its
+        # last one, and whether a topic may be subscribed to at all.
+        self.on_subscribe: t.Optional[t.Callable[[str], None]] = None
+        self.on_idle: t.Optional[t.Callable[[str], None]] = None
+        self.topic_filter: t.Optional[t.Callable[[str], bool]] = None
+
+    def accepts(self, topic: str) -> bool:
+        return self.topic_filter is None or self.topic_filter(topic)
+
+    def subscriber_count(self, topic: t.Optional[str] = None) -> int:
+        if topic is not None:
+            return len(self._subscribers.get(topic, ()))
+        return len({s for subs in self._subscribers.values() for s in subs})
+
+    def subscribe(self, topics: t.Iterable[str]) -> Subscription:
+        # Must run on the loop. New subscribers start from each topic's latest
+        # event so they do not wait for the next change.
+        subscription = Subscription(topics, self.max_queue)
+        for topic in subscription.topics:
+            self._subscribers.setdefault(topic, set()).add(subscription)
+            latest = self._latest.get(topic)
+            if latest is not None:
+                subscription._offer(latest)
+            if self.on_subscribe is not None:
+                self.on_subscribe(topic)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        for topic in subscription.topics:
+            subs = self._subscribers.get(topic)
+            if subs is not None:
+                subs.discard(subscription)
+                if not subs:
+                    del self._subscribers[topic]
+                    if self.on_idle is not None:
+                        self.on_idle(topic)
+        subscription._close()
+
+    def _event(self, topic: str, kind: str, data: t.Any) -> Event:
+        with self._seq_lock:
+            seq = next(self._seq)
+        payload = json.dumps(
+            {"topic": topic, "seq": seq, "kind": kind, "data": data},
+            separators=(",", ":"),
+        ).encode()
+        return Event(topic, seq, kind, payload)
+
+    def publish(
+        self, topic: str, kind: str, data: t.Any, state: t.Optional[t.Any] = None
+    ) -> Event:
+        # `state` is the topic's full state after this event. It is kept as a
+        # "state" event for new subscribers, so publishers can send compact
+        # deltas to everyone already listening.
+        event = self._event(topic, kind, data)
+        latest = self._event(topic, "state", state) if state is not None else None
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            self._deliver(event, latest)
+        else:
+            self.loop.call_soon_threadsafe(self._deliver, event, latest)
+        return event
+
+    def _deliver(self, event: Event, latest: t.Optional[Event]) -> None:
+        if latest is not None:
+            self._latest[event.topic] = latest
+        for subscription in list(self._subscribers.get(event.topic, ())):
+            if not subscription._offer(event):
+                self.dropped += 1
+                logger.info("Dropped slow subscriber on %s", event.topic)
+                self.unsubscribe(subscription)
+
+    def close(self) -> None:
+        for subs in list(self._subscribers.values()):
+            for subscription in list(subs):
+                self.unsubscribe(subscription)
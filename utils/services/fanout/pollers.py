@@ -0,0 +1,206 @@
+# utils/services/fanout/pollers.py
+
+import logging
+import threading
+import typing as t
+
+from schemas.responses import LazyGameFeed
+from utils.services.fanout.broker import Broker
+from utils.services.getters.getter_service import GetterService
+from utils.services.scoreboard.scoreboard import ScoreboardBuilder
+
+logger = logging.getLogger(__name__)
+
+SCOREBOARD_TOPIC = "scoreboard"
+
+
+def game_topic(game_pk: int) -> str:
+    return f"game:{game_pk}"
+
+
+def game_state(feed: LazyGameFeed) -> dict[str, t.Any]:
+    # The compact per-game state pushed to clients; updates carry only the keys
+    # that changed since the previous poll.
+    status = feed.raw.get("gameData", {}).get("status", {})
+    linescore = feed.linescore
+    play = feed.current_play
+    offense = feed.raw.get("liveData", {}).get("linescore", {}).get("offense", {})
+    return {
+        "gamePk": feed.game_pk,
+        "state": status.get("abstractGameState"),
+        "detailedState": status.get("detailedState"),
+        "inning": linescore.currentInning,
+        "inningState": linescore.inningState,
+        "outs": linescore.outs,
+        "balls": linescore.balls,
+        "strikes": linescore.strikes,
+        "away": linescore.teams.away.runs,
+        "home": linescore.teams.home.runs,
+        "runners": [base in offense for base in ("first", "second", "third")],
+        "atBatIndex": play.about.atBatIndex if play else None,
+        "batter": play.matchup.batter.fullName if play else None,
+        "pitcher": play.matchup.pitcher.fullName if play else None,
+        "lastPlay": play.result.description if play else None,
+    }
+
+
+class GamePoller:
+    # Polls one game's live feed on an interval and publishes "update" events
+    # with the changed fields of game_state(). There is one poller per game no
+    # matter how many clients subscribe to it. It stops on its own once the
+    # game is final.
+
+    def __init__(
+        self,
+        service: GetterService,
+        broker: Broker,
+        game_pk: int,
+        interval: float = 5.0,
+    ):
+        self.service = service
+        self.broker = broker
+        self.game_pk = game_pk
+        self.interval = interval
+        self.state: t.Optional[dict[str, t.Any]] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"poll-{game_pk}", daemon=True
+        )
+
+    def start(self) -> "GamePoller":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    def poll(self) -> t.Optional[dict[str, t.Any]]:
+        # Returns the changes published, or None when nothing changed.
+        data = self.service._get("game", {"gamePk": self.game_pk})["data"]
+        state = game_state(LazyGameFeed(data))
+        if state == self.state:
+            return None
+        if self.state is None:
+            changes = state
+        else:
+            changes = {k: v for k, v in state.items() if self.state.get(k) != v}
+        self.state = state
+        self.broker.publish(game_topic(self.game_pk), "update", changes, state=state)
+        return changes
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning("Polling game %s failed: %s", self.game_pk, e)
+            if self.state and self.state["state"] == "Final":
+                return
+            self._stop.wait(self.interval)
+
+
+class FanoutHub:
+    # Drives the pollers. A scoreboard loop publishes scoreboard diffs on the
+    # "scoreboard" topic. A game is polled only while it is on the current
+    # slate and has at least one subscriber, so upstream load is bounded by
+    # the slate size however many clients connect. Game topics not on the
+    # slate are refused once the slate is known; a client subscribing before
+    # the first scoreboard load gets its poller when that load arrives.
+
+    def __init__(
+        self,
+        service: GetterService,
+        broker: Broker,
+        scoreboard_interval: float = 10.0,
+        game_interval: float = 5.0,
+        day: t.Optional[str] = None,
+    ):
+        self.service = service
+        self.broker = broker
+        self.scoreboard = ScoreboardBuilder(service, day=day)
+        self.scoreboard_interval = scoreboard_interval
+        self.game_interval = game_interval
+        self.pollers: dict[int, GamePoller] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: t.Optional[threading.Thread] = None
+        broker.on_subscribe = self._on_subscribe
+        broker.on_idle = self._on_idle
+        broker.topic_filter = self._accepts
+
+    def on_slate(self, game_pk: int) -> t.Optional[bool]:
+        # None until the first scoreboard has loaded.
+        current = self.scoreboard.current
+        return None if current is None else game_pk in current.games
+
+    def ensure_poller(self, game_pk: int) -> GamePoller:
+        with self._lock:
+            poller = self.pollers.get(game_pk)
+            finished = poller is not None and poller.state
+            finished = finished and poller.state["state"] == "Final"
+            if poller is None or not (poller.running or finished):
+                poller = GamePoller(
+                    self.service, self.broker, game_pk, self.game_interval
+                ).start()
+                self.pollers[game_pk] = poller
+            return poller
+
+    def stop_poller(self, game_pk: int) -> None:
+        with self._lock:
+            poller = self.pollers.pop(game_pk, None)
+        if poller is not None:
+            poller.stop()
+
+    def _accepts(self, topic: str) -> bool:
+        if not topic.startswith("game:"):
+            return True
+        return self.on_slate(int(topic.split(":", 1)[1])) is not False
+
+    def _on_subscribe(self, topic: str) -> None:
+        if topic.startswith("game:"):
+            game_pk = int(topic.split(":", 1)[1])
+            if self.on_slate(game_pk):
+                self.ensure_poller(game_pk)
+
+    def _on_idle(self, topic: str) -> None:
+        if topic.startswith("game:"):
+            self.stop_poller(int(topic.split(":", 1)[1]))
+
+    def _on_scoreboard(self, scoreboard, changes) -> None:
+        self.broker.publish(
+            SCOREBOARD_TOPIC,
+            "update",
+            {
+                "added": [g._asdict() for g in changes.added],
+                "removed": list(changes.removed),
+                "changed": {str(pk): dict(f) for pk, f in changes.changed.items()},
+            },
+            state=[g._asdict() for g in scoreboard.games.values()],
+        )
+        for game_pk in scoreboard.games:
+            if self.broker.subscriber_count(game_topic(game_pk)):
+                self.ensure_poller(game_pk)
+        with self._lock:
+            gone = [pk for pk in self.pollers if pk not in scoreboard.games]
+        for game_pk in gone:
+            self.stop_poller(game_pk)
+
+    def start(self) -> "FanoutHub":
+        self._thread = threading.Thread(
+            target=self.scoreboard.run,
+            args=(self._on_scoreboard, self.scoreboard_interval, self._stop),
+            name="scoreboard",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        with self._lock:
+            for poller in self.pollers.values():
+                poller.stop()
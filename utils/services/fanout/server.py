@@ -0,0 +1,289 @@
+# utils/services/fanout/server.py
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import re
+import struct
+import threading
+import typing as t
+from urllib.parse import parse_qs, urlsplit
+
+from utils.services.fanout.broker import Broker, Event, Subscription
+from utils.services.fanout.pollers import SCOREBOARD_TOPIC
+
+logger = logging.getLogger(__name__)
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+TOPIC_RE = re.compile(rf"^(?:{SCOREBOARD_TOPIC}|game:\d+)$")
+
+
+def ws_frame(opcode: int, payload: bytes) -> bytes:
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+
+async def _read_ws_frame(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", await reader.readexactly(8))
+    mask = await reader.readexactly(4) if second & 0x80 else b""
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return first & 0x0F, payload
+
+
+class FanoutServer:
+    # Serves broker topics to many clients from one event loop thread:
+    #
+    #   GET /events?topics=scoreboard,game:745123   Server-Sent Events
+    #   GET /ws?topics=game:745123                  WebSocket, one JSON text
+    #                                               frame per event
+    #   GET /stats                                  subscriber counts
+    #
+    # Each client is fed from its own bounded Subscription. A client that
+    # stops reading fills its socket buffer, then its queue, and is dropped by
+    # the broker without affecting anyone else: its connection is aborted, as
+    # is any connection whose writes stall for write_timeout seconds.
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_queue: int = 256,
+        heartbeat: float = 15.0,
+        write_timeout: float = 30.0,
+    ):
+        self.host = host
+        self.port = port
+        self.max_queue = max_queue
+        self.heartbeat = heartbeat
+        self.write_timeout = write_timeout
+        self.loop = asyncio.new_event_loop()
+        self.broker = Broker(self.loop, max_queue)
+        self._server: t.Optional[asyncio.base_events.Server] = None
+        self._thread: t.Optional[threading.Thread] = None
+        self._started = threading.Event()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    # Lifecycle: the loop runs on a background thread so pollers and callers
+    # stay synchronous.
+
+    def start(self) -> "FanoutServer":
+        self._thread = threading.Thread(
+            target=self._run, name="fanout-server", daemon=True
+        )
+        self._thread.start()
+        self._started.wait()
+        return self
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self._server = self.loop.run_until_complete(
+            asyncio.start_server(self._handle, self.host, self.port)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started.set()
+        self.loop.run_forever()
+
+    def stop(self) -> None:
+        async def shutdown():
+            self.broker.close()
+            self._server.close()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+
+    def __enter__(self) -> "FanoutServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # HTTP
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            headers: dict[str, str] = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1")
+                if line in ("\r\n", "\n", ""):
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            if len(request_line) < 2 or request_line[0] != "GET":
+                return await self._respond(writer, 405, {"message": "GET only"})
+
+            url = urlsplit(request_line[1])
+            query = parse_qs(url.query)
+            if url.path == "/stats":
+                return await self._respond(
+                    writer,
+                    200,
+                    {
+                        "subscribers": self.broker.subscriber_count(),
+                        "dropped": self.broker.dropped,
+                    },
+                )
+
+            topics = [
+                topic
+                for value in query.get("topics", [SCOREBOARD_TOPIC])
+                for topic in value.split(",")
+                if topic
+            ]
+            if not topics or not all(TOPIC_RE.match(topic) for topic in topics):
+                return await self._respond(writer, 400, {"message": "Bad topics"})
+            unknown = [topic for topic in topics if not self.broker.accepts(topic)]
+            if unknown:
+                return await self._respond(
+                    writer, 404, {"message": f"Unknown topics: {','.join(unknown)}"}
+                )
+
+            if url.path == "/events":
+                await self._serve_sse(reader, writer, topics)
+            elif (
+                url.path == "/ws" and headers.get("upgrade", "").lower() == "websocket"
+            ):
+                await self._serve_ws(reader, writer, headers, topics)
+            else:
+                await self._respond(writer, 404, {"message": "Not found"})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(
+        self, writer: asyncio.StreamWriter, status: int, body: dict[str, t.Any]
+    ) -> None:
+        payload = json.dumps(body).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n"
+            "Connection: close\r\n\r\n".encode() + payload
+        )
+        await writer.drain()
+
+    async def _pump(
+        self,
+        subscription: Subscription,
+        writer: asyncio.StreamWriter,
+        encode: t.Callable[[Event], bytes],
+        heartbeat: bytes,
+    ) -> None:
+        iterator = aiter(subscription)
+        while True:
+            try:
+                event = await asyncio.wait_for(anext(iterator), self.heartbeat)
+            except asyncio.TimeoutError:
+                writer.write(heartbeat)
+            except StopAsyncIteration:
+                return
+            else:
+                writer.write(encode(event))
+            try:
+                await asyncio.wait_for(writer.drain(), self.write_timeout)
+            except asyncio.TimeoutError:
+                logger.info("Aborting stalled client")
+                writer.transport.abort()
+                return
+
+    async def _serve_sse(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        topics: list[str],
+    ) -> None:
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+            b"Cache-Control: no-cache\r\nConnection: keep-alive\r\n\r\n"
+        )
+        await writer.drain()
+        subscription = self.broker.subscribe(topics)
+        subscription.on_drop = writer.transport.abort
+
+        async def read_client():
+            # SSE clients send nothing more; EOF means they disconnected, so
+            # the subscription (and an idle topic's poller) ends right away.
+            try:
+                while await reader.read(4096):
+                    pass
+            except ConnectionError:
+                pass
+
+        client = asyncio.ensure_future(read_client())
+        client.add_done_callback(lambda _: self.broker.unsubscribe(subscription))
+        try:
+            await self._pump(subscription, writer, Event.sse, b": ping\n\n")
+        finally:
+            client.cancel()
+            self.broker.unsubscribe(subscription)
+
+    async def _serve_ws(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        headers: dict[str, str],
+        topics: list[str],
+    ) -> None:
+        key = headers.get("sec-websocket-key")
+        if not key:
+            return await self._respond(
+                writer, 400, {"message": "Missing Sec-WebSocket-Key"}
+            )
+        accept = base64.b64encode(
+            hashlib.sha1((key + WS_GUID).encode()).digest()
+        ).decode()
+        writer.write(
+            "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+            f"Connection: Upgrade\r\nSec-WebSocket-Accept: {accept}\r\n\r\n".encode()
+        )
+        await writer.drain()
+
+        subscription = self.broker.subscribe(topics)
+        subscription.on_drop = writer.transport.abort
+
+        async def read_client():
+            # Clients only send control frames; a close ends the subscription.
+            try:
+                while True:
+                    opcode, payload = await _read_ws_frame(reader)
+                    if opcode == 0x8:
+                        writer.write(ws_frame(0x8, payload[:2]))
+                        break
+                    if opcode == 0x9:
+                        writer.write(ws_frame(0xA, payload))
+            except (ConnectionError, asyncio.IncompleteReadError):
+                pass
+
+        client = asyncio.ensure_future(read_client())
+        client.add_done_callback(lambda _: self.broker.unsubscribe(subscription))
+        try:
+            await self._pump(
+                subscription,
+                writer,
+                lambda event: ws_frame(0x1, event.payload),
+                ws_frame(0x9, b""),
+            )
+        finally:
+            client.cancel()
+            self.broker.unsubscribe(subscription)
@@ -0,0 +1,39 @@
+# utils/services/getters/async_getter_service.py
+
+import asyncio
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.services.getters.getter_service import GetterService
+from utils.services.metrics.tracing import propagate
+
+
+class AsyncGetterService:
+    # Awaitable front for GetterService. Requests run on a dedicated thread pool so
+    # the event loop never blocks and concurrency is not capped by the default
+    # executor.
+
+    def __init__(self, service: t.Optional[GetterService] = None, max_workers=32):
+        self.service = service or GetterService()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="async-getter"
+        )
+
+    async def _get(
+        self, endpoint: str, params: dict, *, request_kwargs: dict[str, t.Any] = None
+    ) -> dict:
+        loop = asyncio.get_running_loop()
+        call = propagate(self.service._get)
+        return await loop.run_in_executor(
+            self._executor,
+            lambda: call(endpoint, params, request_kwargs=request_kwargs),
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncGetterService":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.close()
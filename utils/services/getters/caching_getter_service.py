@@ -0,0 +1,141 @@
+# utils/services/getters/caching_getter_service.py
+
+import logging
+import threading
+import time
+import typing as t
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from utils.services.cache.memory_cache import MemoryCache, ResponseCache
+from utils.services.getters.circuit_breaker import CircuitBreaker, CircuitOpenError
+from utils.services.getters.getter_service import GetterService
+from utils.services.metrics.tracing import propagate, span_attributes
+
+logger = logging.getLogger(__name__)
+
+
+def _is_upstream_failure(error: BaseException) -> bool:
+    # 4xx other than 429 means upstream answered; it should not trip the breaker.
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status >= 500 or status == 429
+    return isinstance(error, requests.RequestException)
+
+
+class CachingGetterService:
+    # Stale-while-revalidate front for GetterService with a circuit breaker per
+    # endpoint.
+    #
+    #   age < fresh_ttl          cached value, no upstream call
+    #   fresh_ttl <= age         cached value now, refreshed in the background
+    #   no cached value          upstream call; raises CircuitOpenError while the
+    #                            endpoint's breaker is open
+    #
+    # A failed refresh or an open breaker keeps serving the old value however old
+    # it gets. Results carry "stale" and "age" next to "data" so callers can show
+    # how current they are.
+
+    def __init__(
+        self,
+        service: t.Optional[GetterService] = None,
+        cache: t.Optional[ResponseCache] = None,
+        fresh_ttl: float = 10.0,
+        endpoint_ttls: t.Optional[dict[str, float]] = None,
+        breaker_factory: t.Callable[[], CircuitBreaker] = CircuitBreaker,
+        max_workers: int = 4,
+    ):
+        self.service = service or GetterService()
+        self.cache = cache if cache is not None else MemoryCache()
+        self.fresh_ttl = fresh_ttl
+        self.endpoint_ttls = endpoint_ttls or {}
+        self.breakers: dict[str, CircuitBreaker] = defaultdict(breaker_factory)
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cache-revalidate"
+        )
+
+    def _fetch(
+        self, endpoint: str, params: dict, key: str, request_kwargs: dict[str, t.Any]
+    ) -> dict:
+        breaker = self.breakers[endpoint]
+        try:
+            result = self.service._get(endpoint, params, request_kwargs=request_kwargs)
+        except Exception as e:
+            if _is_upstream_failure(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        breaker.record_success()
+        self.cache.set(key, result)
+        return result
+
+    def _revalidate(
+        self, endpoint: str, params: dict, key: str, request_kwargs: dict[str, t.Any]
+    ) -> None:
+        with self.service.tracer.start_as_current_span(
+            "cache.revalidate", attributes=span_attributes(endpoint, params)
+        ):
+            try:
+                self._fetch(endpoint, params, key, request_kwargs)
+            except Exception as e:
+                logger.warning("Background refresh of %s failed: %s", key, e)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+    def _schedule_revalidate(
+        self, endpoint: str, params: dict, key: str, request_kwargs: dict[str, t.Any]
+    ) -> bool:
+        # One refresh per key at a time, and none while the breaker is open.
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            if not self.breakers[endpoint].allow():
+                return False
+            self._refreshing.add(key)
+        self._executor.submit(
+            propagate(self._revalidate), endpoint, params, key, request_kwargs
+        )
+        return True
+
+    def _get(
+        self, endpoint: str, params: dict, *, request_kwargs: dict[str, t.Any] = None
+    ) -> dict:
+        if request_kwargs is None:
+            request_kwargs = {}
+
+        tracer = self.service.tracer
+        with tracer.start_as_current_span(
+            "cache.lookup", attributes=span_attributes(endpoint, params)
+        ) as span:
+            key = self.service._build_url(endpoint, params)
+            entry = self.cache.get(key)
+
+            if entry is not None:
+                age = entry.age()
+                stale = age >= self.endpoint_ttls.get(endpoint, self.fresh_ttl)
+                span.set_attribute("cache.hit", True)
+                span.set_attribute("cache.stale", stale)
+                span.set_attribute("cache.age_seconds", age)
+                if stale:
+                    revalidating = self._schedule_revalidate(
+                        endpoint, params, key, request_kwargs
+                    )
+                    span.set_attribute("cache.revalidating", revalidating)
+                return {**entry.value, "stale": stale, "age": age}
+
+            span.set_attribute("cache.hit", False)
+            breaker = self.breakers[endpoint]
+            if not breaker.allow():
+                span.set_attribute("circuit.state", breaker.state)
+                raise CircuitOpenError(f"Circuit open for {endpoint}; nothing cached")
+            result = self._fetch(endpoint, params, key, request_kwargs)
+            return {**result, "stale": False, "age": 0.0}
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
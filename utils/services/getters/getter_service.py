@@ -1,22 +1,50 @@
+import json
 import logging
+import time
 import typing as t
 import requests
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from config import ENDPOINTS, EndpointConfig
 from schemas.responses import GenericResponse
-
+from utils.services.getters.json_stream import ITEM_PATHS, iter_items
+from utils.services.getters.transports import (
+    RequestsTransport,
+    StreamingResponse,
+    Transport,
+    TransportResponse,
+)
+from utils.services.metrics.endpoint_metrics import METRICS, EndpointMetrics
+from utils.services.metrics.tracing import Tracer, get_tracer, span_attributes
 
 logger = logging.getLogger(__name__)
 
 
 class GetterService:
-    def __init__(self, endpoints=None):
+    def __init__(
+        self,
+        endpoints=None,
+        metrics: t.Optional[EndpointMetrics] = None,
+        tracer: t.Optional[Tracer] = None,
+        transport: t.Optional[Transport] = None,
+    ):
         if endpoints is None:
             endpoints = ENDPOINTS
+        if metrics is None:
+            metrics = METRICS
+        if transport is None:
+            transport = RequestsTransport()
 
         self.endpoints = endpoints
+        self.metrics = metrics
+        self._tracer = tracer
+        self.transport = transport
+
+    @property
+    def tracer(self) -> Tracer:
+        # Resolved per call so set_tracer() applies to existing services.
+        return self._tracer if self._tracer is not None else get_tracer()
 
     def _endpoint_validator(self, endpoint: str) -> EndpointConfig:
         if endpoint not in self.endpoints:
@@ -28,14 +56,20 @@ class GetterService:
         except Exception as e:
             raise ValueError(f"Endpoint configuration error for '{endpoint}': {e}")
 
-    def _get(
-        self, endpoint: str, params: dict, *, request_kwargs: dict[str, t.Any] = None
-    ) -> dict:
-        if request_kwargs is None:
-            request_kwargs = {}
-
+    def _build_url(self, endpoint: str, params: dict) -> str:
         ep_config: EndpointConfig = self._endpoint_validator(endpoint)
 
+        # Fill in required path parameters with defaults (e.g. the API version)
+        # when omitted, as statsapi.get does. Optional ones stay out of the URL.
+        params = {
+            **{
+                key: spec.default
+                for key, spec in ep_config.path_params.items()
+                if spec.required and spec.default
+            },
+            **params,
+        }
+
         url = ep_config.url
         path_params = {}
         query_params = {}
@@ -82,16 +116,176 @@ class GetterService:
 
         logger.debug(f"Constructed URL: {url}")
 
+        return url
+
+    def _request(
+        self, endpoint: str, url: str, request_kwargs: dict[str, t.Any]
+    ) -> TransportResponse:
         # Make the HTTP request
-        response = requests.get(url, **request_kwargs)
-        if response.status_code not in (200, 201):
-            response.raise_for_status()
-        data = response.json()
+        with self.tracer.start_as_current_span("http.request") as http_span:
+            start = time.perf_counter()
+            try:
+                response = self.transport.get(url, **request_kwargs)
+            except requests.RequestException:
+                self.metrics.record_request(endpoint, "error")
+                raise
+            self.metrics.observe(
+                endpoint, "latency_seconds", time.perf_counter() - start
+            )
+            self.metrics.record_request(endpoint, response.status_code)
+            self.metrics.observe(endpoint, "response_bytes", len(response.content))
+            http_span.set_attribute("http.status_code", response.status_code)
 
-        # Validate response with a generic response model (replace with endpoint-specific models as needed)
-        try:
-            parsed_response = GenericResponse.model_validate(data)
-        except ValidationError as e:
-            raise ValueError(f"Response validation error: {e}")
+            if response.status_code not in (200, 201):
+                response.raise_for_status()
+
+        return response
+
+    def _get_raw(
+        self, endpoint: str, params: dict, *, request_kwargs: dict[str, t.Any] = None
+    ) -> TransportResponse:
+        # The undecoded response, for callers that parse the body elsewhere.
+        if request_kwargs is None:
+            request_kwargs = {}
+
+        with self.tracer.start_as_current_span(
+            "GetterService._get_raw", attributes=span_attributes(endpoint, params)
+        ) as span:
+            url = self._build_url(endpoint, params)
+            span.set_attribute("http.url", url)
+            return self._request(endpoint, url, request_kwargs)
+
+    def _get_stream(
+        self,
+        endpoint: str,
+        params: dict,
+        *,
+        chunk_size: int = 64 * 1024,
+        decode_content: bool = True,
+        request_kwargs: dict[str, t.Any] = None,
+    ) -> StreamingResponse:
+        # The body as chunks read from the socket, never buffered or decoded as
+        # JSON. With decode_content=False the chunks keep the upstream
+        # Content-Encoding for passthrough. Transports without stream() fall
+        # back to chunking a buffered body. Close the response (or exhaust it)
+        # to release the connection; response_bytes is recorded then.
+        if request_kwargs is None:
+            request_kwargs = {}
+
+        with self.tracer.start_as_current_span(
+            "GetterService._get_stream", attributes=span_attributes(endpoint, params)
+        ) as span:
+            url = self._build_url(endpoint, params)
+            span.set_attribute("http.url", url)
+            start = time.perf_counter()
+            try:
+                stream = getattr(self.transport, "stream", None)
+                if stream is not None:
+                    response = stream(
+                        url,
+                        chunk_size=chunk_size,
+                        decode_content=decode_content,
+                        **request_kwargs,
+                    )
+                else:
+                    response = StreamingResponse.from_buffered(
+                        self.transport.get(url, **request_kwargs), chunk_size
+                    )
+            except requests.RequestException:
+                self.metrics.record_request(endpoint, "error")
+                raise
+            # Latency here is time to response headers.
+            self.metrics.observe(
+                endpoint, "latency_seconds", time.perf_counter() - start
+            )
+            self.metrics.record_request(endpoint, response.status_code)
+            span.set_attribute("http.status_code", response.status_code)
+
+            if response.status_code not in (200, 201):
+                # Error bodies are small; buffer one so HTTPError.response
+                # matches _request().
+                with response:
+                    content = b"".join(bytes(c) for c in response.iter_chunks())
+                TransportResponse(
+                    url, response.status_code, content, response.headers
+                ).raise_for_status()
+
+        response.add_close_callback(
+            lambda: self.metrics.observe(
+                endpoint, "response_bytes", response.bytes_read
+            )
+        )
+        return response
+
+    def _get_items(
+        self,
+        endpoint: str,
+        params: dict,
+        path: t.Optional[t.Sequence[str]] = None,
+        model: t.Optional[type[BaseModel]] = None,
+        *,
+        chunk_size: int = 64 * 1024,
+        request_kwargs: dict[str, t.Any] = None,
+    ) -> t.Iterator[t.Any]:
+        # Streams the array at `path` (ITEM_PATHS by default) and yields its
+        # elements one at a time as they arrive, validated as `model` when
+        # given. Peak memory is about one element instead of the whole body.
+        # Nothing is requested until the first item is asked for; closing the
+        # generator early releases the connection.
+        if path is None:
+            if endpoint not in ITEM_PATHS:
+                raise ValueError(f"No item path known for endpoint: {endpoint}")
+            path = ITEM_PATHS[endpoint]
+
+        response = self._get_stream(
+            endpoint, params, chunk_size=chunk_size, request_kwargs=request_kwargs
+        )
+        validation_seconds = 0.0
+        with response:
+            for item in iter_items(response.iter_chunks(), path):
+                if model is not None:
+                    start = time.perf_counter()
+                    try:
+                        item = model.model_validate(item)
+                    except ValidationError as e:
+                        raise ValueError(f"Response validation error: {e}")
+                    finally:
+                        validation_seconds += time.perf_counter() - start
+                yield item
+        if model is not None:
+            self.metrics.observe(endpoint, "validation_seconds", validation_seconds)
+
+    def _get(
+        self, endpoint: str, params: dict, *, request_kwargs: dict[str, t.Any] = None
+    ) -> dict:
+        if request_kwargs is None:
+            request_kwargs = {}
+
+        tracer = self.tracer
+        with tracer.start_as_current_span(
+            "GetterService._get", attributes=span_attributes(endpoint, params)
+        ) as span:
+            url = self._build_url(endpoint, params)
+            span.set_attribute("http.url", url)
+            response = self._request(endpoint, url, request_kwargs)
+
+            with tracer.start_as_current_span("json.decode"):
+                start = time.perf_counter()
+                data = json.loads(response.content)
+                self.metrics.observe(
+                    endpoint, "decode_seconds", time.perf_counter() - start
+                )
+
+            # Validate response with a generic response model (replace with endpoint-specific models as needed)
+            with tracer.start_as_current_span("model.validate"):
+                start = time.perf_counter()
+                try:
+                    parsed_response = GenericResponse.model_validate({"data": data})
+                except ValidationError as e:
+                    raise ValueError(f"Response validation error: {e}")
+                finally:
+                    self.metrics.observe(
+                        endpoint, "validation_seconds", time.perf_counter() - start
+                    )
 
-        return parsed_response.model_dump()
+            return parsed_response.model_dump()
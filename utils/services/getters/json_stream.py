@@ -0,0 +1,128 @@
+# utils/services/getters/json_stream.py
+
+import codecs
+import json
+import typing as t
+
+from utils.services.getters.transports import Chunk
+
+# Where the repeated items sit in the large list endpoints. A "*" step walks
+# every element of an array, so season-wide schedules yield individual games.
+ITEM_PATHS: dict[str, tuple[str, ...]] = {
+    "sports_players": ("people",),
+    "people": ("people",),
+    "people_changes": ("people",),
+    "people_freeAgents": ("freeAgents",),
+    "transactions": ("transactions",),
+    "schedule": ("dates", "*", "games"),
+    "teams": ("teams",),
+}
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class _Scanner:
+    # A text cursor over a stream of byte chunks. Only the unread tail of the
+    # body is kept; consumed text is dropped whenever more is read.
+
+    def __init__(self, chunks: t.Iterable[Chunk]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.done = False
+
+    def _fill(self) -> bool:
+        while not self.done:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.done = True
+                decoded = self._utf8.decode(b"", final=True)
+            else:
+                decoded = self._utf8.decode(chunk)
+            if decoded:
+                self.text = self.text[self.pos :] + decoded
+                self.pos = 0
+                return True
+        return False
+
+    def peek(self) -> str:
+        # The next non-whitespace character, or "" at the end of the body.
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}, got {found!r}")
+        self.pos += 1
+
+    def value(self) -> t.Any:
+        # Decodes the next complete value. A value ending exactly at the end of
+        # the buffer may still be cut short (a number split across chunks), so
+        # it is only accepted once more text follows or the body has ended.
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+                if end < len(self.text) or self.done:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.done:
+                    raise
+            self._fill()
+
+
+def _walk(scanner: _Scanner, path: tuple[str, ...]) -> t.Iterator[t.Any]:
+    head = scanner.peek()
+    if not path or path[0] == "*":
+        if head != "[":
+            scanner.value()
+            return
+        scanner.expect("[")
+        if scanner.peek() == "]":
+            scanner.pos += 1
+            return
+        while True:
+            if path:
+                yield from _walk(scanner, path[1:])
+            else:
+                yield scanner.value()
+            if scanner.peek() == "]":
+                scanner.pos += 1
+                return
+            scanner.expect(",")
+
+    if head != "{":
+        scanner.value()
+        return
+    scanner.expect("{")
+    if scanner.peek() == "}":
+        scanner.pos += 1
+        return
+    while True:
+        key = scanner.value()
+        scanner.expect(":")
+        if key == path[0]:
+            yield from _walk(scanner, path[1:])
+        else:
+            scanner.value()
+        if scanner.peek() == "}":
+            scanner.pos += 1
+            return
+        scanner.expect(",")
+
+
+def iter_items(chunks: t.Iterable[Chunk], path: t.Sequence[str]) -> t.Iterator[t.Any]:
+    # Yields the elements of the array at `path` as soon as each one has
+    # arrived, holding roughly one element in memory rather than the body.
+    # Keys outside the path are decoded and discarded as they are passed.
+    scanner = _Scanner(chunks)
+    yield from _walk(scanner, tuple(path))
@@ -0,0 +1,65 @@
+# utils/services/getters/routing.py
+
+import re
+import typing as t
+
+from config import BASE_URL, ENDPOINTS, EndpointConfig
+
+
+class RouteNotFound(ValueError):
+    pass
+
+
+class Route:
+    def __init__(self, endpoint: str, config: EndpointConfig):
+        self.endpoint = endpoint
+        self.pattern, self.specificity = self._compile(config)
+
+    @staticmethod
+    def _compile(config: EndpointConfig) -> tuple[re.Pattern, int]:
+        template = "/api/" + config.url.removeprefix(BASE_URL)
+        regex = ""
+        literal = 0
+        for part in re.split(r"(\{[^}]+\})", template):
+            if not (part.startswith("{") and part.endswith("}")):
+                regex += re.escape(part)
+                literal += len(part)
+                continue
+
+            name = part[1:-1]
+            spec = config.path_params[name]
+            if spec.type == "bool":
+                options = [s for s in (spec.True_str, spec.False_str) if s]
+                group = f"(?P<{name}>{'|'.join(map(re.escape, options))})?"
+            else:
+                group = f"(?P<{name}>[^/]+)"
+                if spec.leading_slash:
+                    group = "/" + group
+                if spec.trailing_slash:
+                    group += "/"
+                if not spec.required:
+                    group = f"(?:{group})?"
+            regex += group
+        return re.compile(f"^{regex}$"), literal
+
+    def match(self, path: str) -> t.Optional[dict[str, str]]:
+        match = self.pattern.match(path)
+        if match is None:
+            return None
+        return {k: v for k, v in match.groupdict().items() if v is not None}
+
+
+class Router:
+    # Maps request paths back to ENDPOINTS keys and their path parameters.
+
+    def __init__(self, endpoints: t.Optional[dict[str, EndpointConfig]] = None):
+        routes = [Route(k, v) for k, v in (endpoints or ENDPOINTS).items()]
+        # Prefer the most literal template, so "meta" ({ver}/{type}) matches last.
+        self.routes = sorted(routes, key=lambda route: -route.specificity)
+
+    def resolve(self, path: str) -> tuple[str, dict[str, str]]:
+        for route in self.routes:
+            params = route.match(path)
+            if params is not None:
+                return route.endpoint, params
+        raise RouteNotFound(f"No route for {path}")
@@ -0,0 +1,237 @@
+# utils/services/getters/transports.py
+
+import hashlib
+import json
+import threading
+import typing as t
+import zipfile
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+
+class TransportResponse:
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        content: bytes,
+        headers: t.Optional[t.Mapping[str, str]] = None,
+    ):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+
+    def json(self) -> t.Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(
+                f"{self.status_code} Error for url: {self.url}", response=self
+            )
+
+
+Chunk = t.Union[bytes, memoryview]
+
+
+class StreamingResponse:
+    # A response whose body is read on demand in chunks instead of being held
+    # in memory. When the transport was asked not to decode the content, the
+    # chunks are the bytes as sent, still compressed per Content-Encoding, so
+    # they can be forwarded untouched.
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        headers: t.Optional[t.Mapping[str, str]],
+        chunks: t.Iterable[Chunk],
+        on_close: t.Optional[t.Callable[[], None]] = None,
+    ):
+        self.url = url
+        self.status_code = status_code
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.bytes_read = 0
+        self._chunks = chunks
+        self._on_close = [on_close] if on_close is not None else []
+        self.closed = False
+
+    @classmethod
+    def from_buffered(
+        cls, response: TransportResponse, chunk_size: int
+    ) -> "StreamingResponse":
+        # For transports without stream(); chunks are views over the body.
+        view = memoryview(response.content)
+        chunks = (view[i : i + chunk_size] for i in range(0, len(view), chunk_size))
+        return cls(response.url, response.status_code, response.headers, chunks)
+
+    def iter_chunks(self) -> t.Iterator[Chunk]:
+        try:
+            for chunk in self._chunks:
+                self.bytes_read += len(chunk)
+                yield chunk
+        finally:
+            self.close()
+
+    def read(self) -> bytes:
+        return b"".join(self.iter_chunks())
+
+    def add_close_callback(self, callback: t.Callable[[], None]) -> None:
+        self._on_close.append(callback)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        for callback in self._on_close:
+            callback()
+
+    def __enter__(self) -> "StreamingResponse":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class Transport(t.Protocol):
+    def get(self, url: str, **kwargs) -> TransportResponse: ...
+
+
+class RequestsTransport:
+    # Default transport; one pooled session keeps upstream connections alive.
+
+    def __init__(
+        self, session: t.Optional[requests.Session] = None, pool_maxsize: int = 10
+    ):
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=pool_maxsize, pool_maxsize=pool_maxsize
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+
+    def get(self, url: str, **kwargs) -> TransportResponse:
+        response = self.session.get(url, **kwargs)
+        return TransportResponse(
+            url, response.status_code, response.content, response.headers
+        )
+
+    def stream(
+        self,
+        url: str,
+        chunk_size: int = 64 * 1024,
+        decode_content: bool = True,
+        **kwargs,
+    ) -> StreamingResponse:
+        response = self.session.get(url, stream=True, **kwargs)
+        headers = requests.structures.CaseInsensitiveDict(response.headers)
+        if decode_content:
+            # The decoded chunks no longer match what these describe.
+            for name in ("Content-Encoding", "Content-Length"):
+                headers.pop(name, None)
+        return StreamingResponse(
+            url,
+            response.status_code,
+            headers,
+            response.raw.stream(chunk_size, decode_content=decode_content),
+            response.close,
+        )
+
+
+class ReplayMissError(requests.RequestException):
+    pass
+
+
+def request_key(url: str) -> str:
+    # Query parameter order does not change the response, so it is normalized.
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(("", "", parts.path, query, ""))
+
+
+class RecordingTransport:
+    # Passes requests through to another transport and writes every exchange to a
+    # zip archive; repeated requests for one URL are kept in order.
+
+    def __init__(self, path: t.Union[str, Path], inner: t.Optional[Transport] = None):
+        self.path = Path(path)
+        self.inner = inner or RequestsTransport()
+        self._zip = zipfile.ZipFile(self.path, "w", zipfile.ZIP_DEFLATED)
+        self._index: dict[str, list[dict[str, t.Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs) -> TransportResponse:
+        response = self.inner.get(url, **kwargs)
+        key = request_key(url)
+
+        with self._lock:
+            entries = self._index.setdefault(key, [])
+            member = f"bodies/{hashlib.sha1(key.encode()).hexdigest()}-{len(entries)}"
+            self._zip.writestr(member, response.content)
+            entries.append(
+                {
+                    "status": response.status_code,
+                    "headers": {
+                        k: v
+                        for k, v in response.headers.items()
+                        if k.lower() in ("content-type", "etag", "last-modified")
+                    },
+                    "member": member,
+                }
+            )
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            if self._zip.fp is None:
+                return
+            self._zip.writestr("index.json", json.dumps(self._index))
+            self._zip.close()
+
+    def __enter__(self) -> "RecordingTransport":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ReplayTransport:
+    # Serves recorded exchanges with no network access. Bodies are read from the
+    # archive on demand, and the last recording for a URL repeats once exhausted.
+
+    def __init__(self, path: t.Union[str, Path]):
+        self.path = Path(path)
+        self._zip = zipfile.ZipFile(self.path, "r")
+        self._index: dict[str, list[dict[str, t.Any]]] = json.loads(
+            self._zip.read("index.json")
+        )
+        self._cursor: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, url: str) -> bool:
+        return request_key(url) in self._index
+
+    def get(self, url: str, **kwargs) -> TransportResponse:
+        key = request_key(url)
+        entries = self._index.get(key)
+        if not entries:
+            raise ReplayMissError(f"No recorded response for {url}")
+
+        with self._lock:
+            i = self._cursor.get(key, 0)
+            self._cursor[key] = min(i + 1, len(entries) - 1)
+            content = self._zip.read(entries[i]["member"])
+        entry = entries[i]
+        return TransportResponse(url, entry["status"], content, entry["headers"])
+
+    def rewind(self) -> None:
+        with self._lock:
+            self._cursor.clear()
+
+    def close(self) -> None:
+        self._zip.close()
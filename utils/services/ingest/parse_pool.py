@@ -0,0 +1,166 @@
+# utils/services/ingest/parse_pool.py
+
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import typing as t
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+from schemas.responses import GenericResponse
+from schemas.responses.objects.boxscore_response import GameBoxscoreResponse
+from utils.services.getters.getter_service import GetterService
+from utils.services.stats.pitch_table import PitchTable, parse_pitches
+
+logger = logging.getLogger(__name__)
+
+# Parsers run in worker processes, so they must be importable top-level functions
+# taking the raw body first. Their results are pickled back to the parent, so
+# compact ones (models, NumPy arrays) keep the transfer cheap.
+
+
+def parse_generic(raw: bytes) -> dict[str, t.Any]:
+    return GenericResponse.model_validate({"data": json.loads(raw)}).model_dump()
+
+
+def parse_boxscore(raw: bytes) -> GameBoxscoreResponse:
+    return GameBoxscoreResponse.model_validate(json.loads(raw))
+
+
+def parse_play_by_play(raw: bytes, game_pk: int) -> PitchTable:
+    return parse_pitches(json.loads(raw), game_pk=game_pk)
+
+
+def _mp_context():
+    # Workers are started while fetch threads are running, so avoid plain fork.
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+
+
+class ParsePool:
+    # A process pool with a bounded number of in-flight jobs: submit() blocks once
+    # max_pending bodies are queued, pushing back on whoever feeds it.
+
+    def __init__(
+        self, max_workers: t.Optional[int] = None, max_pending: t.Optional[int] = None
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.max_workers * 2
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=_mp_context()
+        )
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+
+    def submit(self, parser: t.Callable[..., t.Any], raw: bytes, *args) -> Future:
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(parser, raw, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def __enter__(self) -> "ParsePool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class IngestRequest(t.NamedTuple):
+    endpoint: str
+    params: dict[str, t.Any]
+    parser: t.Callable[..., t.Any] = parse_generic
+    parser_args: tuple = ()
+
+
+class IngestResult(t.NamedTuple):
+    request: IngestRequest
+    result: t.Any = None
+    error: t.Optional[BaseException] = None
+
+
+def ingest(
+    service: GetterService,
+    requests: t.Iterable[IngestRequest],
+    pool: ParsePool,
+    fetch_workers: int = 8,
+) -> t.Iterator[IngestResult]:
+    # Network stage: fetch_workers threads download raw bodies. Parse stage: the
+    # process pool decodes and converts them. At most fetch_workers requests are
+    # downloading and pool.max_pending are parsing; when parsing falls behind the
+    # fetch threads block on pool.submit and stop pulling new requests. Results
+    # waiting for the consumer hold their slot, so a slow consumer stalls the
+    # feed instead of letting results pile up.
+    results: queue.Queue[t.Optional[IngestResult]] = queue.Queue()
+    window = threading.BoundedSemaphore(fetch_workers + pool.max_pending)
+
+    def finish(request: IngestRequest, future: Future) -> None:
+        error = future.exception()
+        results.put(IngestResult(request, None if error else future.result(), error))
+
+    def fetch(request: IngestRequest) -> None:
+        try:
+            raw = service._get_raw(request.endpoint, request.params).content
+            future = pool.submit(request.parser, raw, *request.parser_args)
+        except Exception as e:
+            results.put(IngestResult(request, None, e))
+            return
+        future.add_done_callback(lambda f: finish(request, f))
+
+    submitted = [0]
+    feed_errors: list[BaseException] = []
+    stop = threading.Event()
+
+    def feed() -> None:
+        try:
+            with ThreadPoolExecutor(
+                max_workers=fetch_workers, thread_name_prefix="ingest-fetch"
+            ) as fetchers:
+                for request in requests:
+                    window.acquire()
+                    if stop.is_set():
+                        break
+                    submitted[0] += 1
+                    fetchers.submit(fetch, request)
+        except BaseException as e:
+            # Re-raised in the consumer once the submitted requests finish.
+            feed_errors.append(e)
+        finally:
+            results.put(None)  # all requests handed to the fetch threads
+
+    feeder = threading.Thread(target=feed, name="ingest-feed", daemon=True)
+    feeder.start()
+
+    done = 0
+    fed = False
+    try:
+        while not fed or done < submitted[0]:
+            item = results.get()
+            if item is None:
+                fed = True
+                continue
+            done += 1
+            # The slot is freed only once the consumer takes the result, so
+            # unconsumed results count against the window too.
+            window.release()
+            yield item
+    finally:
+        # If the consumer stopped early, wake a feeder blocked on a full window
+        # so it sees the stop and exits instead of waiting forever.
+        stop.set()
+        try:
+            window.release()
+        except ValueError:
+            pass  # the window was not full, so the feeder is not blocked on it
+    feeder.join()
+    if feed_errors:
+        raise feed_errors[0]
@@ -0,0 +1,94 @@
+# utils/services/loadtest/__main__.py
+#
+#     python -m utils.services.loadtest --simulate --concurrency 1,4,16,64 \
+#         --duration 10 --mix game=70,schedule=20,team_roster=10
+#     python -m utils.services.loadtest --target http://127.0.0.1:8080/api/
+#     python -m utils.services.loadtest --archive day.zip --mode async
+
+import argparse
+import json
+import typing as t
+from contextlib import ExitStack
+
+from config import with_base_url
+from utils.services.getters.getter_service import GetterService
+from utils.services.getters.transports import RequestsTransport, ReplayTransport
+from utils.services.loadtest.harness import (
+    DEFAULT_MIX,
+    HEADER,
+    RequestPlan,
+    discover_game_pks,
+    format_row,
+    parse_mix,
+    sweep,
+)
+from utils.services.metrics.endpoint_metrics import EndpointMetrics
+
+
+def main(argv: t.Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="GetterService load-test harness")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--target", help="base URL of a stub server or proxy")
+    target.add_argument("--archive", help="recorded transport archive to replay")
+    target.add_argument(
+        "--simulate",
+        action="store_true",
+        help="start the local simulator in-process (its CPU is counted too)",
+    )
+    parser.add_argument("--mode", choices=("sync", "async", "both"), default="sync")
+    parser.add_argument("--concurrency", default="1,2,4,8,16,32")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds/step")
+    parser.add_argument(
+        "--mix", default=",".join(f"{k}={v:g}" for k, v in DEFAULT_MIX.items())
+    )
+    parser.add_argument("--date", default=None, help="schedule date (YYYY-MM-DD)")
+    parser.add_argument("--game-pks", default=None, help="comma-separated gamePks")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default=None, help="write results to this file")
+    args = parser.parse_args(argv)
+
+    levels = [int(c) for c in args.concurrency.split(",")]
+
+    with ExitStack() as stack:
+        if args.archive:
+            transport = ReplayTransport(args.archive)
+            stack.callback(transport.close)
+            endpoints = None
+        else:
+            base_url = args.target
+            if args.simulate:
+                from utils.services.simulator.server import SimulatorServer
+
+                base_url = stack.enter_context(SimulatorServer()).base_url
+            transport = RequestsTransport(pool_maxsize=max(levels))
+            endpoints = with_base_url(base_url)
+
+        service = GetterService(
+            endpoints=endpoints, metrics=EndpointMetrics(), transport=transport
+        )
+        game_pks = (
+            [int(pk) for pk in args.game_pks.split(",")]
+            if args.game_pks
+            else discover_game_pks(service, args.date)
+        )
+        plan = RequestPlan(parse_mix(args.mix), game_pks, args.date, args.seed)
+
+        print(HEADER)
+        results = []
+        for mode in ("sync", "async") if args.mode == "both" else (args.mode,):
+            results += sweep(
+                service,
+                plan,
+                levels,
+                args.duration,
+                mode,
+                on_step=lambda r: print(format_row(r), flush=True),
+            )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([r.model_dump() for r in results], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+# utils/services/loadtest/harness.py
+
+import asyncio
+import random
+import threading
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from utils.services.getters.async_getter_service import AsyncGetterService
+from utils.services.getters.getter_service import GetterService
+
+DEFAULT_MIX = {"game": 70.0, "schedule": 20.0, "team_roster": 10.0}
+
+TEAM_IDS = [108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121]
+TEAM_IDS += [133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146]
+TEAM_IDS += [147, 158]
+
+
+class StepResult(BaseModel):
+    mode: str = Field(..., description="sync or async")
+    concurrency: int = Field(..., description="Concurrent workers in the step")
+    requests: int = Field(0, description="Completed requests, including errors")
+    errors: int = Field(0, description="Completed requests that raised")
+    duration: float = Field(0.0, description="Wall-clock seconds")
+    rps: float = Field(0.0, description="Completed requests per second")
+    p50_ms: float = Field(0.0, description="Median latency")
+    p95_ms: float = Field(0.0, description="95th percentile latency")
+    p99_ms: float = Field(0.0, description="99th percentile latency")
+    cpu_ms_per_request: float = Field(
+        0.0, description="Process CPU time per completed request"
+    )
+    by_endpoint: dict[str, int] = Field(
+        default_factory=dict, description="Completed requests by endpoint"
+    )
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    # "game=70,schedule=20,team_roster=10"
+    mix = {}
+    for part in value.split(","):
+        endpoint, _, weight = part.partition("=")
+        mix[endpoint.strip()] = float(weight or 1)
+    return mix
+
+
+class RequestPlan:
+    # Picks the next endpoint from the mix and fills in plausible parameters.
+
+    def __init__(
+        self,
+        mix: dict[str, float],
+        game_pks: t.Sequence[int],
+        date: t.Optional[str] = None,
+        seed: int = 0,
+    ):
+        if not game_pks:
+            raise ValueError("A load test needs at least one gamePk")
+        self.endpoints = list(mix)
+        self.weights = [mix[e] for e in self.endpoints]
+        self.game_pks = list(game_pks)
+        self.date = date
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def next(self) -> tuple[str, dict[str, t.Any]]:
+        with self._lock:
+            endpoint = self._rng.choices(self.endpoints, self.weights)[0]
+            game_pk = self._rng.choice(self.game_pks)
+            team_id = self._rng.choice(TEAM_IDS)
+
+        params: dict[str, t.Any] = {}
+        if endpoint.startswith("game"):
+            params["gamePk"] = game_pk
+        elif endpoint.startswith("team"):
+            params["teamId"] = team_id
+        elif endpoint == "schedule":
+            params["sportId"] = 1
+            if self.date:
+                params["date"] = self.date
+        return endpoint, params
+
+
+def discover_game_pks(
+    service: GetterService, date: t.Optional[str] = None
+) -> list[int]:
+    params: dict[str, t.Any] = {"sportId": 1}
+    if date:
+        params["date"] = date
+    schedule = service._get("schedule", params)["data"]
+    return [g["gamePk"] for d in schedule.get("dates", []) for g in d["games"]]
+
+
+def _summarize(
+    mode: str,
+    concurrency: int,
+    latencies: list[float],
+    endpoints: list[str],
+    errors: int,
+    duration: float,
+    cpu: float,
+) -> StepResult:
+    result = StepResult(mode=mode, concurrency=concurrency, errors=errors)
+    result.requests = len(latencies)
+    result.duration = duration
+    if latencies:
+        p50, p95, p99 = np.percentile(np.array(latencies) * 1000, [50, 95, 99])
+        result.rps = len(latencies) / duration
+        result.p50_ms, result.p95_ms, result.p99_ms = float(p50), float(p95), float(p99)
+        result.cpu_ms_per_request = cpu * 1000 / len(latencies)
+        result.by_endpoint = {e: endpoints.count(e) for e in set(endpoints)}
+    return result
+
+
+def run_sync_step(
+    service: GetterService, plan: RequestPlan, concurrency: int, duration: float
+) -> StepResult:
+    latencies: list[float] = []
+    endpoints: list[str] = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker():
+        local_latencies, local_endpoints, local_errors = [], [], 0
+        while time.perf_counter() < deadline:
+            endpoint, params = plan.next()
+            start = time.perf_counter()
+            try:
+                service._get(endpoint, params)
+            except Exception:
+                # A failure still took a round trip; counting it keeps a failing
+                # upstream from turning the workers into a busy loop.
+                local_errors += 1
+            local_latencies.append(time.perf_counter() - start)
+            local_endpoints.append(endpoint)
+        with lock:
+            latencies.extend(local_latencies)
+            endpoints.extend(local_endpoints)
+            errors[0] += local_errors
+
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(worker)
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+    return _summarize("sync", concurrency, latencies, endpoints, errors[0], wall, cpu)
+
+
+async def _run_async_step(
+    service: AsyncGetterService, plan: RequestPlan, concurrency: int, duration: float
+) -> StepResult:
+    latencies: list[float] = []
+    endpoints: list[str] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            endpoint, params = plan.next()
+            start = time.perf_counter()
+            try:
+                await service._get(endpoint, params)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+            endpoints.append(endpoint)
+
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+    return _summarize("async", concurrency, latencies, endpoints, errors, wall, cpu)
+
+
+def run_async_step(
+    service: GetterService, plan: RequestPlan, concurrency: int, duration: float
+) -> StepResult:
+    async_service = AsyncGetterService(service, max_workers=concurrency)
+    try:
+        return asyncio.run(_run_async_step(async_service, plan, concurrency, duration))
+    finally:
+        async_service.close()
+
+
+def sweep(
+    service: GetterService,
+    plan: RequestPlan,
+    concurrency_levels: t.Iterable[int],
+    duration: float,
+    mode: str = "sync",
+    on_step: t.Optional[t.Callable[[StepResult], None]] = None,
+) -> list[StepResult]:
+    run_step = run_async_step if mode == "async" else run_sync_step
+    results = []
+    for concurrency in concurrency_levels:
+        result = run_step(service, plan, concurrency, duration)
+        results.append(result)
+        if on_step is not None:
+            on_step(result)
+    return results
+
+
+def format_row(result: StepResult) -> str:
+    return (
+        f"{result.mode:<6}{result.concurrency:>6}{result.requests:>9}"
+        f"{result.errors:>8}{result.rps:>10.1f}{result.p50_ms:>10.1f}"
+        f"{result.p95_ms:>10.1f}{result.p99_ms:>10.1f}"
+        f"{result.cpu_ms_per_request:>10.2f}"
+    )
+
+
+HEADER = (
+    f"{'mode':<6}{'conc':>6}{'reqs':>9}{'errors':>8}{'req/s':>10}"
+    f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'cpu ms':>10}"
+)
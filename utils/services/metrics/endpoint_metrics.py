@@ -0,0 +1,130 @@
+# utils/services/metrics/endpoint_metrics.py
+
+import bisect
+import threading
+import typing as t
+from collections import defaultdict
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PARSE_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+SIZE_BUCKETS = (1_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000)
+
+HISTOGRAMS: dict[str, tuple[tuple[float, ...], str]] = {
+    "latency_seconds": (LATENCY_BUCKETS, "Upstream request latency"),
+    "response_bytes": (SIZE_BUCKETS, "Response body size"),
+    "decode_seconds": (PARSE_BUCKETS, "JSON decode time"),
+    "validation_seconds": (PARSE_BUCKETS, "Pydantic validation time"),
+}
+
+
+class Histogram:
+    def __init__(self, buckets: t.Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        # Upper bound of the bucket holding the q-th observation.
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        running = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            running += count
+            if running >= target:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> dict[str, t.Any]:
+        return {
+            "buckets": dict(zip(self.buckets + (float("inf"),), self.counts)),
+            "count": self.count,
+            "sum": self.sum,
+        }
+
+
+class _EndpointStats:
+    def __init__(self):
+        self.requests = 0
+        self.status_codes: dict[str, int] = defaultdict(int)
+        self.histograms = {
+            name: Histogram(buckets) for name, (buckets, _) in HISTOGRAMS.items()
+        }
+
+
+class EndpointMetrics:
+    def __init__(self, prefix: str = "mlbstats"):
+        self.prefix = prefix
+        self._stats: dict[str, _EndpointStats] = defaultdict(_EndpointStats)
+        self._lock = threading.Lock()
+
+    def record_request(self, endpoint: str, status: t.Union[int, str]) -> None:
+        with self._lock:
+            stats = self._stats[endpoint]
+            stats.requests += 1
+            stats.status_codes[str(status)] += 1
+
+    def observe(self, endpoint: str, name: str, value: float) -> None:
+        if name not in HISTOGRAMS:
+            raise ValueError(f"Unknown histogram: {name}")
+        with self._lock:
+            self._stats[endpoint].histograms[name].observe(value)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def snapshot(self) -> dict[str, dict[str, t.Any]]:
+        with self._lock:
+            return {
+                endpoint: {
+                    "requests": stats.requests,
+                    "status_codes": dict(stats.status_codes),
+                    **{
+                        name: histogram.snapshot()
+                        for name, histogram in stats.histograms.items()
+                    },
+                }
+                for endpoint, stats in self._stats.items()
+            }
+
+    def to_prometheus(self) -> str:
+        lines: list[str] = []
+        snapshot = self.snapshot()
+
+        name = f"{self.prefix}_requests_total"
+        lines.append(f"# HELP {name} Upstream requests by endpoint and status")
+        lines.append(f"# TYPE {name} counter")
+        for endpoint, stats in snapshot.items():
+            for status, count in stats["status_codes"].items():
+                lines.append(
+                    f'{name}{{endpoint="{endpoint}",status="{status}"}} {count}'
+                )
+
+        for histogram, (_, help_text) in HISTOGRAMS.items():
+            name = f"{self.prefix}_{histogram}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for endpoint, stats in snapshot.items():
+                data = stats[histogram]
+                cumulative = 0
+                for bound, count in data["buckets"].items():
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(
+                        f'{name}_bucket{{endpoint="{endpoint}",le="{le}"}} '
+                        f"{cumulative}"
+                    )
+                lines.append(f'{name}_sum{{endpoint="{endpoint}"}} {data["sum"]}')
+                lines.append(f'{name}_count{{endpoint="{endpoint}"}} {data["count"]}')
+
+        return "\n".join(lines) + "\n"
+
+
+METRICS = EndpointMetrics()
@@ -0,0 +1,180 @@
+# utils/services/metrics/tracing.py
+
+import contextvars
+import itertools
+import threading
+import time
+import typing as t
+from contextlib import contextmanager
+
+AttributeValue = t.Union[str, bool, int, float]
+
+
+def span_attributes(
+    endpoint: t.Optional[str] = None, params: t.Optional[dict[str, t.Any]] = None
+) -> dict[str, AttributeValue]:
+    # Flattens call parameters into OpenTelemetry-safe primitive attributes.
+    attributes: dict[str, AttributeValue] = {}
+    if endpoint is not None:
+        attributes["mlbstats.endpoint"] = endpoint
+    for key, value in (params or {}).items():
+        if value is None or value == "":
+            continue
+        if not isinstance(value, (str, bool, int, float)):
+            value = str(value)
+        attributes[f"mlbstats.param.{key}"] = value
+    return attributes
+
+
+class Span(t.Protocol):
+    def set_attribute(self, key: str, value: AttributeValue) -> None: ...
+
+    def record_exception(self, exception: BaseException) -> None: ...
+
+
+class Tracer(t.Protocol):
+    def start_as_current_span(
+        self, name: str, attributes: t.Optional[dict[str, AttributeValue]] = None
+    ) -> t.ContextManager[Span]: ...
+
+
+class _NoOpSpan:
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+
+class NoOpTracer:
+    _span = _NoOpSpan()
+
+    @contextmanager
+    def start_as_current_span(
+        self, name: str, attributes: t.Optional[dict[str, AttributeValue]] = None
+    ) -> t.Iterator[Span]:
+        yield self._span
+
+
+class RecordedSpan:
+    def __init__(
+        self,
+        name: str,
+        trace_id: int,
+        span_id: int,
+        parent_id: t.Optional[int],
+        attributes: dict[str, AttributeValue],
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.attributes = dict(attributes)
+        self.exceptions: list[BaseException] = []
+        self.status = "ok"
+        self.start_time = time.perf_counter()
+        self.end_time: t.Optional[float] = None
+
+    @property
+    def duration(self) -> t.Optional[float]:
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.exceptions.append(exception)
+        self.status = "error"
+
+    def __repr__(self) -> str:
+        return f"RecordedSpan(name={self.name!r}, duration={self.duration})"
+
+
+_current_span: contextvars.ContextVar[t.Optional[RecordedSpan]] = (
+    contextvars.ContextVar("mlbstats_current_span", default=None)
+)
+
+
+class InMemoryTracer:
+    # Records finished spans with parent links; intended for tests and profiling.
+
+    def __init__(self):
+        self.spans: list[RecordedSpan] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def start_as_current_span(
+        self, name: str, attributes: t.Optional[dict[str, AttributeValue]] = None
+    ) -> t.Iterator[Span]:
+        parent = _current_span.get()
+        span_id = next(self._ids)
+        trace_id = parent.trace_id if parent is not None else span_id
+        span = RecordedSpan(
+            name,
+            trace_id,
+            span_id,
+            parent.span_id if parent is not None else None,
+            attributes or {},
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            span.end_time = time.perf_counter()
+            _current_span.reset(token)
+            with self._lock:
+                self.spans.append(span)
+
+    def children(self, span: RecordedSpan) -> list[RecordedSpan]:
+        return [s for s in self.spans if s.parent_id == span.span_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+class OpenTelemetryTracer:
+    def __init__(self, tracer=None):
+        if tracer is None:
+            try:
+                from opentelemetry import trace
+            except ImportError as e:
+                raise ImportError(
+                    "OpenTelemetryTracer requires the opentelemetry-api package"
+                ) from e
+            tracer = trace.get_tracer("mlbstats")
+        self._tracer = tracer
+
+    def start_as_current_span(
+        self, name: str, attributes: t.Optional[dict[str, AttributeValue]] = None
+    ) -> t.ContextManager[Span]:
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+
+_tracer: Tracer = NoOpTracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def set_tracer(tracer: t.Optional[Tracer]) -> None:
+    global _tracer
+    _tracer = tracer if tracer is not None else NoOpTracer()
+
+
+def propagate(fn: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
+    # Binds fn to the caller's context so spans opened in worker threads nest
+    # under the span that submitted them.
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        return context.copy().run(fn, *args, **kwargs)
+
+    return run
@@ -0,0 +1,173 @@
+# utils/services/players/player_directory.py
+
+import logging
+import threading
+import time
+import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from schemas.responses import PeopleResponse, Person
+from schemas.responses.objects.boxscore_response import BoxscoreResponse
+from utils.services.getters.getter_service import GetterService
+from utils.services.metrics.tracing import propagate
+
+logger = logging.getLogger(__name__)
+
+
+def _utc_iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def boxscore_person_ids(box: BoxscoreResponse) -> set[int]:
+    players = box.awayBatters + box.homeBatters + box.awayPitchers + box.homePitchers
+    # Totals rows are BoxscoreBatter/Pitcher entries with personId 0.
+    return {p.personId for p in players if p.personId}
+
+
+class PlayerDirectory:
+    # In-memory player records keyed by personId. Lookups for unknown ids are
+    # batched into `people?personIds=...` requests of up to batch_size ids, and a
+    # request already in flight for an id is shared rather than repeated. Every
+    # changes_interval seconds, `people/changes?updatedSince=` reports which
+    # players were edited upstream; those records are dropped and refetched on
+    # their next lookup.
+
+    def __init__(
+        self,
+        service: t.Optional[GetterService] = None,
+        batch_size: int = 100,
+        max_workers: int = 4,
+        hydrate: t.Optional[str] = None,
+        changes_interval: t.Optional[float] = 3600.0,
+        clock: t.Callable[[], float] = time.time,
+    ):
+        self.service = service or GetterService()
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.hydrate = hydrate
+        self.changes_interval = changes_interval
+        self.clock = clock
+
+        self._people: dict[int, Person] = {}
+        self._unknown: set[int] = set()  # ids upstream returned nothing for
+        self._pending: dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._updated_since = clock()
+        self._changes_checked = clock()
+
+    def __len__(self) -> int:
+        return len(self._people)
+
+    def __contains__(self, person_id: int) -> bool:
+        return person_id in self._people
+
+    def _fetch_batch(self, person_ids: list[int]) -> dict[int, Person]:
+        params: dict[str, t.Any] = {"personIds": ",".join(map(str, person_ids))}
+        if self.hydrate:
+            params["hydrate"] = self.hydrate
+        data = self.service._get("people", params)["data"]
+        return {p.id: p for p in PeopleResponse.model_validate(data).people}
+
+    def _load(self, batches: list[list[int]], futures: dict[int, Future]) -> None:
+        def load(batch: list[int]) -> None:
+            try:
+                found = self._fetch_batch(batch)
+            except Exception as e:
+                with self._lock:
+                    for person_id in batch:
+                        self._pending.pop(person_id, None)
+                for person_id in batch:
+                    futures[person_id].set_exception(e)
+                return
+
+            with self._lock:
+                self._people.update(found)
+                self._unknown.update(i for i in batch if i not in found)
+                for person_id in batch:
+                    self._pending.pop(person_id, None)
+            for person_id in batch:
+                futures[person_id].set_result(found.get(person_id))
+
+        if len(batches) == 1:
+            load(batches[0])
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            list(pool.map(propagate(load), batches))
+
+    def get_many(self, person_ids: t.Iterable[int]) -> dict[int, Person]:
+        self._maybe_sync_changes()
+
+        result: dict[int, Person] = {}
+        waiting: dict[int, Future] = {}
+        new: list[int] = []
+        with self._lock:
+            for person_id in set(person_ids):
+                if person_id in self._people:
+                    result[person_id] = self._people[person_id]
+                elif person_id in self._unknown:
+                    continue
+                elif person_id in self._pending:
+                    waiting[person_id] = self._pending[person_id]
+                else:
+                    new.append(person_id)
+            owned = {person_id: Future() for person_id in new}
+            self._pending.update(owned)
+
+        if new:
+            new.sort()
+            batches = [
+                new[i : i + self.batch_size]
+                for i in range(0, len(new), self.batch_size)
+            ]
+            self._load(batches, owned)
+            waiting.update(owned)
+
+        for person_id, future in waiting.items():
+            person = future.result()
+            if person is not None:
+                result[person_id] = person
+        return result
+
+    def get(self, person_id: int) -> t.Optional[Person]:
+        return self.get_many([person_id]).get(person_id)
+
+    def for_boxscore(self, box: BoxscoreResponse) -> dict[int, Person]:
+        return self.get_many(boxscore_person_ids(box))
+
+    def invalidate(self, person_ids: t.Iterable[int]) -> int:
+        dropped = 0
+        with self._lock:
+            for person_id in person_ids:
+                dropped += self._people.pop(person_id, None) is not None
+                self._unknown.discard(person_id)
+        return dropped
+
+    def _maybe_sync_changes(self) -> None:
+        if self.changes_interval is None:
+            return
+        with self._lock:
+            now = self.clock()
+            if now - self._changes_checked < self.changes_interval:
+                return
+            self._changes_checked = now  # one caller syncs, the rest carry on
+        try:
+            self.sync_changes()
+        except Exception as e:
+            # Serving slightly old records beats failing the lookup.
+            logger.warning("people_changes sync failed: %s", e)
+            self._changes_checked = self.clock()
+
+    def sync_changes(self) -> int:
+        # The new watermark is taken before the request, so edits made while it
+        # is in flight are picked up by the next sync.
+        started = self.clock()
+        data = self.service._get(
+            "people_changes", {"updatedSince": _utc_iso(self._updated_since)}
+        )["data"]
+        changed = [p["id"] for p in data.get("people", [])]
+        dropped = self.invalidate(changed)
+        self._updated_since = started
+        self._changes_checked = started
+        logger.debug("%d people changed upstream, %d cached", len(changed), dropped)
+        return dropped
@@ -0,0 +1,266 @@
+# utils/services/players/player_search.py
+
+import heapq
+import logging
+import threading
+import time
+import typing as t
+from collections import Counter, defaultdict
+from datetime import date
+
+from utils.services.getters.getter_service import GetterService
+from utils.services.players.player_directory import _utc_iso
+from utils.services.teams.team_index import normalize
+
+logger = logging.getLogger(__name__)
+
+PLAYER_FIELDS = (
+    "people,id,fullName,firstName,lastName,useName,nickName,boxscoreName,active"
+)
+
+NAME_FIELDS = ("fullName", "firstName", "lastName", "useName", "boxscoreName")
+
+# Given names that are used interchangeably. Every member of a group is indexed
+# as an alias of the others, so "mike" finds Michael and "michael" finds Mike.
+NICKNAME_GROUPS = [
+    ("alexander", "alex", "alejandro"),
+    ("andrew", "andy", "drew"),
+    ("anthony", "tony"),
+    ("benjamin", "ben"),
+    ("christopher", "chris"),
+    ("daniel", "dan", "danny"),
+    ("david", "dave"),
+    ("edward", "ed", "eddie", "ted"),
+    ("frederick", "fred", "freddie", "freddy"),
+    ("gregory", "greg"),
+    ("jacob", "jake"),
+    ("james", "jim", "jimmy", "jamie"),
+    ("jonathan", "jon", "jonny"),
+    ("joseph", "joe", "joey"),
+    ("joshua", "josh"),
+    ("kenneth", "ken", "kenny"),
+    ("matthew", "matt"),
+    ("michael", "mike", "mikey"),
+    ("nathaniel", "nathan", "nate"),
+    ("nicholas", "nick", "nicky"),
+    ("peter", "pete"),
+    ("richard", "rich", "rick", "ricky", "dick"),
+    ("robert", "rob", "bob", "bobby", "robbie"),
+    ("ronald", "ron", "ronnie"),
+    ("samuel", "sam", "sammy"),
+    ("stephen", "steven", "steve"),
+    ("thomas", "tom", "tommy"),
+    ("timothy", "tim", "timmy"),
+    ("vladimir", "vlad"),
+    ("william", "will", "bill", "billy", "willie"),
+    ("zachary", "zach", "zack"),
+]
+NICKNAMES: dict[str, set[str]] = defaultdict(set)
+for _group in NICKNAME_GROUPS:
+    for _name in _group:
+        NICKNAMES[_name].update(n for n in _group if n != _name)
+
+
+def trigrams(token: str, prefix: bool = False) -> set[str]:
+    # "$$" marks the start of a token and "$" its end; a prefix query leaves the
+    # end open so "jud" shares all of its grams with "judge".
+    padded = "$$" + token + ("" if prefix else "$")
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchHit(t.NamedTuple):
+    person_id: int
+    full_name: str
+    score: float
+
+
+class PlayerSearchIndex:
+    # Token-level trigram index over player names. A query token is compared with
+    # the name tokens that share at least one trigram with it: prefixes score
+    # 0.8-1.0, other tokens score their Dice similarity. A player's score is the
+    # sum over query tokens of the best match among the player's tokens, so
+    # "judg aaron" and "aaron judge" rank the same. Players can be added,
+    # replaced and removed one at a time.
+
+    def __init__(
+        self, people: t.Iterable[dict[str, t.Any]] = (), min_similarity: float = 0.3
+    ):
+        self.min_similarity = min_similarity
+        self.people: dict[int, dict[str, t.Any]] = {}
+        self._person_tokens: dict[int, set[str]] = {}
+        self._token_people: dict[str, set[int]] = defaultdict(set)
+        self._gram_tokens: dict[str, set[str]] = defaultdict(set)
+        self._lock = threading.RLock()
+        for person in people:
+            self.add(person)
+
+    def __len__(self) -> int:
+        return len(self.people)
+
+    def _tokens(self, person: dict[str, t.Any]) -> set[str]:
+        tokens: set[str] = set()
+        for field in NAME_FIELDS + ("nickName",):
+            tokens.update(normalize(person.get(field) or "").split())
+        for field in ("firstName", "useName"):
+            for token in normalize(person.get(field) or "").split():
+                tokens |= NICKNAMES.get(token, set())
+        return tokens
+
+    def add(self, person: dict[str, t.Any]) -> None:
+        with self._lock:
+            person_id = person["id"]
+            self.remove(person_id)
+            tokens = self._tokens(person)
+            self.people[person_id] = person
+            self._person_tokens[person_id] = tokens
+            for token in tokens:
+                if not self._token_people[token]:
+                    for gram in trigrams(token):
+                        self._gram_tokens[gram].add(token)
+                self._token_people[token].add(person_id)
+
+    def remove(self, person_id: int) -> None:
+        with self._lock:
+            self.people.pop(person_id, None)
+            for token in self._person_tokens.pop(person_id, ()):
+                holders = self._token_people[token]
+                holders.discard(person_id)
+                if holders:
+                    continue
+                del self._token_people[token]
+                for gram in trigrams(token):
+                    self._gram_tokens[gram].discard(token)
+                    if not self._gram_tokens[gram]:
+                        del self._gram_tokens[gram]
+
+    def _token_scores(self, query: str) -> dict[str, float]:
+        # Shared-gram counts come from Counter.update, which counts in C; only
+        # tokens that can reach min_similarity are scored individually.
+        prefix_grams = trigrams(query, prefix=True)
+        prefix_counts: t.Counter[str] = Counter()
+        for gram in prefix_grams:
+            prefix_counts.update(self._gram_tokens.get(gram, ()))
+        counts = prefix_counts.copy()
+        end_gram = ("$$" + query)[-2:] + "$"
+        counts.update(self._gram_tokens.get(end_gram, ()))
+
+        # A token of n characters has at most n + 1 grams.
+        size = len(prefix_grams) + 1
+        needed = self.min_similarity * size / 2
+        scores: dict[str, float] = {}
+        for token, shared in counts.items():
+            if prefix_counts[token] == len(prefix_grams) and token.startswith(query):
+                scores[token] = 0.8 + 0.2 * len(query) / len(token)
+            elif shared >= needed:
+                similarity = 2 * shared / (size + len(token) + 1)
+                if similarity >= self.min_similarity:
+                    scores[token] = similarity
+        return scores
+
+    def search(self, query: str, limit: int = 10) -> list[SearchHit]:
+        tokens = normalize(query).split()
+        if not tokens:
+            return []
+
+        with self._lock:
+            totals: dict[int, float] = defaultdict(float)
+            for token in tokens:
+                best: dict[int, float] = {}
+                for match, score in self._token_scores(token).items():
+                    for person_id in self._token_people[match]:
+                        if score > best.get(person_id, 0.0):
+                            best[person_id] = score
+                for person_id, score in best.items():
+                    totals[person_id] += score
+
+            # Active players win ties with retired ones of the same name.
+            ranked = heapq.nlargest(
+                limit,
+                totals.items(),
+                key=lambda item: (
+                    item[1],
+                    bool(self.people[item[0]].get("active")),
+                    -item[0],
+                ),
+            )
+            return [
+                SearchHit(
+                    person_id,
+                    self.people[person_id].get("fullName", ""),
+                    score / len(tokens),
+                )
+                for person_id, score in ranked
+            ]
+
+
+class PlayerSearch:
+    # A PlayerSearchIndex for one season, loaded from sports_players and kept
+    # current from people_changes every changes_interval seconds.
+
+    def __init__(
+        self,
+        service: t.Optional[GetterService] = None,
+        season: t.Optional[int] = None,
+        sport_id: int = 1,
+        changes_interval: t.Optional[float] = 3600.0,
+        clock: t.Callable[[], float] = time.time,
+    ):
+        self.service = service or GetterService()
+        self.season = int(season or date.today().year)
+        self.sport_id = sport_id
+        self.changes_interval = changes_interval
+        self.clock = clock
+        self.index: t.Optional[PlayerSearchIndex] = None
+        self._updated_since = clock()
+        self._changes_checked = clock()
+        self._lock = threading.Lock()
+
+    def load(self) -> PlayerSearchIndex:
+        started = self.clock()
+        # Streamed so the season's full player list is never held as one body.
+        people = self.service._get_items(
+            "sports_players",
+            {"sportId": self.sport_id, "season": self.season, "fields": PLAYER_FIELDS},
+        )
+        self.index = PlayerSearchIndex(people)
+        self._updated_since = self._changes_checked = started
+        return self.index
+
+    def sync_changes(self) -> int:
+        index = self.index if self.index is not None else self.load()
+        started = self.clock()
+        data = self.service._get(
+            "people_changes",
+            {"updatedSince": _utc_iso(self._updated_since), "fields": PLAYER_FIELDS},
+        )["data"]
+        # people_changes is league-wide and spans every season, so it only
+        # refreshes players already in this season's index; new players
+        # arrive with the next load().
+        changed = [
+            p
+            for p in data.get("people", [])
+            if p.get("fullName") and p.get("id") in index.people
+        ]
+        for person in changed:
+            index.add(person)
+        self._updated_since = self._changes_checked = started
+        return len(changed)
+
+    def _ensure_current(self) -> PlayerSearchIndex:
+        with self._lock:
+            if self.index is None:
+                return self.load()
+            if (
+                self.changes_interval is None
+                or self.clock() - self._changes_checked < self.changes_interval
+            ):
+                return self.index
+            try:
+                self.sync_changes()
+            except Exception as e:
+                logger.warning("people_changes sync failed: %s", e)
+                self._changes_checked = self.clock()
+            return self.index
+
+    def search(self, query: str, limit: int = 10) -> list[SearchHit]:
+        return self._ensure_current().search(query, limit)
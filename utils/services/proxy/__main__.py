@@ -0,0 +1,57 @@
+# utils/services/proxy/__main__.py
+#
+#     python -m utils.services.proxy --port 8080
+#
+# Services then point their GetterService at it:
+#
+#     GetterService(endpoints=with_base_url("http://127.0.0.1:8080/api/"))
+#
+# Proxies started with the same --cache-path share one cache file.
+
+import argparse
+import json
+import logging
+import typing as t
+
+from config import with_base_url
+from utils.services.cache.memory_cache import MemoryCache
+from utils.services.cache.sqlite_cache import SqliteCache
+from utils.services.getters.getter_service import GetterService
+from utils.services.proxy.read_through import ProxyServer, ReadThroughCache
+
+
+def main(argv: t.Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Read-through caching proxy")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--upstream", default=None, help="upstream base URL")
+    parser.add_argument("--max-entries", type=int, default=50_000)
+    parser.add_argument(
+        "--cache-path", default=None, help="SQLite file shared across processes"
+    )
+    parser.add_argument(
+        "--ttls", default=None, help='JSON overrides, e.g. {"schedule": 30}'
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    endpoints = with_base_url(args.upstream) if args.upstream else None
+    if args.cache_path:
+        cache = SqliteCache(args.cache_path, args.max_entries)
+    else:
+        cache = MemoryCache(args.max_entries)
+    proxy = ReadThroughCache(
+        GetterService(endpoints=endpoints),
+        cache,
+        ttls=json.loads(args.ttls) if args.ttls else None,
+    )
+    server = ProxyServer(proxy, args.host, args.port)
+    logging.info("Serving on %s", server.base_url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
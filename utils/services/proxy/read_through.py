@@ -0,0 +1,343 @@
+# utils/services/proxy/read_through.py
+
+import gzip
+import hashlib
+import logging
+import threading
+import typing as t
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+
+from utils.services.cache.memory_cache import MemoryCache, ResponseCache
+from utils.services.getters.getter_service import GetterService
+from utils.services.getters.routing import RouteNotFound, Router
+from utils.services.getters.transports import StreamingResponse, request_key
+
+try:
+    import brotli
+except ImportError:  # optional; gzip is always available
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached body is served without going upstream, by endpoint. An
+# endpoint with a TTL of 0 is not cached at all; its bodies are streamed
+# through as upstream sent them.
+DEFAULT_TTLS = {
+    "game": 5.0,
+    "game_diff": 5.0,
+    "game_linescore": 5.0,
+    "game_playByPlay": 5.0,
+    "game_winProbability": 5.0,
+    "game_contextMetrics": 5.0,
+    "game_timestamps": 5.0,
+    "schedule": 15.0,
+    "teams": 86_400.0,
+    "teams_history": 86_400.0,
+    "team_roster": 600.0,
+    "people": 3_600.0,
+    "sports_players": 3_600.0,
+}
+
+
+class CachedBody(t.NamedTuple):
+    # One upstream response, stored with its pre-compressed variants so no
+    # request pays for compression.
+    status: int
+    content_type: str
+    identity: bytes
+    gzip: bytes
+    br: t.Optional[bytes]
+    etag: str
+
+
+def make_body(status: int, content_type: str, content: bytes) -> CachedBody:
+    return CachedBody(
+        status,
+        content_type,
+        content,
+        gzip.compress(content, compresslevel=6, mtime=0),
+        brotli.compress(content) if brotli is not None else None,
+        '"' + hashlib.blake2b(content, digest_size=16).hexdigest() + '"',
+    )
+
+
+class ProxyResult(t.NamedTuple):
+    body: CachedBody
+    age: float
+    cache: str  # HIT, MISS or STALE
+
+
+class ReadThroughCache:
+    # Serves upstream bodies from a ResponseCache and fetches on a miss or once
+    # an entry is older than its endpoint's TTL. Concurrent misses for one URL
+    # share a single upstream request. When upstream fails, an expired entry is
+    # served as STALE rather than failing the client.
+
+    def __init__(
+        self,
+        service: t.Optional[GetterService] = None,
+        cache: t.Optional[ResponseCache] = None,
+        ttls: t.Optional[dict[str, float]] = None,
+        default_ttl: float = 30.0,
+    ):
+        self.service = service or GetterService()
+        self.cache = cache if cache is not None else MemoryCache()
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def ttl(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def _fetch(self, endpoint: str, params: dict[str, t.Any]) -> CachedBody:
+        try:
+            response = self.service._get_raw(endpoint, params)
+        except requests.HTTPError as e:
+            # Upstream errors are relayed to the client but never cached.
+            if e.response is None:
+                raise
+            response = e.response
+        return make_body(
+            response.status_code,
+            response.headers.get("Content-Type", "application/json;charset=UTF-8"),
+            response.content,
+        )
+
+    def _coalesced_fetch(
+        self, key: str, endpoint: str, params: dict[str, t.Any]
+    ) -> CachedBody:
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            body = self._fetch(endpoint, params)
+            if body.status == 200:
+                self.cache.set(key, body)
+            future.set_result(body)
+            return body
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def stream(
+        self, endpoint: str, params: dict[str, t.Any], accept_encoding: str
+    ) -> StreamingResponse:
+        # The client's Accept-Encoding goes upstream, so whatever encoding comes
+        # back can be relayed without decoding or recompressing.
+        return self.service._get_stream(
+            endpoint,
+            params,
+            decode_content=False,
+            request_kwargs={
+                "headers": {"Accept-Encoding": accept_encoding or "identity"}
+            },
+        )
+
+    def get(self, endpoint: str, params: dict[str, t.Any]) -> ProxyResult:
+        key = request_key(self.service._build_url(endpoint, params))
+        entry = self.cache.get(key)
+        if entry is not None:
+            age = entry.age()
+            if age < self.ttl(endpoint):
+                return ProxyResult(entry.value, age, "HIT")
+
+        try:
+            body = self._coalesced_fetch(key, endpoint, params)
+        except requests.RequestException as e:
+            if entry is None:
+                raise
+            logger.warning("Serving stale %s after upstream error: %s", key, e)
+            return ProxyResult(entry.value, entry.age(), "STALE")
+        if body.status != 200 and entry is not None:
+            return ProxyResult(entry.value, entry.age(), "STALE")
+        return ProxyResult(body, 0.0, "MISS")
+
+
+def _handler_class(proxy: ReadThroughCache, router: Router):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        # GET /api/v1/schedule?sportId=1   the upstream path, so a GetterService
+        #                                  pointed at the proxy works unchanged
+        # GET /endpoints/schedule?sportId=1
+        # GET /metrics                     Prometheus text for upstream calls
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            query = dict(parse_qsl(url.query, keep_blank_values=True))
+
+            if url.path == "/metrics":
+                text = proxy.service.metrics.to_prometheus().encode()
+                return self._send(200, text, "text/plain; version=0.0.4")
+
+            try:
+                if url.path.startswith("/endpoints/"):
+                    endpoint = url.path.removeprefix("/endpoints/")
+                    params = query
+                else:
+                    endpoint, path_params = router.resolve(url.path)
+                    params = {**query, **path_params}
+                if proxy.ttl(endpoint) <= 0:
+                    return self._passthrough(endpoint, params)
+                result = proxy.get(endpoint, params)
+            except RouteNotFound as e:
+                return self._send(404, str(e).encode(), "text/plain")
+            except ValueError as e:
+                return self._send(400, str(e).encode(), "text/plain")
+            except requests.RequestException as e:
+                return self._send(502, str(e).encode(), "text/plain")
+
+            body = result.body
+            max_age = max(0, int(proxy.ttl(endpoint) - result.age))
+            headers = {
+                "ETag": body.etag,
+                "Cache-Control": f"max-age={max_age}",
+                "Age": str(int(result.age)),
+                "X-Cache": result.cache,
+                "Vary": "Accept-Encoding",
+            }
+            if body.status != 200:
+                # Relayed upstream errors must not be cached or revalidated
+                # downstream as if they were the resource.
+                del headers["ETag"]
+                headers["Cache-Control"] = "no-store"
+            elif body.etag in self.headers.get("If-None-Match", ""):
+                return self._send(304, b"", None, headers)
+
+            accept = self.headers.get("Accept-Encoding", "")
+            if body.br is not None and "br" in accept:
+                content, headers["Content-Encoding"] = body.br, "br"
+            elif "gzip" in accept:
+                content, headers["Content-Encoding"] = body.gzip, "gzip"
+            else:
+                content = body.identity
+            self._send(body.status, content, body.content_type, headers)
+
+        def _passthrough(self, endpoint: str, params: dict[str, t.Any]) -> None:
+            try:
+                upstream = proxy.stream(
+                    endpoint, params, self.headers.get("Accept-Encoding", "")
+                )
+            except requests.HTTPError as e:
+                if e.response is None:
+                    raise
+                error = e.response
+                headers = {}
+                if "Content-Encoding" in error.headers:
+                    headers["Content-Encoding"] = error.headers["Content-Encoding"]
+                return self._send(
+                    error.status_code,
+                    error.content,
+                    error.headers.get("Content-Type"),
+                    headers,
+                )
+
+            with upstream:
+                headers = {"Cache-Control": "no-store", "X-Cache": "PASS"}
+                for name in ("Content-Encoding", "Content-Length", "ETag"):
+                    if name in upstream.headers:
+                        headers[name] = upstream.headers[name]
+                chunked = "Content-Length" not in headers
+                if chunked:
+                    headers["Transfer-Encoding"] = "chunked"
+                self._start(
+                    upstream.status_code, upstream.headers.get("Content-Type"), headers
+                )
+                try:
+                    for chunk in upstream.iter_chunks():
+                        if chunked:
+                            self.wfile.write(b"%x\r\n" % len(chunk))
+                            self.wfile.write(chunk)
+                            self.wfile.write(b"\r\n")
+                        else:
+                            self.wfile.write(chunk)
+                    if chunked:
+                        self.wfile.write(b"0\r\n\r\n")
+                except Exception as e:
+                    # Headers are already sent; all that is left is to cut the
+                    # connection so the client sees a truncated body.
+                    logger.warning("Passthrough of %s failed: %s", endpoint, e)
+                    self.close_connection = True
+
+        def _start(
+            self,
+            status: int,
+            content_type: t.Optional[str],
+            headers: dict[str, str],
+        ) -> None:
+            self.send_response(status)
+            if content_type:
+                self.send_header("Content-Type", content_type)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+
+        def _send(
+            self,
+            status: int,
+            content: bytes,
+            content_type: t.Optional[str],
+            headers: t.Optional[dict[str, str]] = None,
+        ) -> None:
+            headers = {**(headers or {}), "Content-Length": str(len(content))}
+            self._start(status, content_type, headers)
+            if content:
+                self.wfile.write(content)
+
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+    return Handler
+
+
+class ProxyServer:
+    def __init__(
+        self,
+        proxy: t.Optional[ReadThroughCache] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.proxy = proxy or ReadThroughCache()
+        router = Router()  # routes the public upstream paths
+        self._server = ThreadingHTTPServer(
+            (host, port), _handler_class(self.proxy, router)
+        )
+        self._server.daemon_threads = True
+        self._thread: t.Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/"
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def start(self) -> "ProxyServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "ProxyServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
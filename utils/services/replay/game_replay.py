@@ -0,0 +1,328 @@
+# utils/services/replay/game_replay.py
+
+import bisect
+import json
+import logging
+import typing as t
+import zlib
+from pathlib import Path
+
+from schemas.responses import LazyGameFeed
+from utils.services.getters.getter_service import GetterService
+
+logger = logging.getLogger(__name__)
+
+
+def _pack(value: t.Any) -> bytes:
+    return zlib.compress(json.dumps(value, separators=(",", ":")).encode())
+
+
+def _unpack(blob: bytes) -> t.Any:
+    return json.loads(zlib.decompress(blob))
+
+
+def _pointer(path: str) -> list[str]:
+    if path == "":
+        return []
+    return [p.replace("~1", "/").replace("~0", "~") for p in path[1:].split("/")]
+
+
+def _resolve(doc: t.Any, parts: list[str]) -> tuple[t.Any, str]:
+    for part in parts[:-1]:
+        doc = doc[int(part)] if isinstance(doc, list) else doc[part]
+    return doc, parts[-1]
+
+
+def _get(doc: t.Any, path: str) -> t.Any:
+    for part in _pointer(path):
+        doc = doc[int(part)] if isinstance(doc, list) else doc[part]
+    return doc
+
+
+def _add(doc: t.Any, path: str, value: t.Any) -> t.Any:
+    parts = _pointer(path)
+    if not parts:
+        return value
+    parent, key = _resolve(doc, parts)
+    if isinstance(parent, list):
+        if key == "-":
+            parent.append(value)
+        else:
+            parent.insert(int(key), value)
+    else:
+        parent[key] = value
+    return doc
+
+
+def _remove(doc: t.Any, path: str) -> t.Any:
+    parent, key = _resolve(doc, _pointer(path))
+    value = parent.pop(int(key)) if isinstance(parent, list) else parent.pop(key)
+    return value
+
+
+def apply_patch(doc: t.Any, ops: list[dict[str, t.Any]]) -> t.Any:
+    # Applies RFC 6902 JSON Patch operations in place, as returned by game_diff.
+    for op in ops:
+        kind = op["op"]
+        path = op["path"]
+        if kind == "add":
+            doc = _add(doc, path, op["value"])
+        elif kind == "remove":
+            _remove(doc, path)
+        elif kind == "replace":
+            parts = _pointer(path)
+            if not parts:
+                doc = op["value"]
+            else:
+                parent, key = _resolve(doc, parts)
+                parent[int(key) if isinstance(parent, list) else key] = op["value"]
+        elif kind == "move":
+            value = _remove(doc, op["from"])
+            doc = _add(doc, path, value)
+        elif kind == "copy":
+            doc = _add(doc, path, json.loads(json.dumps(_get(doc, op["from"]))))
+        elif kind == "test":
+            if _get(doc, path) != op["value"]:
+                raise ValueError(f"JSON patch test failed at '{path}'")
+        else:
+            raise ValueError(f"Unsupported JSON patch operation: {kind}")
+    return doc
+
+
+def _escape(key: t.Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def make_patch(old: t.Any, new: t.Any, path: str = "") -> list[dict[str, t.Any]]:
+    # Produces the RFC 6902 operations that turn old into new. Lists that only grow
+    # get "add" operations for the appended items; other list changes are replaced.
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if isinstance(old, dict):
+        ops: list[dict[str, t.Any]] = []
+        for key in old.keys() - new.keys():
+            ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(make_patch(old[key], value, child))
+        return ops
+
+    if isinstance(old, list):
+        if len(new) >= len(old) and new[: len(old)] == old:
+            return [
+                {"op": "add", "path": f"{path}/-", "value": value}
+                for value in new[len(old) :]
+            ]
+        if len(new) == len(old):
+            ops = []
+            for i, (a, b) in enumerate(zip(old, new)):
+                ops.extend(make_patch(a, b, f"{path}/{i}"))
+            return ops
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if old != new:
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
+
+
+def _patch_timecode(ops: list[dict[str, t.Any]]) -> t.Optional[str]:
+    for op in ops:
+        if op.get("path") == "/metaData/timeStamp" and op["op"] in ("add", "replace"):
+            return op["value"]
+    return None
+
+
+class GameReplay:
+    # One game's history: full snapshots (normally just the base) plus compact
+    # patches, each keyed by timecode. Entries are zlib-compressed JSON.
+
+    def __init__(self, game_pk: int, keyframe_interval: int = 50):
+        self.game_pk = game_pk
+        self.keyframe_interval = keyframe_interval
+        self._timecodes: list[str] = []
+        self._entries: list[tuple[str, bytes]] = []
+        self._keyframes: dict[int, bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self._timecodes)
+
+    @property
+    def timecodes(self) -> list[str]:
+        return list(self._timecodes)
+
+    def _append(self, timecode: str, kind: str, blob: bytes) -> None:
+        if self._timecodes and timecode <= self._timecodes[-1]:
+            raise ValueError(
+                f"Timecode {timecode} is not after {self._timecodes[-1]} "
+                f"for game {self.game_pk}"
+            )
+        if not self._entries and kind != "snapshot":
+            raise ValueError("The first entry of a replay must be a snapshot")
+        self._timecodes.append(timecode)
+        self._entries.append((kind, blob))
+
+    def add_snapshot(self, timecode: str, feed: dict[str, t.Any]) -> None:
+        self._append(timecode, "snapshot", _pack(feed))
+
+    def add_patch(self, timecode: str, ops: list[dict[str, t.Any]]) -> None:
+        self._append(timecode, "patch", _pack(ops))
+
+    def index_at(self, timecode: str) -> int:
+        i = bisect.bisect_right(self._timecodes, timecode) - 1
+        if i < 0:
+            raise KeyError(f"No state for game {self.game_pk} at {timecode}")
+        return i
+
+    def _state(self, index: int) -> dict[str, t.Any]:
+        # Walk back to the nearest snapshot or cached keyframe, then roll forward.
+        start = index
+        while start not in self._keyframes and self._entries[start][0] != "snapshot":
+            start -= 1
+
+        blob = self._keyframes.get(start, self._entries[start][1])
+        doc = _unpack(blob)
+        for i in range(start + 1, index + 1):
+            kind, blob = self._entries[i]
+            if kind == "snapshot":
+                doc = _unpack(blob)
+            else:
+                doc = apply_patch(doc, _unpack(blob))
+            if i % self.keyframe_interval == 0 and i not in self._keyframes:
+                self._keyframes[i] = _pack(doc)
+        return doc
+
+    def at(self, timecode: str) -> LazyGameFeed:
+        return LazyGameFeed(self._state(self.index_at(timecode)))
+
+    def latest(self) -> LazyGameFeed:
+        if not self._entries:
+            raise KeyError(f"No state recorded for game {self.game_pk}")
+        return LazyGameFeed(self._state(len(self._entries) - 1))
+
+    def save(self, path: t.Union[str, Path]) -> None:
+        with open(path, "wb") as f:
+            for timecode, (kind, blob) in zip(self._timecodes, self._entries):
+                header = f"{timecode} {kind} {len(blob)}\n".encode()
+                f.write(header)
+                f.write(blob)
+
+    @classmethod
+    def load(
+        cls, path: t.Union[str, Path], game_pk: int, keyframe_interval: int = 50
+    ) -> "GameReplay":
+        replay = cls(game_pk, keyframe_interval=keyframe_interval)
+        with open(path, "rb") as f:
+            while header := f.readline():
+                timecode, kind, size = header.decode().split()
+                replay._append(timecode, kind, f.read(int(size)))
+        return replay
+
+
+class GameReplayStore:
+    def __init__(
+        self,
+        service: t.Optional[GetterService] = None,
+        directory: t.Optional[t.Union[str, Path]] = None,
+        diff_window: int = 20,
+    ):
+        self.service = service or GetterService()
+        self.directory = Path(directory) if directory else None
+        # Timestamps per game_diff request when fetching a whole game. A gap
+        # too large comes back as a full feed instead of patches, which would
+        # leave every timecode inside it resolving to the previous snapshot.
+        self.diff_window = diff_window
+        self._games: dict[int, GameReplay] = {}
+
+    def _path(self, game_pk: int) -> t.Optional[Path]:
+        if self.directory is None:
+            return None
+        return self.directory / f"{game_pk}.replay"
+
+    def get(self, game_pk: int) -> GameReplay:
+        game_pk = int(game_pk)
+        if game_pk in self._games:
+            return self._games[game_pk]
+
+        path = self._path(game_pk)
+        if path is not None and path.exists():
+            replay = GameReplay.load(path, game_pk)
+        else:
+            replay = self.fetch(game_pk)
+        self._games[game_pk] = replay
+        return replay
+
+    def feed_at(self, game_pk: int, timecode: str) -> LazyGameFeed:
+        return self.get(game_pk).at(timecode)
+
+    def fetch(self, game_pk: int) -> GameReplay:
+        timestamps: list[str] = self.service._get(
+            "game_timestamps", {"gamePk": game_pk}
+        )["data"]
+        if not timestamps:
+            raise ValueError(f"No timestamps available for game {game_pk}")
+
+        replay = GameReplay(game_pk)
+        base = self.service._get(
+            "game", {"gamePk": game_pk, "timecode": timestamps[0]}
+        )["data"]
+        replay.add_snapshot(timestamps[0], base)
+        ends = timestamps[self.diff_window :: self.diff_window]
+        if timestamps[-1] not in ends[-1:]:
+            ends.append(timestamps[-1])
+        for end_timecode in ends:
+            self.update(replay, end_timecode)
+
+        path = self._path(game_pk)
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            replay.save(path)
+        return replay
+
+    def update(self, replay: GameReplay, end_timecode: str) -> GameReplay:
+        # Pulls every diff after the last stored timecode; also used for live games.
+        start_timecode = replay.timecodes[-1]
+        if end_timecode <= start_timecode:
+            return replay
+
+        diffs = self.service._get(
+            "game_diff",
+            {
+                "gamePk": replay.game_pk,
+                "startTimecode": start_timecode,
+                "endTimecode": end_timecode,
+            },
+        )["data"]
+
+        # The API returns the full feed instead of patches when the gap is large.
+        if isinstance(diffs, dict):
+            timecode = diffs.get("metaData", {}).get("timeStamp", end_timecode)
+            replay.add_snapshot(timecode, diffs)
+            return replay
+
+        # Ops from a diff without its own timestamp still have to be applied, in
+        # order, or every later patch lands on the wrong document. They are
+        # carried into the next timestamped patch; trailing ones go to
+        # end_timecode, joining the last patch if it already has that timecode.
+        patches: list[tuple[str, list[dict[str, t.Any]]]] = []
+        pending: list[dict[str, t.Any]] = []
+        for item in diffs:
+            ops = item.get("diff", [])
+            timecode = _patch_timecode(ops)
+            if timecode is None:
+                logger.debug(f"Carrying untimed diff forward for {replay.game_pk}")
+                pending.extend(ops)
+                continue
+            patches.append((timecode, pending + ops))
+            pending = []
+        if pending:
+            if patches and patches[-1][0] >= end_timecode:
+                patches[-1][1].extend(pending)
+            else:
+                patches.append((end_timecode, pending))
+        for timecode, ops in patches:
+            replay.add_patch(timecode, ops)
+        return replay
@@ -0,0 +1,227 @@
+# utils/services/rosters/roster_store.py
+
+import json
+import logging
+import threading
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+
+from schemas.responses import RosterEntry, RosterResponse
+from utils.files import write_atomic
+from utils.services.getters.getter_service import GetterService
+from utils.services.metrics.tracing import propagate
+
+logger = logging.getLogger(__name__)
+
+
+class RosterStore:
+    # Active rosters for every team in a sport, served from memory.
+    #
+    # snapshot() fetches all team rosters concurrently once. sync() then asks
+    # `transactions` from lookback_days before the watermark to today (a
+    # transaction can be posted days after the date it carries) and refetches
+    # only the rosters of teams named in new transactions. Transaction types and
+    # free-text descriptions do not map reliably onto active-roster changes
+    # (an injured-list placement and a paternity-list return are both "Status
+    # Change"), so the affected rosters are re-read rather than patched.
+    #
+    # With a path, the rosters, the watermark and the transaction ids already
+    # applied within the lookback window are saved after every sync, so a
+    # restart resumes from the watermark instead of taking a new snapshot.
+
+    def __init__(
+        self,
+        service: t.Optional[GetterService] = None,
+        path: t.Optional[t.Union[str, Path]] = None,
+        season: t.Optional[int] = None,
+        sport_id: int = 1,
+        roster_type: str = "active",
+        sync_interval: t.Optional[float] = 300.0,
+        lookback_days: int = 7,
+        max_workers: int = 8,
+        today: t.Callable[[], date] = date.today,
+        clock: t.Callable[[], float] = time.time,
+    ):
+        self.service = service or GetterService()
+        self.path = Path(path) if path is not None else None
+        self.season = int(season or today().year)
+        self.sport_id = sport_id
+        self.roster_type = roster_type
+        self.sync_interval = sync_interval
+        self.lookback_days = lookback_days
+        self.max_workers = max_workers
+        self.today = today
+        self.clock = clock
+
+        self.rosters: dict[int, list[RosterEntry]] = {}
+        self._teams_by_person: dict[int, int] = {}
+        self.watermark: t.Optional[str] = None
+        # Transaction id -> its date, for ids inside the lookback window.
+        self._seen: dict[int, str] = {}
+        self._synced_at = 0.0
+        self._lock = threading.RLock()
+
+        if self.path is not None and self.path.exists():
+            self._load()
+
+    # Persistence
+
+    def _load(self) -> None:
+        state = json.loads(self.path.read_text())
+        if state["season"] != self.season or state["rosterType"] != self.roster_type:
+            logger.info("Ignoring roster state for another season or roster type")
+            return
+        self.watermark = state["watermark"]
+        self._seen = {int(i): d for i, d in state["seen"].items()}
+        self._set_rosters(
+            {
+                int(team_id): [RosterEntry.model_validate(e) for e in entries]
+                for team_id, entries in state["rosters"].items()
+            }
+        )
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        state = {
+            "season": self.season,
+            "rosterType": self.roster_type,
+            "watermark": self.watermark,
+            "seen": {str(i): d for i, d in sorted(self._seen.items())},
+            "rosters": {
+                str(team_id): [e.model_dump(exclude_none=True) for e in entries]
+                for team_id, entries in self.rosters.items()
+            },
+        }
+        write_atomic(self.path, json.dumps(state).encode())
+
+    # Upstream
+
+    def _fetch_roster(self, team_id: int) -> list[RosterEntry]:
+        data = self.service._get(
+            "team_roster",
+            {"teamId": team_id, "rosterType": self.roster_type, "season": self.season},
+        )["data"]
+        return RosterResponse.model_validate(data).roster
+
+    def _fetch_rosters(self, team_ids: t.Iterable[int]) -> dict[int, list[RosterEntry]]:
+        team_ids = list(team_ids)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            rosters = pool.map(propagate(self._fetch_roster), team_ids)
+            return dict(zip(team_ids, rosters))
+
+    def _set_rosters(self, rosters: dict[int, list[RosterEntry]]) -> None:
+        with self._lock:
+            self.rosters.update(rosters)
+            self._teams_by_person = {
+                entry.person.id: team_id
+                for team_id, entries in self.rosters.items()
+                for entry in entries
+            }
+
+    def _fetch_transactions(self, start: str, end: str) -> list[dict]:
+        data = self.service._get(
+            "transactions",
+            {"sportId": self.sport_id, "startDate": start, "endDate": end},
+        )["data"]
+        return data.get("transactions", [])
+
+    def snapshot(self) -> None:
+        today = self.today().isoformat()
+        start = (self.today() - timedelta(days=self.lookback_days)).isoformat()
+        # Transactions already in the window are reflected in the rosters about
+        # to be fetched; marking them seen keeps the first sync from refetching
+        # every team they name. They are read before the rosters so that one
+        # posted in between is refetched rather than missed.
+        seen = {
+            tx["id"]: tx.get("date", today)[:10]
+            for tx in self._fetch_transactions(start, today)
+        }
+        data = self.service._get(
+            "teams",
+            {"sportId": self.sport_id, "season": self.season, "fields": "teams,id"},
+        )["data"]
+        team_ids = [team["id"] for team in data.get("teams", [])]
+        rosters = self._fetch_rosters(team_ids)
+        with self._lock:
+            self.rosters = {}
+            self._set_rosters(rosters)
+            self.watermark = today
+            self._seen = seen
+            self._synced_at = self.clock()
+            self._save()
+        logger.info("Roster snapshot: %d teams", len(rosters))
+
+    def sync(self) -> set[int]:
+        # Returns the ids of the teams whose rosters were refetched.
+        if self.watermark is None:
+            self.snapshot()
+            return set(self.rosters)
+
+        lookback = timedelta(days=self.lookback_days)
+        today = self.today().isoformat()
+        start = (date.fromisoformat(self.watermark) - lookback).isoformat()
+        new = [
+            tx
+            for tx in self._fetch_transactions(start, today)
+            if tx["id"] not in self._seen
+        ]
+
+        affected = {
+            team["id"]
+            for tx in new
+            for team in (tx.get("fromTeam"), tx.get("toTeam"))
+            if team and team.get("id") in self.rosters
+        }
+        rosters = self._fetch_rosters(sorted(affected)) if affected else {}
+
+        with self._lock:
+            self._set_rosters(rosters)
+            self._seen.update({tx["id"]: tx.get("date", today)[:10] for tx in new})
+            # The next query starts at today - lookback; older ids cannot recur.
+            horizon = (date.fromisoformat(today) - lookback).isoformat()
+            self._seen = {i: d for i, d in self._seen.items() if d >= horizon}
+            self.watermark = today
+            self._synced_at = self.clock()
+            self._save()
+        logger.info("%d new transactions, %d rosters refreshed", len(new), len(rosters))
+        return affected
+
+    def _ensure_current(self) -> None:
+        if self.watermark is None:
+            with self._lock:
+                # Concurrent first callers wait for one snapshot instead of
+                # each taking their own.
+                if self.watermark is None:
+                    self.sync()
+            return
+        if self.sync_interval is None:
+            return
+        with self._lock:
+            if self.clock() - self._synced_at < self.sync_interval:
+                return
+            self._synced_at = self.clock()  # one caller syncs, the rest read
+        try:
+            self.sync()
+        except Exception as e:
+            logger.warning("Roster sync failed, serving previous rosters: %s", e)
+
+    # Queries
+
+    def roster(self, team_id: int) -> list[RosterEntry]:
+        self._ensure_current()
+        return list(self.rosters.get(team_id, []))
+
+    def team_for(self, person_id: int) -> t.Optional[int]:
+        self._ensure_current()
+        return self._teams_by_person.get(person_id)
+
+    def invalid_lineup_ids(
+        self, team_id: int, person_ids: t.Iterable[int]
+    ) -> list[int]:
+        # The ids in a submitted lineup that are not on the team's roster.
+        self._ensure_current()
+        return [p for p in person_ids if self._teams_by_person.get(p) != team_id]
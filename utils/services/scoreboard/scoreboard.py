@@ -0,0 +1,181 @@
+# utils/services/scoreboard/scoreboard.py
+
+import logging
+import threading
+import time
+import typing as t
+from datetime import date
+from types import MappingProxyType
+
+from utils.services.getters.getter_service import GetterService
+
+logger = logging.getLogger(__name__)
+
+# Everything a scoreboard row shows, from one schedule request.
+SCOREBOARD_HYDRATE = "linescore,probablePitcher,decisions,team"
+
+
+class GameLine(t.NamedTuple):
+    game_pk: int
+    state: str  # Preview, Live or Final
+    detailed_state: str
+    start_time: str
+    away_id: int
+    away_abbreviation: str
+    away_score: int
+    home_id: int
+    home_abbreviation: str
+    home_score: int
+    inning: t.Optional[int] = None
+    inning_half: t.Optional[str] = None
+    outs: t.Optional[int] = None
+    balls: t.Optional[int] = None
+    strikes: t.Optional[int] = None
+    runners: tuple[bool, bool, bool] = (False, False, False)
+    away_probable: t.Optional[str] = None
+    home_probable: t.Optional[str] = None
+    winner: t.Optional[str] = None
+    loser: t.Optional[str] = None
+    save: t.Optional[str] = None
+
+
+def _name(person: t.Optional[dict[str, t.Any]]) -> t.Optional[str]:
+    return person.get("fullName") if person else None
+
+
+def parse_game(game: dict[str, t.Any]) -> GameLine:
+    status = game.get("status", {})
+    away, home = game["teams"]["away"], game["teams"]["home"]
+    linescore = game.get("linescore", {})
+    offense = linescore.get("offense", {})
+    decisions = game.get("decisions", {})
+    return GameLine(
+        game_pk=game["gamePk"],
+        state=status.get("abstractGameState", ""),
+        detailed_state=status.get("detailedState", ""),
+        start_time=game.get("gameDate", ""),
+        away_id=away["team"]["id"],
+        away_abbreviation=away["team"].get("abbreviation", ""),
+        away_score=away.get("score", 0),
+        home_id=home["team"]["id"],
+        home_abbreviation=home["team"].get("abbreviation", ""),
+        home_score=home.get("score", 0),
+        inning=linescore.get("currentInning"),
+        inning_half=linescore.get("inningHalf"),
+        outs=linescore.get("outs"),
+        balls=linescore.get("balls"),
+        strikes=linescore.get("strikes"),
+        runners=("first" in offense, "second" in offense, "third" in offense),
+        away_probable=_name(away.get("probablePitcher")),
+        home_probable=_name(home.get("probablePitcher")),
+        winner=_name(decisions.get("winner")),
+        loser=_name(decisions.get("loser")),
+        save=_name(decisions.get("save")),
+    )
+
+
+class Scoreboard(t.NamedTuple):
+    date: str
+    fetched_at: float
+    games: t.Mapping[int, GameLine]  # read-only, in schedule order
+
+
+class ScoreboardDiff(t.NamedTuple):
+    added: tuple[GameLine, ...] = ()
+    removed: tuple[int, ...] = ()
+    # gamePk -> only the fields that changed, with their new values
+    changed: t.Mapping[int, t.Mapping[str, t.Any]] = MappingProxyType({})
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def diff(previous: t.Optional[Scoreboard], current: Scoreboard) -> ScoreboardDiff:
+    before = previous.games if previous is not None else {}
+    added = tuple(g for pk, g in current.games.items() if pk not in before)
+    removed = tuple(pk for pk in before if pk not in current.games)
+    changed = {}
+    for pk, game in current.games.items():
+        old = before.get(pk)
+        # Unchanged lines are the same object (see build_scoreboard), so the
+        # identity check skips almost every game on a quiet tick.
+        if old is None or old is game:
+            continue
+        fields = {
+            name: value
+            for name, value, old_value in zip(game._fields, game, old)
+            if value != old_value
+        }
+        if fields:
+            changed[pk] = MappingProxyType(fields)
+    return ScoreboardDiff(added, removed, MappingProxyType(changed))
+
+
+def build_scoreboard(
+    payload: dict[str, t.Any],
+    day: str,
+    previous: t.Optional[Scoreboard] = None,
+    fetched_at: t.Optional[float] = None,
+) -> Scoreboard:
+    before = previous.games if previous is not None else {}
+    games: dict[int, GameLine] = {}
+    for dates in payload.get("dates", []):
+        for game in dates.get("games", []):
+            line = parse_game(game)
+            old = before.get(line.game_pk)
+            games[line.game_pk] = old if old == line else line
+    return Scoreboard(
+        day,
+        time.time() if fetched_at is None else fetched_at,
+        MappingProxyType(games),
+    )
+
+
+class ScoreboardBuilder:
+    # One schedule request per tick, whatever the slate size. tick() returns the
+    # new snapshot and its diff against the previous one; run() polls on an
+    # interval and passes only non-empty diffs to on_change.
+
+    def __init__(
+        self,
+        service: t.Optional[GetterService] = None,
+        day: t.Optional[str] = None,
+        sport_id: int = 1,
+        hydrate: str = SCOREBOARD_HYDRATE,
+    ):
+        self.service = service or GetterService()
+        self.day = day
+        self.sport_id = sport_id
+        self.hydrate = hydrate
+        self.current: t.Optional[Scoreboard] = None
+
+    def tick(self) -> tuple[Scoreboard, ScoreboardDiff]:
+        day = self.day or date.today().isoformat()
+        payload = self.service._get(
+            "schedule",
+            {"sportId": self.sport_id, "date": day, "hydrate": self.hydrate},
+        )["data"]
+        # Diffed against the last snapshot even across a date rollover, so the
+        # previous day's games are reported as removed.
+        scoreboard = build_scoreboard(payload, day, self.current)
+        changes = diff(self.current, scoreboard)
+        self.current = scoreboard
+        return scoreboard, changes
+
+    def run(
+        self,
+        on_change: t.Callable[[Scoreboard, ScoreboardDiff], None],
+        interval: float = 10.0,
+        stop: t.Optional[threading.Event] = None,
+    ) -> None:
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            started = time.monotonic()
+            try:
+                scoreboard, changes = self.tick()
+            except Exception as e:
+                logger.warning("Scoreboard refresh failed: %s", e)
+            else:
+                if changes:
+                    on_change(scoreboard, changes)
+            stop.wait(max(0.0, interval - (time.monotonic() - started)))
@@ -0,0 +1,62 @@
+# utils/services/simulator/__main__.py
+#
+#     python -m utils.services.simulator --port 8080 --latency-ms 80 --sigma 0.5 \
+#         --error-rate 0.01 --rate-limit 50 --speed 60
+
+import argparse
+import logging
+
+from utils.services.simulator.server import (
+    LatencySpec,
+    MlbSimulator,
+    SimulatorConfig,
+    SimulatorServer,
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local MLB Stats API simulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="median latency")
+    parser.add_argument("--sigma", type=float, default=0.0, help="lognormal sigma")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=None, help="requests/sec")
+    parser.add_argument("--burst", type=int, default=10)
+    parser.add_argument("--live-date", default=None, help="YYYY-MM-DD")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--fixtures", default=None, help="directory of JSON bodies")
+    parser.add_argument("--config", default=None, help="SimulatorConfig JSON file")
+    args = parser.parse_args(argv)
+
+    if args.config:
+        with open(args.config) as f:
+            config = SimulatorConfig.model_validate_json(f.read())
+    else:
+        config = SimulatorConfig(
+            seed=args.seed,
+            latency=LatencySpec(
+                distribution="lognormal" if args.sigma else "fixed",
+                median_ms=args.latency_ms,
+                spread=args.sigma,
+            ),
+            error_rate=args.error_rate,
+            rate_limit_per_second=args.rate_limit,
+            rate_limit_burst=args.burst,
+            live_date=args.live_date,
+            speed=args.speed,
+            fixtures_dir=args.fixtures,
+        )
+
+    logging.basicConfig(level=logging.INFO)
+    server = SimulatorServer(MlbSimulator(config), args.host, args.port)
+    logging.getLogger(__name__).info(f"Serving MLB Stats API at {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,822 @@
+# utils/services/simulator/payloads.py
+#
+# Deterministic payloads with the field layout of statsapi.mlb.com responses, used
+# by the simulator and the benchmark fixtures.
+
+import random
+import typing as t
+
+GAME_PK = 745804
+GAME_DATE = "2024-07-04"
+COPYRIGHT = "Copyright 2024 MLB Advanced Media, L.P."
+
+TEAMS = [
+    (108, "Los Angeles Angels", "ana", "LAA"),
+    (109, "Arizona Diamondbacks", "ari", "AZ"),
+    (110, "Baltimore Orioles", "bal", "BAL"),
+    (111, "Boston Red Sox", "bos", "BOS"),
+    (112, "Chicago Cubs", "chn", "CHC"),
+    (113, "Cincinnati Reds", "cin", "CIN"),
+    (114, "Cleveland Guardians", "cle", "CLE"),
+    (115, "Colorado Rockies", "col", "COL"),
+    (116, "Detroit Tigers", "det", "DET"),
+    (117, "Houston Astros", "hou", "HOU"),
+    (118, "Kansas City Royals", "kca", "KC"),
+    (119, "Los Angeles Dodgers", "lan", "LAD"),
+    (120, "Washington Nationals", "was", "WSH"),
+    (121, "New York Mets", "nyn", "NYM"),
+    (133, "Athletics", "oak", "ATH"),
+    (134, "Pittsburgh Pirates", "pit", "PIT"),
+    (135, "San Diego Padres", "sdn", "SD"),
+    (136, "Seattle Mariners", "sea", "SEA"),
+    (137, "San Francisco Giants", "sfn", "SF"),
+    (138, "St. Louis Cardinals", "sln", "STL"),
+    (139, "Tampa Bay Rays", "tba", "TB"),
+    (140, "Texas Rangers", "tex", "TEX"),
+    (141, "Toronto Blue Jays", "tor", "TOR"),
+    (142, "Minnesota Twins", "min", "MIN"),
+    (143, "Philadelphia Phillies", "phi", "PHI"),
+    (144, "Atlanta Braves", "atl", "ATL"),
+    (145, "Chicago White Sox", "cha", "CWS"),
+    (146, "Miami Marlins", "mia", "MIA"),
+    (147, "New York Yankees", "nya", "NYY"),
+    (158, "Milwaukee Brewers", "mil", "MIL"),
+]
+
+POSITIONS = [
+    ("1", "Pitcher", "Pitcher", "P"),
+    ("2", "Catcher", "Catcher", "C"),
+    ("3", "First Base", "Infielder", "1B"),
+    ("4", "Second Base", "Infielder", "2B"),
+    ("5", "Third Base", "Infielder", "3B"),
+    ("6", "Shortstop", "Infielder", "SS"),
+    ("7", "Outfielder", "Outfielder", "LF"),
+    ("8", "Outfielder", "Outfielder", "CF"),
+    ("9", "Outfielder", "Outfielder", "RF"),
+    ("10", "Designated Hitter", "Hitter", "DH"),
+]
+
+PITCH_TYPES = [
+    ("FF", "Four-Seam Fastball", 94.0),
+    ("SI", "Sinker", 93.0),
+    ("SL", "Slider", 85.0),
+    ("CH", "Changeup", 86.0),
+    ("CU", "Curveball", 79.0),
+    ("FC", "Cutter", 89.0),
+]
+
+CALLS = [
+    ("B", "Ball", False, True, False),
+    ("C", "Called Strike", True, False, False),
+    ("S", "Swinging Strike", True, False, False),
+    ("F", "Foul", True, False, False),
+    ("X", "In play, out(s)", False, False, True),
+]
+
+EVENTS = [
+    ("field_out", "Groundout"),
+    ("field_out", "Flyout"),
+    ("strikeout", "Strikeout"),
+    ("single", "Single"),
+    ("double", "Double"),
+    ("walk", "Walk"),
+    ("home_run", "Home Run"),
+]
+
+FIRST_NAMES = ["Juan", "Mike", "Shohei", "Aaron", "Jose", "Luis", "Carlos", "Kyle"]
+LAST_NAMES = ["Soto", "Trout", "Ohtani", "Judge", "Ramirez", "Garcia", "Tucker"]
+
+
+def _ref(kind: str, id_: int, name: str) -> dict[str, t.Any]:
+    return {"id": id_, "name": name, "link": f"/api/v1/{kind}/{id_}"}
+
+
+def _person(rng: random.Random, person_id: int) -> dict[str, t.Any]:
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    return {"id": person_id, "fullName": name, "link": f"/api/v1/people/{person_id}"}
+
+
+def _position(code_index: int) -> dict[str, t.Any]:
+    code, name, type_, abbreviation = POSITIONS[code_index]
+    return {"code": code, "name": name, "type": type_, "abbreviation": abbreviation}
+
+
+def _lineup(rng: random.Random, team_id: int) -> dict[str, list[dict[str, t.Any]]]:
+    base = team_id * 10_000
+    return {
+        "batters": [_person(rng, base + i) for i in range(1, 10)],
+        "pitchers": [_person(rng, base + 50 + i) for i in range(1, 6)],
+    }
+
+
+def schedule(
+    rng: random.Random,
+    games: int = 15,
+    game_date: str = GAME_DATE,
+    first_game_pk: int = GAME_PK,
+) -> dict[str, t.Any]:
+    teams = rng.sample(TEAMS, games * 2)
+    game_list = []
+    for i in range(games):
+        away, home = teams[2 * i], teams[2 * i + 1]
+        away_score, home_score = rng.randint(0, 9), rng.randint(0, 9)
+        game_list.append(
+            {
+                "gamePk": first_game_pk + i,
+                "gameGuid": f"00000000-0000-0000-0000-{first_game_pk + i:012d}",
+                "link": f"/api/v1.1/game/{first_game_pk + i}/feed/live",
+                "gameType": "R",
+                "season": game_date[:4],
+                "gameDate": f"{game_date}T{17 + i % 6}:05:00Z",
+                "officialDate": game_date,
+                "status": {
+                    "abstractGameState": "Final",
+                    "codedGameState": "F",
+                    "detailedState": "Final",
+                    "statusCode": "F",
+                    "startTimeTBD": False,
+                    "abstractGameCode": "F",
+                },
+                "teams": {
+                    side: {
+                        "leagueRecord": {
+                            "wins": rng.randint(30, 55),
+                            "losses": rng.randint(30, 55),
+                            "pct": f".{rng.randint(400, 600)}",
+                        },
+                        "score": score,
+                        "team": _ref("teams", team[0], team[1]),
+                        "isWinner": score > other,
+                        "splitSquad": False,
+                        "seriesNumber": 28,
+                    }
+                    for side, team, score, other in (
+                        ("away", away, away_score, home_score),
+                        ("home", home, home_score, away_score),
+                    )
+                },
+                "venue": _ref("venues", 3000 + i, f"Ballpark {i}"),
+                "content": {"link": f"/api/v1/game/{first_game_pk + i}/content"},
+                "isTie": False,
+                "gameNumber": 1,
+                "publicFacing": True,
+                "doubleHeader": "N",
+                "gamedayType": "P",
+                "tiebreaker": "N",
+                "calendarEventID": f"14-{first_game_pk + i}-{game_date}",
+                "seasonDisplay": game_date[:4],
+                "dayNight": "night",
+                "scheduledInnings": 9,
+                "reverseHomeAwayStatus": False,
+                "inningBreakLength": 120,
+                "gamesInSeries": 3,
+                "seriesGameNumber": 2,
+                "seriesDescription": "Regular Season",
+                "recordSource": "S",
+                "ifNecessary": "N",
+                "ifNecessaryDescription": "Normal Game",
+            }
+        )
+
+    return {
+        "copyright": COPYRIGHT,
+        "totalItems": games,
+        "totalEvents": 0,
+        "totalGames": games,
+        "totalGamesInProgress": 0,
+        "dates": [
+            {
+                "date": game_date,
+                "totalItems": games,
+                "totalEvents": 0,
+                "totalGames": games,
+                "totalGamesInProgress": 0,
+                "games": game_list,
+                "events": [],
+            }
+        ],
+    }
+
+
+def _pitch(
+    rng: random.Random,
+    index: int,
+    number: int,
+    balls: int,
+    strikes: int,
+    outs: int,
+    game_pk: int = GAME_PK,
+    game_date: str = GAME_DATE,
+) -> dict[str, t.Any]:
+    code, description, speed = rng.choice(PITCH_TYPES)
+    call, call_description, is_strike, is_ball, in_play = rng.choice(CALLS)
+    start_speed = round(speed + rng.uniform(-2.5, 2.5), 1)
+    return {
+        "details": {
+            "call": {"code": call, "description": call_description},
+            "description": call_description,
+            "code": call,
+            "ballColor": "rgba(39, 161, 39, 1.0)",
+            "trailColor": "rgba(188, 0, 33, 1.0)",
+            "isInPlay": in_play,
+            "isStrike": is_strike,
+            "isBall": is_ball,
+            "type": {"code": code, "description": description},
+            "isOut": False,
+            "hasReview": False,
+        },
+        "count": {"balls": balls, "strikes": strikes, "outs": outs},
+        "pitchData": {
+            "startSpeed": start_speed,
+            "endSpeed": round(start_speed - 8.4, 1),
+            "strikeZoneTop": 3.39,
+            "strikeZoneBottom": 1.6,
+            "coordinates": {
+                "aY": round(rng.uniform(20, 35), 2),
+                "aZ": round(rng.uniform(-35, -10), 2),
+                "pfxX": round(rng.uniform(-10, 10), 2),
+                "pfxZ": round(rng.uniform(-5, 12), 2),
+                "pX": round(rng.uniform(-1.5, 1.5), 2),
+                "pZ": round(rng.uniform(0.8, 4.0), 2),
+                "vX0": round(rng.uniform(-10, 10), 2),
+                "vY0": round(rng.uniform(-140, -120), 2),
+                "vZ0": round(rng.uniform(-8, 2), 2),
+                "x": round(rng.uniform(80, 150), 2),
+                "y": round(rng.uniform(150, 220), 2),
+                "x0": round(rng.uniform(-3, 3), 2),
+                "y0": 50.0,
+                "z0": round(rng.uniform(5, 6.5), 2),
+                "aX": round(rng.uniform(-20, 10), 2),
+            },
+            "breaks": {
+                "breakAngle": round(rng.uniform(0, 40), 1),
+                "breakLength": round(rng.uniform(2, 12), 1),
+                "breakY": 24.0,
+                "breakVertical": round(rng.uniform(-40, -10), 1),
+                "breakVerticalInduced": round(rng.uniform(0, 20), 1),
+                "breakHorizontal": round(rng.uniform(-15, 15), 1),
+                "spinRate": rng.randint(1800, 2800),
+                "spinDirection": rng.randint(0, 360),
+            },
+            "zone": rng.randint(1, 14),
+            "typeConfidence": 0.9,
+            "plateTime": 0.41,
+            "extension": 6.5,
+        },
+        "index": index,
+        "playId": f"{game_pk:x}-{index:04x}-{number:04x}",
+        "pitchNumber": number,
+        "startTime": f"{game_date}T23:{index % 60:02d}:00.000Z",
+        "endTime": f"{game_date}T23:{index % 60:02d}:05.000Z",
+        "isPitch": True,
+        "type": "pitch",
+    }
+
+
+def plays(
+    rng: random.Random,
+    away_id: int,
+    home_id: int,
+    innings: int = 9,
+    game_pk: int = GAME_PK,
+    game_date: str = GAME_DATE,
+) -> list[dict[str, t.Any]]:
+    lineups = {"away": _lineup(rng, away_id), "home": _lineup(rng, home_id)}
+    all_plays = []
+    at_bat_index = 0
+    away_score = home_score = 0
+    batter_slot = {"away": 0, "home": 0}
+
+    for inning in range(1, innings + 1):
+        for half in ("top", "bottom"):
+            offense = "away" if half == "top" else "home"
+            defense = "home" if half == "top" else "away"
+            pitcher = lineups[defense]["pitchers"][min((inning - 1) // 3, 4)]
+            outs = 0
+            while outs < 3:
+                batter = lineups[offense]["batters"][batter_slot[offense] % 9]
+                batter_slot[offense] += 1
+                event, description = rng.choice(EVENTS)
+                balls = strikes = 0
+                events = []
+                for number in range(1, rng.randint(1, 7) + 1):
+                    events.append(
+                        _pitch(
+                            rng,
+                            len(events),
+                            number,
+                            balls,
+                            strikes,
+                            outs,
+                            game_pk,
+                            game_date,
+                        )
+                    )
+                    balls = min(balls + rng.randint(0, 1), 3)
+                    strikes = min(strikes + rng.randint(0, 1), 2)
+                rbi = 1 if event == "home_run" else 0
+                if event in ("field_out", "strikeout"):
+                    outs += 1
+                if offense == "away":
+                    away_score += rbi
+                else:
+                    home_score += rbi
+                all_plays.append(
+                    {
+                        "result": {
+                            "type": "atBat",
+                            "event": description,
+                            "eventType": event,
+                            "description": f"{batter['fullName']} {description.lower()}.",
+                            "rbi": rbi,
+                            "awayScore": away_score,
+                            "homeScore": home_score,
+                            "isOut": event in ("field_out", "strikeout"),
+                        },
+                        "about": {
+                            "atBatIndex": at_bat_index,
+                            "halfInning": half,
+                            "isTopInning": half == "top",
+                            "inning": inning,
+                            "startTime": f"{game_date}T23:00:00.000Z",
+                            "endTime": f"{game_date}T23:03:00.000Z",
+                            "isComplete": True,
+                            "isScoringPlay": rbi > 0,
+                            "hasReview": False,
+                            "hasOut": event in ("field_out", "strikeout"),
+                            "captivatingIndex": rng.randint(0, 100),
+                        },
+                        "count": {"balls": balls, "strikes": strikes, "outs": outs},
+                        "matchup": {
+                            "batter": batter,
+                            "batSide": {"code": "R", "description": "Right"},
+                            "pitcher": pitcher,
+                            "pitchHand": {"code": "R", "description": "Right"},
+                            "batterHotColdZones": [],
+                            "pitcherHotColdZones": [],
+                            "splits": {
+                                "batter": "vs_RHP",
+                                "pitcher": "vs_RHB",
+                                "menOnBase": "Empty",
+                            },
+                        },
+                        "pitchIndex": list(range(len(events))),
+                        "actionIndex": [],
+                        "runnerIndex": [0],
+                        "runners": [],
+                        "playEvents": events,
+                        "playEndTime": f"{game_date}T23:03:00.000Z",
+                        "atBatIndex": at_bat_index,
+                    }
+                )
+                at_bat_index += 1
+    return all_plays
+
+
+def linescore(all_plays: list[dict[str, t.Any]]) -> dict[str, t.Any]:
+    innings: dict[int, dict[str, t.Any]] = {}
+    for play in all_plays:
+        inning = play["about"]["inning"]
+        side = "away" if play["about"]["isTopInning"] else "home"
+        entry = innings.setdefault(
+            inning,
+            {
+                "num": inning,
+                "ordinalNum": f"{inning}th",
+                "home": {"runs": 0, "hits": 0, "errors": 0, "leftOnBase": 0},
+                "away": {"runs": 0, "hits": 0, "errors": 0, "leftOnBase": 0},
+            },
+        )
+        entry[side]["runs"] += play["result"]["rbi"]
+        if play["result"]["eventType"] in ("single", "double", "home_run"):
+            entry[side]["hits"] += 1
+
+    def total(side: str) -> dict[str, int]:
+        return {
+            key: sum(inning[side][key] for inning in innings.values())
+            for key in ("runs", "hits", "errors", "leftOnBase")
+        }
+
+    last = all_plays[-1]["about"]
+    return {
+        "currentInning": last["inning"],
+        "currentInningOrdinal": f"{last['inning']}th",
+        "inningState": "Bottom",
+        "inningHalf": "Bottom",
+        "isTopInning": False,
+        "scheduledInnings": 9,
+        "innings": list(innings.values()),
+        "teams": {"home": total("home"), "away": total("away")},
+        "balls": 0,
+        "strikes": 0,
+        "outs": 3,
+    }
+
+
+def _batting(rng: random.Random) -> dict[str, t.Any]:
+    return {
+        "gamesPlayed": 1,
+        "runs": rng.randint(0, 2),
+        "doubles": rng.randint(0, 1),
+        "triples": 0,
+        "homeRuns": rng.randint(0, 1),
+        "strikeOuts": rng.randint(0, 2),
+        "baseOnBalls": rng.randint(0, 1),
+        "hits": rng.randint(0, 3),
+        "atBats": rng.randint(3, 5),
+        "rbi": rng.randint(0, 3),
+        "leftOnBase": rng.randint(0, 3),
+        "summary": "1-4 | K",
+    }
+
+
+def _pitching(rng: random.Random) -> dict[str, t.Any]:
+    return {
+        "gamesPlayed": 1,
+        "inningsPitched": f"{rng.randint(0, 7)}.{rng.randint(0, 2)}",
+        "hits": rng.randint(0, 8),
+        "runs": rng.randint(0, 5),
+        "earnedRuns": rng.randint(0, 5),
+        "baseOnBalls": rng.randint(0, 4),
+        "strikeOuts": rng.randint(0, 10),
+        "homeRuns": rng.randint(0, 2),
+        "numberOfPitches": rng.randint(10, 110),
+        "strikes": rng.randint(5, 70),
+        "summary": "5.0 IP, 2 ER, 6 K, 2 BB",
+    }
+
+
+def boxscore(rng: random.Random, away_id: int, home_id: int) -> dict[str, t.Any]:
+    teams = {}
+    for side, team_id in (("away", away_id), ("home", home_id)):
+        lineup = _lineup(rng, team_id)
+        players = {}
+        for order, person in enumerate(lineup["batters"]):
+            players[f"ID{person['id']}"] = {
+                "person": person,
+                "jerseyNumber": str(rng.randint(1, 99)),
+                "position": _position(1 + order),
+                "status": {"code": "A", "description": "Active"},
+                "parentTeamId": team_id,
+                "battingOrder": str((order + 1) * 100),
+                "stats": {"batting": _batting(rng), "pitching": {}, "fielding": {}},
+                "seasonStats": {
+                    "batting": {"avg": ".271", "obp": ".345", "slg": ".462"},
+                },
+                "gameStatus": {
+                    "isCurrentBatter": False,
+                    "isCurrentPitcher": False,
+                    "isOnBench": False,
+                    "isSubstitute": False,
+                },
+                "allPositions": [_position(1 + order)],
+            }
+        for person in lineup["pitchers"]:
+            players[f"ID{person['id']}"] = {
+                "person": person,
+                "jerseyNumber": str(rng.randint(1, 99)),
+                "position": _position(0),
+                "status": {"code": "A", "description": "Active"},
+                "parentTeamId": team_id,
+                "stats": {"batting": {}, "pitching": _pitching(rng), "fielding": {}},
+                "seasonStats": {"pitching": {"era": "3.45", "whip": "1.18"}},
+                "gameStatus": {
+                    "isCurrentBatter": False,
+                    "isCurrentPitcher": False,
+                    "isOnBench": False,
+                    "isSubstitute": False,
+                },
+                "allPositions": [_position(0)],
+            }
+        team = next(team for team in TEAMS if team[0] == team_id)
+        teams[side] = {
+            "team": _ref("teams", team_id, team[1]),
+            "teamStats": {
+                "batting": _batting(rng),
+                "pitching": _pitching(rng),
+                "fielding": {"assists": 10, "putOuts": 27, "errors": 0},
+            },
+            "players": players,
+            "batters": [p["id"] for p in lineup["batters"]],
+            "pitchers": [p["id"] for p in lineup["pitchers"]],
+            "bench": [],
+            "bullpen": [],
+            "battingOrder": [p["id"] for p in lineup["batters"]],
+            "info": [
+                {
+                    "title": "BATTING",
+                    "fieldList": [{"label": "2B", "value": "Soto (21)."}],
+                }
+            ],
+            "note": [],
+        }
+
+    return {
+        "copyright": COPYRIGHT,
+        "teams": teams,
+        "officials": [
+            {
+                "official": {
+                    "id": 427000 + i,
+                    "fullName": f"Umpire {i}",
+                    "link": f"/api/v1/people/{427000 + i}",
+                },
+                "officialType": kind,
+            }
+            for i, kind in enumerate(("Home Plate", "First Base", "Second Base"))
+        ],
+        "info": [
+            {"label": "Weather", "value": "82 degrees, Partly Cloudy."},
+            {"label": "T", "value": "2:41."},
+            {"label": "Att", "value": "38,112."},
+        ],
+        "pitchingNotes": [],
+    }
+
+
+def game(
+    rng: random.Random,
+    game_pk: int = GAME_PK,
+    game_date: str = GAME_DATE,
+    away_id: int = 111,
+    home_id: int = 139,
+) -> tuple[dict[str, t.Any], dict[str, t.Any]]:
+    away = next(team for team in TEAMS if team[0] == away_id)
+    home = next(team for team in TEAMS if team[0] == home_id)
+    all_plays = plays(rng, away[0], home[0], game_pk=game_pk, game_date=game_date)
+    box = boxscore(rng, away[0], home[0])
+    box.pop("copyright")
+    play_by_play = {
+        "copyright": COPYRIGHT,
+        "allPlays": all_plays,
+        "currentPlay": all_plays[-1],
+        "scoringPlays": [
+            p["about"]["atBatIndex"] for p in all_plays if p["result"]["rbi"]
+        ],
+        "playsByInning": [],
+    }
+    players = {
+        key: {**player["person"], "primaryPosition": player["position"]}
+        for side in box["teams"].values()
+        for key, player in side["players"].items()
+    }
+    feed = {
+        "copyright": COPYRIGHT,
+        "gamePk": game_pk,
+        "link": f"/api/v1.1/game/{game_pk}/feed/live",
+        "metaData": {
+            "wait": 10,
+            "timeStamp": "20240705_021500",
+            "gameEvents": ["game_finished"],
+            "logicalEvents": ["gameStateChangeToGameOver"],
+        },
+        "gameData": {
+            "game": {
+                "pk": game_pk,
+                "type": "R",
+                "doubleHeader": "N",
+                "id": f"{game_date.replace('-', '/')}/{away[2]}mlb-{home[2]}mlb-1",
+                "gamedayType": "P",
+                "tiebreaker": "N",
+                "gameNumber": 1,
+                "calendarEventID": f"14-{game_pk}-{game_date}",
+                "season": game_date[:4],
+                "seasonDisplay": game_date[:4],
+            },
+            "datetime": {
+                "dateTime": f"{game_date}T23:05:00Z",
+                "originalDate": game_date,
+                "officialDate": game_date,
+                "dayNight": "night",
+                "time": "7:05",
+                "ampm": "PM",
+            },
+            "status": {
+                "abstractGameState": "Final",
+                "codedGameState": "F",
+                "detailedState": "Final",
+                "statusCode": "F",
+                "startTimeTBD": False,
+                "abstractGameCode": "F",
+            },
+            "teams": {
+                "away": {
+                    "id": away[0],
+                    "name": away[1],
+                    "fileCode": away[2],
+                    "abbreviation": away[3],
+                },
+                "home": {
+                    "id": home[0],
+                    "name": home[1],
+                    "fileCode": home[2],
+                    "abbreviation": home[3],
+                },
+            },
+            "players": players,
+            "venue": _ref("venues", 3, "Ballpark"),
+            "weather": {"condition": "Partly Cloudy", "temp": "82", "wind": "8 mph"},
+            "probablePitchers": {},
+        },
+        "liveData": {
+            "plays": {k: v for k, v in play_by_play.items() if k != "copyright"},
+            "linescore": linescore(all_plays),
+            "boxscore": box,
+            "decisions": {},
+            "leaders": {},
+        },
+    }
+    return feed, play_by_play
+
+
+def team_roster(rng: random.Random, team_id: int = 147) -> dict[str, t.Any]:
+    roster = []
+    for i in range(26):
+        position = _position(0 if i < 13 else 1 + i % 9)
+        roster.append(
+            {
+                "person": _person(rng, team_id * 10_000 + i),
+                "jerseyNumber": str(rng.randint(1, 99)),
+                "position": position,
+                "status": {"code": "A", "description": "Active"},
+                "parentTeamId": team_id,
+            }
+        )
+    return {
+        "copyright": COPYRIGHT,
+        "roster": roster,
+        "link": f"/api/v1/teams/{team_id}/roster",
+        "teamId": team_id,
+        "rosterType": "active",
+    }
+
+
+def schedule_games(payload: dict[str, t.Any]) -> list[dict[str, t.Any]]:
+    # The flattened shape statsapi.schedule() returns and ScheduleGame validates.
+    games = []
+    for game_ in payload["dates"][0]["games"]:
+        away, home = game_["teams"]["away"], game_["teams"]["home"]
+        games.append(
+            {
+                "game_id": game_["gamePk"],
+                "game_datetime": game_["gameDate"],
+                "game_date": game_["officialDate"],
+                "game_type": game_["gameType"],
+                "status": game_["status"]["detailedState"],
+                "away_name": away["team"]["name"],
+                "home_name": home["team"]["name"],
+                "away_id": away["team"]["id"],
+                "home_id": home["team"]["id"],
+                "doubleheader": game_["doubleHeader"] != "N",
+                "game_num": game_["gameNumber"],
+                "home_probable_pitcher": "",
+                "away_probable_pitcher": "",
+                "home_pitcher_note": "",
+                "away_pitcher_note": "",
+                "away_score": away["score"],
+                "home_score": home["score"],
+                "current_inning": 9,
+                "inning_state": "Bottom",
+                "venue_id": game_["venue"]["id"],
+                "venue_name": game_["venue"]["name"],
+                "national_broadcasts": [],
+                "series_status": "Series tied 1-1",
+                "winning_team": None,
+                "losing_team": None,
+                "winning_pitcher": "Juan Soto",
+                "losing_pitcher": "Mike Trout",
+                "save_pitcher": None,
+                "summary": f"{game_['officialDate']} - {away['team']['name']} @ {home['team']['name']} (Final)",
+            }
+        )
+    return games
+
+
+def boxscore_data(
+    payload: dict[str, t.Any], game_pk: int = GAME_PK
+) -> dict[str, t.Any]:
+    # The shape statsapi.boxscore_data() returns and BoxscoreResponse validates.
+    data: dict[str, t.Any] = {
+        "gameId": game_pk,
+        "teamInfo": {},
+        "playerInfo": {},
+        "away": payload["teams"]["away"],
+        "home": payload["teams"]["home"],
+        "gameBoxInfo": [f"{i['label']}: {i['value']}" for i in payload["info"]],
+    }
+    for side in ("away", "home"):
+        team = payload["teams"][side]
+        batters = []
+        for person_id in team["batters"]:
+            player = team["players"][f"ID{person_id}"]
+            stats = player["stats"]["batting"]
+            batters.append(
+                {
+                    "namefield": f"{player['battingOrder'][0]} {player['person']['fullName']}",
+                    "ab": str(stats["atBats"]),
+                    "r": str(stats["runs"]),
+                    "h": str(stats["hits"]),
+                    "doubles": str(stats["doubles"]),
+                    "triples": str(stats["triples"]),
+                    "hr": str(stats["homeRuns"]),
+                    "rbi": str(stats["rbi"]),
+                    "sb": "0",
+                    "bb": str(stats["baseOnBalls"]),
+                    "k": str(stats["strikeOuts"]),
+                    "lob": str(stats["leftOnBase"]),
+                    "avg": ".271",
+                    "ops": ".807",
+                    "personId": person_id,
+                    "substitution": False,
+                    "note": "",
+                    "name": player["person"]["fullName"],
+                    "position": player["position"]["abbreviation"],
+                    "obp": ".345",
+                    "slg": ".462",
+                    "battingOrder": player["battingOrder"],
+                }
+            )
+        pitchers = []
+        for person_id in team["pitchers"]:
+            player = team["players"][f"ID{person_id}"]
+            stats = player["stats"]["pitching"]
+            pitchers.append(
+                {
+                    "namefield": player["person"]["fullName"],
+                    "ip": stats["inningsPitched"],
+                    "h": str(stats["hits"]),
+                    "r": str(stats["runs"]),
+                    "er": str(stats["earnedRuns"]),
+                    "bb": str(stats["baseOnBalls"]),
+                    "k": str(stats["strikeOuts"]),
+                    "hr": str(stats["homeRuns"]),
+                    "era": "3.45",
+                    "p": str(stats["numberOfPitches"]),
+                    "s": str(stats["strikes"]),
+                    "name": player["person"]["fullName"],
+                    "personId": person_id,
+                    "note": "",
+                }
+            )
+        data[f"{side}Batters"] = batters
+        data[f"{side}Pitchers"] = pitchers
+        data[f"{side}BattingNotes"] = []
+    return data
+
+
+def teams(season: t.Union[int, str] = 2024) -> dict[str, t.Any]:
+    entries = []
+    for team_id, name, file_code, abbreviation in TEAMS:
+        location, _, team_name = name.rpartition(" ")
+        entries.append(
+            {
+                "id": team_id,
+                "name": name,
+                "link": f"/api/v1/teams/{team_id}",
+                "season": int(season),
+                "teamCode": file_code,
+                "fileCode": file_code,
+                "abbreviation": abbreviation,
+                "teamName": team_name,
+                "locationName": location or team_name,
+                "firstYearOfPlay": "1901",
+                "league": _ref("league", 103 if team_id % 2 else 104, "League"),
+                "division": _ref("divisions", 200 + team_id % 6, "Division"),
+                "sport": _ref("sports", 1, "Major League Baseball"),
+                "shortName": location or team_name,
+                "franchiseName": location or team_name,
+                "clubName": team_name,
+                "active": True,
+            }
+        )
+    return {"copyright": COPYRIGHT, "teams": entries}
+
+
+def people(person_ids: t.Iterable[int]) -> dict[str, t.Any]:
+    entries = []
+    for person_id in person_ids:
+        rng = random.Random(person_id)
+        person = _person(rng, person_id)
+        first, _, last = person["fullName"].partition(" ")
+        entries.append(
+            {
+                **person,
+                "firstName": first,
+                "lastName": last,
+                "primaryNumber": str(rng.randint(1, 99)),
+                "birthDate": f"{rng.randint(1985, 2002)}-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}",
+                "currentAge": rng.randint(22, 38),
+                "height": f"6' {rng.randint(0, 5)}\"",
+                "weight": rng.randint(170, 250),
+                "active": True,
+                "primaryPosition": _position(rng.randint(0, 9)),
+                "useName": first,
+                "boxscoreName": last,
+                "mlbDebutDate": f"{rng.randint(2010, 2023)}-04-0{rng.randint(1, 9)}",
+                "batSide": {"code": "R", "description": "Right"},
+                "pitchHand": {"code": "R", "description": "Right"},
+                "nameFirstLast": person["fullName"],
+                "lastFirstName": f"{last}, {first}",
+            }
+        )
+    return {"copyright": COPYRIGHT, "people": entries}
@@ -0,0 +1,570 @@
+# utils/services/simulator/server.py
+
+import gzip
+import json
+import logging
+import math
+import random
+import threading
+import time
+import typing as t
+from datetime import date, datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import BaseModel, Field
+
+from utils.services.getters.routing import RouteNotFound, Router
+from utils.services.replay.game_replay import make_patch
+from utils.services.simulator import payloads
+
+logger = logging.getLogger(__name__)
+
+TIMECODE_FORMAT = "%Y%m%d_%H%M%S"
+
+
+class LatencySpec(BaseModel):
+    distribution: t.Literal[
+        "fixed", "uniform", "normal", "lognormal", "exponential"
+    ] = Field("fixed", description="Shape of the latency distribution")
+    median_ms: float = Field(
+        0.0, description="Median (fixed, normal, lognormal) or mean (exponential)"
+    )
+    spread: float = Field(
+        0.0,
+        description="Range width in ms (uniform), std dev in ms (normal) or sigma (lognormal)",
+    )
+    tail_probability: float = Field(
+        0.0, description="Probability of adding a tail spike to a request"
+    )
+    tail_ms: float = Field(0.0, description="Extra latency of a tail spike")
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "uniform":
+            value = rng.uniform(
+                self.median_ms - self.spread / 2, self.median_ms + self.spread / 2
+            )
+        elif self.distribution == "normal":
+            value = rng.gauss(self.median_ms, self.spread)
+        elif self.distribution == "lognormal":
+            value = (
+                rng.lognormvariate(math.log(self.median_ms), self.spread)
+                if self.median_ms > 0
+                else 0.0
+            )
+        elif self.distribution == "exponential":
+            value = rng.expovariate(1 / self.median_ms) if self.median_ms > 0 else 0.0
+        else:
+            value = self.median_ms
+
+        if self.tail_probability and rng.random() < self.tail_probability:
+            value += self.tail_ms
+        return max(value, 0.0) / 1000
+
+
+class SimulatorConfig(BaseModel):
+    seed: int = Field(0, description="Seed for latency, error and data generation")
+    latency: LatencySpec = Field(
+        default_factory=LatencySpec, description="Default latency for every route"
+    )
+    endpoint_latency: dict[str, LatencySpec] = Field(
+        default_factory=dict, description="Latency overrides by ENDPOINTS key"
+    )
+    error_rate: float = Field(0.0, description="Probability of an injected error")
+    error_statuses: list[int] = Field(
+        default_factory=lambda: [500, 502, 503],
+        description="Status codes used for injected errors",
+    )
+    rate_limit_per_second: t.Optional[float] = Field(
+        None, description="Token bucket refill rate; requests beyond it get 429"
+    )
+    rate_limit_burst: int = Field(10, description="Token bucket capacity")
+    live_date: t.Optional[str] = Field(
+        None, description="Date (YYYY-MM-DD) whose games progress live; today if unset"
+    )
+    games_per_day: int = Field(15, description="Games on each generated slate")
+    play_seconds: float = Field(180.0, description="Game-clock seconds per play")
+    speed: float = Field(1.0, description="Game-clock seconds per wall-clock second")
+    first_pitch_delay_seconds: float = Field(
+        0.0, description="Wall-clock delay before the first live game starts"
+    )
+    stagger_seconds: float = Field(
+        600.0, description="Wall-clock gap between live game start times"
+    )
+    fixtures_dir: t.Optional[str] = Field(
+        None,
+        description="Directory of <endpoint>.json[.gz] bodies served as-is when present",
+    )
+    gzip: bool = Field(True, description="Compress bodies for gzip-accepting clients")
+
+
+class SimulatorError(Exception):
+    def __init__(self, status: int, message: str = ""):
+        super().__init__(message or str(status))
+        self.status = status
+
+
+def _timecode(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime(TIMECODE_FORMAT)
+
+
+def _epoch(timecode: str) -> float:
+    return (
+        datetime.strptime(timecode, TIMECODE_FORMAT)
+        .replace(tzinfo=timezone.utc)
+        .timestamp()
+    )
+
+
+class SimulatedGame:
+    # A game whose feed advances one play per interval from start_epoch onwards.
+
+    def __init__(
+        self,
+        game_pk: int,
+        game_date: str,
+        away_id: int,
+        home_id: int,
+        start_epoch: float,
+        interval: float,
+    ):
+        self.game_pk = game_pk
+        self.start_epoch = start_epoch
+        self.interval = max(interval, 1.0)  # timecodes have one-second resolution
+        self.template, _ = payloads.game(
+            random.Random(game_pk), game_pk, game_date, away_id, home_id
+        )
+        self.plays = self.template["liveData"]["plays"]["allPlays"]
+
+    def _epoch_of(self, k: int) -> float:
+        # State 0 is the pre-game feed one interval before the first play lands.
+        return self.start_epoch + (k - 1) * self.interval
+
+    def index_at(self, epoch: float) -> int:
+        if epoch < self._epoch_of(0):
+            return -1
+        return min(int((epoch - self._epoch_of(0)) // self.interval), len(self.plays))
+
+    def timecodes(self, now: float) -> list[str]:
+        return [_timecode(self._epoch_of(k)) for k in range(self.index_at(now) + 1)]
+
+    def status(self, k: int) -> dict[str, t.Any]:
+        if k >= len(self.plays):
+            code, state, detailed = "F", "Final", "Final"
+        elif k > 0:
+            code, state, detailed = "I", "Live", "In Progress"
+        else:
+            code, state, detailed = "S", "Preview", "Scheduled"
+        return {
+            "abstractGameState": state,
+            "codedGameState": code,
+            "detailedState": detailed,
+            "statusCode": code,
+            "startTimeTBD": False,
+            "abstractGameCode": state[0],
+        }
+
+    def state(self, k: int) -> dict[str, t.Any]:
+        k = max(0, min(k, len(self.plays)))
+        plays = self.plays[:k]
+        template = self.template
+        linescore = (
+            payloads.linescore(plays)
+            if plays
+            else {"currentInning": None, "innings": [], "teams": {}, "outs": 0}
+        )
+        return {
+            **template,
+            "metaData": {
+                **template["metaData"],
+                "timeStamp": _timecode(self._epoch_of(k)),
+            },
+            "gameData": {**template["gameData"], "status": self.status(k)},
+            "liveData": {
+                **template["liveData"],
+                "plays": {
+                    "allPlays": plays,
+                    "currentPlay": plays[-1] if plays else {},
+                    "scoringPlays": [
+                        p["about"]["atBatIndex"] for p in plays if p["result"]["rbi"]
+                    ],
+                    "playsByInning": [],
+                },
+                "linescore": linescore,
+            },
+        }
+
+    def state_at(self, epoch: float) -> dict[str, t.Any]:
+        return self.state(self.index_at(epoch))
+
+
+class MlbSimulator:
+    def __init__(
+        self,
+        config: t.Optional[SimulatorConfig] = None,
+        clock: t.Callable[[], float] = time.time,
+        sleep: t.Callable[[float], None] = time.sleep,
+    ):
+        self.config = config or SimulatorConfig()
+        self.clock = clock
+        self.sleep = sleep
+        self.router = Router()
+        self.started_at = clock()
+        self.request_count = 0
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._tokens = float(self.config.rate_limit_burst)
+        self._refilled_at = self.started_at
+        self._games: dict[int, SimulatedGame] = {}
+        self._slates: dict[str, list[dict[str, t.Any]]] = {}
+        self._handlers: dict[str, t.Callable[[dict[str, str]], t.Any]] = {
+            "schedule": self._schedule,
+            "game": self._game,
+            "game_timestamps": self._game_timestamps,
+            "game_diff": self._game_diff,
+            "game_linescore": self._game_linescore,
+            "game_boxscore": self._game_boxscore,
+            "game_playByPlay": self._game_play_by_play,
+            "game_winProbability": self._game_win_probability,
+            "game_contextMetrics": self._game_context_metrics,
+            "team_roster": self._team_roster,
+            "teams": self._teams,
+            "people": self._people,
+        }
+
+    @property
+    def live_date(self) -> str:
+        if self.config.live_date:
+            return self.config.live_date
+        return datetime.fromtimestamp(self.started_at, timezone.utc).date().isoformat()
+
+    # Request admission: throttling, injected errors and latency.
+
+    def _admit(self, endpoint: str) -> float:
+        with self._lock:
+            self.request_count += 1
+            if self.config.rate_limit_per_second:
+                now = self.clock()
+                self._tokens = min(
+                    self.config.rate_limit_burst,
+                    self._tokens
+                    + (now - self._refilled_at) * self.config.rate_limit_per_second,
+                )
+                self._refilled_at = now
+                if self._tokens < 1:
+                    raise SimulatorError(429, "Too Many Requests")
+                self._tokens -= 1
+
+            latency = self.config.endpoint_latency.get(endpoint, self.config.latency)
+            delay = latency.sample(self._rng)
+            if self.config.error_rate and self._rng.random() < self.config.error_rate:
+                status = self._rng.choice(self.config.error_statuses)
+                raise SimulatorError(status, "Injected upstream error")
+        return delay
+
+    def handle(self, path: str, query: dict[str, str]) -> tuple[int, t.Any]:
+        try:
+            endpoint, params = self.router.resolve(path)
+        except RouteNotFound as e:
+            raise SimulatorError(404, str(e))
+        params = {**query, **params}
+        delay = self._admit(endpoint)
+        if delay:
+            self.sleep(delay)
+
+        fixture = self._fixture(endpoint)
+        if fixture is not None:
+            return 200, fixture
+
+        handler = self._handlers.get(endpoint)
+        if handler is None:
+            return 200, {"copyright": payloads.COPYRIGHT}
+        return 200, handler(params)
+
+    def _fixture(self, endpoint: str) -> t.Optional[t.Any]:
+        if not self.config.fixtures_dir:
+            return None
+        directory = Path(self.config.fixtures_dir)
+        for path in (directory / f"{endpoint}.json", directory / f"{endpoint}.json.gz"):
+            if path.exists():
+                body = path.read_bytes()
+                if path.suffix == ".gz":
+                    body = gzip.decompress(body)
+                return json.loads(body)
+        return None
+
+    # Games and slates.
+
+    def _slate(self, game_date: str) -> list[dict[str, t.Any]]:
+        with self._lock:
+            if game_date in self._slates:
+                return self._slates[game_date]
+
+            day = date.fromisoformat(game_date)
+            rng = random.Random(f"{self.config.seed}:{game_date}")
+            first_game_pk = 700_000 + (day.toordinal() % 5_000) * 20
+            schedule = payloads.schedule(
+                rng, self.config.games_per_day, game_date, first_game_pk
+            )
+            games = schedule["dates"][0]["games"]
+            self._slates[game_date] = games
+            return games
+
+    def game(self, game_pk: int) -> SimulatedGame:
+        game_pk = int(game_pk)
+        if game_pk in self._games:
+            return self._games[game_pk]
+
+        # Games not on a requested slate are placed on the live date.
+        slate_index, game_date, away_id, home_id = 0, self.live_date, 111, 139
+        for slate_date, games in list(self._slates.items()):
+            for i, game_ in enumerate(games):
+                if game_["gamePk"] == game_pk:
+                    slate_index, game_date = i, slate_date
+                    away_id = game_["teams"]["away"]["team"]["id"]
+                    home_id = game_["teams"]["home"]["team"]["id"]
+
+        if game_date == self.live_date:
+            start = (
+                self.started_at
+                + self.config.first_pitch_delay_seconds
+                + slate_index * self.config.stagger_seconds
+            )
+            interval = self.config.play_seconds / self.config.speed
+        else:
+            start = _epoch(f"{game_date.replace('-', '')}_230500")
+            interval = self.config.play_seconds
+            if game_date > self.live_date:
+                start += 10 * 365 * 86_400  # never starts
+
+        simulated = SimulatedGame(game_pk, game_date, away_id, home_id, start, interval)
+        with self._lock:
+            return self._games.setdefault(game_pk, simulated)
+
+    def _dates(self, params: dict[str, str]) -> list[str]:
+        if "date" in params:
+            return [self._iso(params["date"])]
+        if "startDate" in params:
+            start = date.fromisoformat(self._iso(params["startDate"]))
+            end = date.fromisoformat(
+                self._iso(params.get("endDate", params["startDate"]))
+            )
+            return [
+                date.fromordinal(d).isoformat()
+                for d in range(start.toordinal(), end.toordinal() + 1)
+            ]
+        return [self.live_date]
+
+    @staticmethod
+    def _iso(value: str) -> str:
+        if "/" in value:
+            return datetime.strptime(value, "%m/%d/%Y").date().isoformat()
+        return value
+
+    def _game_state(self, params: dict[str, str]) -> dict[str, t.Any]:
+        game = self.game(int(params["gamePk"]))
+        if params.get("timecode"):
+            return game.state_at(_epoch(params["timecode"]))
+        return game.state_at(self.clock())
+
+    # Route handlers.
+
+    def _schedule(self, params: dict[str, str]) -> dict[str, t.Any]:
+        hydrate = params.get("hydrate", "")
+        dates = []
+        for game_date in self._dates(params):
+            games = []
+            for entry in self._slate(game_date):
+                state = self.game(entry["gamePk"]).state_at(self.clock())
+                linescore = state["liveData"]["linescore"]
+                game_ = {**entry, "status": state["gameData"]["status"]}
+                game_["teams"] = {
+                    side: {
+                        **entry["teams"][side],
+                        "score": linescore.get("teams", {})
+                        .get(side, {})
+                        .get("runs", 0),
+                    }
+                    for side in ("away", "home")
+                }
+                if "linescore" in hydrate:
+                    game_["linescore"] = linescore
+                games.append(game_)
+            dates.append(
+                {
+                    "date": game_date,
+                    "totalItems": len(games),
+                    "totalGames": len(games),
+                    "games": games,
+                    "events": [],
+                }
+            )
+        total = sum(len(d["games"]) for d in dates)
+        return {
+            "copyright": payloads.COPYRIGHT,
+            "totalItems": total,
+            "totalGames": total,
+            "dates": dates,
+        }
+
+    def _game(self, params: dict[str, str]) -> dict[str, t.Any]:
+        return self._game_state(params)
+
+    def _game_timestamps(self, params: dict[str, str]) -> list[str]:
+        return self.game(int(params["gamePk"])).timecodes(self.clock())
+
+    def _game_diff(self, params: dict[str, str]) -> t.Any:
+        game = self.game(int(params["gamePk"]))
+        now_index = game.index_at(self.clock())
+        start = game.index_at(_epoch(params["startTimecode"]))
+        end = now_index
+        if params.get("endTimecode"):
+            end = min(game.index_at(_epoch(params["endTimecode"])), now_index)
+        if start < 0:
+            # Like upstream, answer with the full feed when the start is unknown.
+            return game.state(end)
+
+        diffs = []
+        previous = game.state(start)
+        for k in range(start + 1, end + 1):
+            current = game.state(k)
+            diffs.append({"diff": make_patch(previous, current)})
+            previous = current
+        return diffs
+
+    def _game_linescore(self, params: dict[str, str]) -> dict[str, t.Any]:
+        state = self._game_state(params)
+        return {"copyright": payloads.COPYRIGHT, **state["liveData"]["linescore"]}
+
+    def _game_boxscore(self, params: dict[str, str]) -> dict[str, t.Any]:
+        state = self._game_state(params)
+        return {"copyright": payloads.COPYRIGHT, **state["liveData"]["boxscore"]}
+
+    def _game_play_by_play(self, params: dict[str, str]) -> dict[str, t.Any]:
+        state = self._game_state(params)
+        return {"copyright": payloads.COPYRIGHT, **state["liveData"]["plays"]}
+
+    @staticmethod
+    def _home_win_probability(play: dict[str, t.Any]) -> float:
+        lead = play["result"]["homeScore"] - play["result"]["awayScore"]
+        inning = play["about"]["inning"]
+        return 100 / (1 + math.exp(-lead * (0.35 + inning * 0.08)))
+
+    def _game_win_probability(self, params: dict[str, str]) -> list[dict[str, t.Any]]:
+        plays = self._game_state(params)["liveData"]["plays"]["allPlays"]
+        result = []
+        previous = 50.0
+        for play in plays:
+            home = self._home_win_probability(play)
+            result.append(
+                {
+                    **play,
+                    "homeTeamWinProbability": round(home, 1),
+                    "awayTeamWinProbability": round(100 - home, 1),
+                    "homeTeamWinProbabilityAdded": round(home - previous, 1),
+                    "leverageIndex": round(
+                        1 + play["about"]["inning"] / 9 - abs(home - 50) / 50, 2
+                    ),
+                    "contextMetrics": {},
+                }
+            )
+            previous = home
+        return result
+
+    def _game_context_metrics(self, params: dict[str, str]) -> dict[str, t.Any]:
+        state = self._game_state(params)
+        plays = state["liveData"]["plays"]["allPlays"]
+        home = self._home_win_probability(plays[-1]) if plays else 50.0
+        return {
+            "game": {
+                "gamePk": state["gamePk"],
+                "gameDate": state["gameData"]["datetime"]["dateTime"],
+                "officialDate": state["gameData"]["datetime"]["officialDate"],
+            },
+            "expectedStatistics": {},
+            "awayWinProbability": round(100 - home, 1),
+            "homeWinProbability": round(home, 1),
+        }
+
+    def _team_roster(self, params: dict[str, str]) -> dict[str, t.Any]:
+        team_id = int(params["teamId"])
+        return payloads.team_roster(random.Random(team_id), team_id)
+
+    def _teams(self, params: dict[str, str]) -> dict[str, t.Any]:
+        return payloads.teams(params.get("season", self.live_date[:4]))
+
+    def _people(self, params: dict[str, str]) -> dict[str, t.Any]:
+        ids = [int(i) for i in params.get("personIds", "").split(",") if i]
+        return payloads.people(ids)
+
+
+def _handler_class(simulator: MlbSimulator) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            try:
+                status, payload = simulator.handle(url.path, query)
+            except SimulatorError as e:
+                status, payload = e.status, {"message": str(e)}
+            except (KeyError, ValueError) as e:
+                status, payload = 400, {"message": f"Bad request: {e}"}
+
+            body = json.dumps(payload, separators=(",", ":")).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json;charset=UTF-8")
+            if status == 429:
+                self.send_header("Retry-After", "1")
+            if simulator.config.gzip and "gzip" in self.headers.get(
+                "Accept-Encoding", ""
+            ):
+                body = gzip.compress(body, compresslevel=1)
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+    return Handler
+
+
+class SimulatorServer:
+    def __init__(
+        self,
+        simulator: t.Optional[MlbSimulator] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.simulator = simulator or MlbSimulator()
+        self._server = ThreadingHTTPServer((host, port), _handler_class(self.simulator))
+        self._server.daemon_threads = True
+        self._thread: t.Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/"
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def start(self) -> "SimulatorServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "SimulatorServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
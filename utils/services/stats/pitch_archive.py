@@ -0,0 +1,126 @@
+# utils/services/stats/pitch_archive.py
+
+import json
+import os
+import typing as t
+from pathlib import Path
+
+import numpy as np
+
+from utils.services.stats.pitch_table import CODE_COLUMNS, CodeTable, PitchTable
+
+GAME_INDEX_DTYPE = np.dtype([("game_pk", "<i4"), ("start", "<i8"), ("stop", "<i8")])
+PERSON_INDEX_DTYPE = np.dtype([("person_id", "<i4"), ("row", "<i8")])
+
+# Pitches are stored sorted by game, so a game is one contiguous slice; the
+# person indexes are (person_id, row) pairs sorted by person_id.
+SORT_ORDER = ["game_pk", "at_bat_index", "pitch_number"]
+
+
+def _paths(directory: Path, season: int) -> dict[str, Path]:
+    return {
+        "pitches": directory / f"{season}.pitches.npy",
+        "games": directory / f"{season}.games.npy",
+        "batters": directory / f"{season}.batters.npy",
+        "pitchers": directory / f"{season}.pitchers.npy",
+        "codes": directory / f"{season}.codes.json",
+    }
+
+
+def _save(path: Path, array: np.ndarray) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp, path)
+
+
+def _person_index(pitches: np.ndarray, column: str) -> np.ndarray:
+    order = np.argsort(pitches[column], kind="stable")
+    index = np.empty(len(order), dtype=PERSON_INDEX_DTYPE)
+    index["person_id"] = pitches[column][order]
+    index["row"] = order
+    return index
+
+
+def write_season_archive(
+    directory: t.Union[str, Path], season: int, tables: t.Iterable[PitchTable]
+) -> Path:
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = _paths(directory, season)
+
+    table = PitchTable.concatenate(list(tables))
+    pitches = np.sort(table.pitches, order=SORT_ORDER, kind="stable")
+
+    game_pks, starts, counts = np.unique(
+        pitches["game_pk"], return_index=True, return_counts=True
+    )
+    games = np.empty(len(game_pks), dtype=GAME_INDEX_DTYPE)
+    games["game_pk"] = game_pks
+    games["start"] = starts
+    games["stop"] = starts + counts
+
+    _save(paths["games"], games)
+    _save(paths["batters"], _person_index(pitches, "batter_id"))
+    _save(paths["pitchers"], _person_index(pitches, "pitcher_id"))
+    codes_tmp = paths["codes"].with_name(paths["codes"].name + ".tmp")
+    codes_tmp.write_text(
+        json.dumps({column: table.codes[column].values for column in CODE_COLUMNS})
+    )
+    os.replace(codes_tmp, paths["codes"])
+    # The pitch file is written last so a reader never sees it without indexes.
+    _save(paths["pitches"], pitches)
+
+    return paths["pitches"]
+
+
+class SeasonPitchArchive:
+    def __init__(self, directory: t.Union[str, Path], season: int):
+        paths = _paths(Path(directory), season)
+        if not paths["pitches"].exists():
+            raise FileNotFoundError(f"No pitch archive for season {season}")
+
+        self.season = season
+        # mmap_mode="r" maps the files read-only, so worker processes opening the
+        # same archive share the page cache instead of each loading a copy.
+        self.pitches: np.ndarray = np.load(paths["pitches"], mmap_mode="r")
+        self.games: np.ndarray = np.load(paths["games"], mmap_mode="r")
+        self.batters: np.ndarray = np.load(paths["batters"], mmap_mode="r")
+        self.pitchers: np.ndarray = np.load(paths["pitchers"], mmap_mode="r")
+        self.codes = {
+            column: CodeTable(values)
+            for column, values in json.loads(paths["codes"].read_text()).items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.pitches)
+
+    @property
+    def table(self) -> PitchTable:
+        return PitchTable(self.pitches, self.codes)
+
+    def game_pks(self) -> np.ndarray:
+        return np.asarray(self.games["game_pk"])
+
+    def game(self, game_pk: int) -> PitchTable:
+        keys = self.games["game_pk"]
+        i = int(np.searchsorted(keys, game_pk))
+        if i == len(keys) or keys[i] != game_pk:
+            return PitchTable(self.pitches[:0], self.codes)
+
+        entry = self.games[i]
+        # A contiguous slice of the memmap; no pitch data is copied.
+        return PitchTable(self.pitches[entry["start"] : entry["stop"]], self.codes)
+
+    def _person(self, index: np.ndarray, person_id: int) -> PitchTable:
+        keys = index["person_id"]
+        lo = int(np.searchsorted(keys, person_id, side="left"))
+        hi = int(np.searchsorted(keys, person_id, side="right"))
+        rows = np.sort(index["row"][lo:hi])
+        return PitchTable(self.pitches[rows], self.codes)
+
+    def batter(self, person_id: int) -> PitchTable:
+        return self._person(self.batters, person_id)
+
+    def pitcher(self, person_id: int) -> PitchTable:
+        return self._person(self.pitchers, person_id)
@@ -0,0 +1,185 @@
+# utils/services/stats/pitch_table.py
+
+import typing as t
+
+import numpy as np
+
+PITCH_DTYPE = np.dtype(
+    [
+        ("game_pk", "<i4"),
+        ("inning", "u1"),
+        ("half", "u1"),  # 0 = top, 1 = bottom
+        ("at_bat_index", "<u2"),
+        ("pitch_number", "u1"),
+        ("batter_id", "<i4"),
+        ("pitcher_id", "<i4"),
+        ("pitch_type", "<i2"),
+        ("start_speed", "<f4"),
+        ("plate_x", "<f4"),
+        ("plate_z", "<f4"),
+        ("balls", "u1"),
+        ("strikes", "u1"),
+        ("call", "<i2"),
+        ("event", "<i2"),
+    ]
+)
+
+MISSING_CODE = -1
+
+CODE_COLUMNS = ("pitch_type", "call", "event")
+
+
+class CodeTable:
+    # Maps categorical strings (pitch types, calls, events) to small integer codes.
+
+    def __init__(self, values: t.Iterable[str] = ()):
+        self.values: list[str] = []
+        self._codes: dict[str, int] = {}
+        for value in values:
+            self.encode(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, value: t.Optional[str]) -> int:
+        if not value:
+            return MISSING_CODE
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def code(self, value: str) -> int:
+        return self._codes.get(value, MISSING_CODE)
+
+    def decode(self, codes: t.Union[int, np.ndarray]) -> t.Union[str, None, np.ndarray]:
+        lookup = np.array(self.values + [None], dtype=object)
+        # MISSING_CODE (-1) indexes the trailing None.
+        return lookup[codes]
+
+
+class PitchTable:
+    def __init__(
+        self,
+        pitches: np.ndarray,
+        codes: t.Optional[dict[str, CodeTable]] = None,
+    ):
+        if pitches.dtype != PITCH_DTYPE:
+            raise ValueError(f"Unexpected pitch dtype: {pitches.dtype}")
+
+        self.pitches = pitches
+        self.codes = codes or {column: CodeTable() for column in CODE_COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.pitches)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.pitches[column]
+
+    @property
+    def nbytes(self) -> int:
+        return self.pitches.nbytes
+
+    def decode(self, column: str, values: t.Optional[np.ndarray] = None):
+        if column not in self.codes:
+            raise ValueError(f"Column '{column}' is not categorical")
+        if values is None:
+            values = self.pitches[column]
+        return self.codes[column].decode(values)
+
+    def where(self, column: str, value: str) -> np.ndarray:
+        code = self.codes[column].code(value)
+        if code == MISSING_CODE:
+            # Not in the table; comparing with -1 would match the missing rows.
+            return self.pitches[:0]
+        return self.pitches[self.pitches[column] == code]
+
+    @classmethod
+    def concatenate(cls, tables: t.Sequence["PitchTable"]) -> "PitchTable":
+        codes = {column: CodeTable() for column in CODE_COLUMNS}
+        parts = []
+        for table in tables:
+            part = table.pitches.copy()
+            for column in CODE_COLUMNS:
+                # Remap each table's local codes into the merged code space.
+                remap = np.array(
+                    [codes[column].encode(v) for v in table.codes[column].values]
+                    + [MISSING_CODE],
+                    dtype=PITCH_DTYPE[column],
+                )
+                part[column] = remap[part[column]]
+            parts.append(part)
+
+        pitches = np.concatenate(parts) if parts else np.empty(0, dtype=PITCH_DTYPE)
+        return cls(pitches, codes)
+
+
+def _all_plays(payload: dict[str, t.Any]) -> list[dict[str, t.Any]]:
+    # game_playByPlay has allPlays at the top level, the game feed nests it.
+    if "allPlays" in payload:
+        return payload["allPlays"]
+    return payload.get("liveData", {}).get("plays", {}).get("allPlays", [])
+
+
+def _float(value: t.Any) -> float:
+    return float(value) if value is not None else np.nan
+
+
+def parse_pitches(
+    payload: dict[str, t.Any],
+    game_pk: t.Optional[int] = None,
+    codes: t.Optional[dict[str, CodeTable]] = None,
+) -> PitchTable:
+    if game_pk is None:
+        game_pk = payload.get("gamePk", 0)
+    if codes is None:
+        codes = {column: CodeTable() for column in CODE_COLUMNS}
+
+    plays = _all_plays(payload)
+    count = sum(
+        1 for play in plays for ev in play.get("playEvents", []) if ev.get("isPitch")
+    )
+    pitches = np.zeros(count, dtype=PITCH_DTYPE)
+
+    i = 0
+    for play in plays:
+        about = play.get("about", {})
+        matchup = play.get("matchup", {})
+        inning = about.get("inning", 0)
+        half = 0 if about.get("isTopInning", True) else 1
+        at_bat_index = about.get("atBatIndex", play.get("atBatIndex", 0))
+        batter_id = matchup.get("batter", {}).get("id", 0)
+        pitcher_id = matchup.get("pitcher", {}).get("id", 0)
+        event = codes["event"].encode(play.get("result", {}).get("eventType"))
+
+        for ev in play.get("playEvents", []):
+            if not ev.get("isPitch"):
+                continue
+
+            details = ev.get("details", {})
+            pitch_data = ev.get("pitchData", {})
+            coordinates = pitch_data.get("coordinates", {})
+            count_ = ev.get("count", {})
+
+            pitches[i] = (
+                game_pk,
+                inning,
+                half,
+                at_bat_index,
+                ev.get("pitchNumber", 0),
+                batter_id,
+                pitcher_id,
+                codes["pitch_type"].encode(details.get("type", {}).get("code")),
+                _float(pitch_data.get("startSpeed")),
+                _float(coordinates.get("pX")),
+                _float(coordinates.get("pZ")),
+                count_.get("balls", 0),
+                count_.get("strikes", 0),
+                codes["call"].encode(details.get("call", {}).get("code")),
+                event,
+            )
+            i += 1
+
+    return PitchTable(pitches, codes)
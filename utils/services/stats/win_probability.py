@@ -0,0 +1,171 @@
+# utils/services/stats/win_probability.py
+
+import threading
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import numpy as np
+
+from utils.services.getters.getter_service import GetterService
+from utils.services.metrics.tracing import propagate
+
+PLAY_DTYPE = np.dtype(
+    [
+        ("game_pk", "<i4"),
+        ("game_date", "datetime64[D]"),
+        ("at_bat_index", "<u2"),
+        ("inning", "u1"),
+        ("half", "u1"),  # 0 = top, 1 = bottom
+        ("home_wp", "<f4"),
+        ("wpa", "<f4"),
+        ("leverage", "<f4"),
+    ]
+)
+
+
+def _float(value: t.Any) -> float:
+    return float(value) if value is not None else np.nan
+
+
+def parse_win_probability(
+    plays: list[dict[str, t.Any]],
+    game_pk: int,
+    game_date: t.Union[str, date, None] = None,
+) -> np.ndarray:
+    series = np.zeros(len(plays), dtype=PLAY_DTYPE)
+    series["game_pk"] = game_pk
+    series["game_date"] = np.datetime64(game_date, "D") if game_date else "NaT"
+
+    for i, play in enumerate(plays):
+        about = play.get("about", {})
+        leverage = play.get("leverageIndex")
+        if leverage is None:
+            leverage = play.get("contextMetrics", {}).get("leverageIndex")
+
+        series["at_bat_index"][i] = about.get("atBatIndex", play.get("atBatIndex", i))
+        series["inning"][i] = about.get("inning", 0)
+        series["half"][i] = 0 if about.get("isTopInning", True) else 1
+        series["home_wp"][i] = _float(play.get("homeTeamWinProbability"))
+        series["wpa"][i] = _float(play.get("homeTeamWinProbabilityAdded"))
+        series["leverage"][i] = _float(leverage)
+
+    return series
+
+
+class WinProbabilityStore:
+    def __init__(self, service: t.Optional[GetterService] = None, max_workers=8):
+        self.service = service or GetterService()
+        self.max_workers = max_workers
+        self._series: dict[int, np.ndarray] = {}
+        self._current: dict[int, tuple[float, float]] = {}
+        self._combined: t.Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    def __contains__(self, game_pk: int) -> bool:
+        return int(game_pk) in self._series
+
+    def series(self, game_pk: int) -> np.ndarray:
+        return self._series[int(game_pk)]
+
+    def current(self, game_pk: int) -> t.Optional[tuple[float, float]]:
+        # (home, away) win probability from the latest contextMetrics poll.
+        return self._current.get(int(game_pk))
+
+    def ingest(
+        self,
+        game_pk: int,
+        plays: list[dict[str, t.Any]],
+        game_date: t.Union[str, date, None] = None,
+    ) -> np.ndarray:
+        game_pk = int(game_pk)
+        existing = self._series.get(game_pk)
+
+        # Plays before the last stored one are final; re-parse only from the last
+        # stored (possibly still in progress) play onwards.
+        keep = max(len(existing) - 1, 0) if existing is not None else 0
+        if existing is not None and game_date is None and len(existing):
+            game_date = existing["game_date"][0]
+            if np.isnat(game_date):
+                game_date = None
+
+        tail = parse_win_probability(plays[keep:], game_pk, game_date)
+        if existing is not None and keep:
+            series = np.concatenate([existing[:keep], tail])
+        else:
+            series = tail
+
+        with self._lock:
+            self._series[game_pk] = series
+            self._combined = None
+        return series
+
+    def ingest_context_metrics(self, game_pk: int, metrics: dict[str, t.Any]) -> None:
+        home = metrics.get("homeWinProbability")
+        away = metrics.get("awayWinProbability")
+        if home is not None and away is not None:
+            self._current[int(game_pk)] = (float(home), float(away))
+
+    def refresh(self, game_pk: int) -> np.ndarray:
+        metrics = self.service._get("game_contextMetrics", {"gamePk": game_pk})["data"]
+        self.ingest_context_metrics(game_pk, metrics)
+
+        # gameDate is the UTC start time, which puts night games on the next
+        # day; officialDate is the date the game is listed under.
+        game_date = metrics.get("game", {}).get("officialDate")
+        plays = self.service._get("game_winProbability", {"gamePk": game_pk})["data"]
+        return self.ingest(game_pk, plays, game_date)
+
+    def refresh_many(self, game_pks: t.Iterable[int]) -> dict[int, np.ndarray]:
+        game_pks = list(game_pks)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = pool.map(propagate(self.refresh), game_pks)
+        return dict(zip(game_pks, results))
+
+    def _all(self) -> np.ndarray:
+        with self._lock:
+            if self._combined is None:
+                parts = list(self._series.values())
+                self._combined = (
+                    np.concatenate(parts) if parts else np.empty(0, dtype=PLAY_DTYPE)
+                )
+            return self._combined
+
+    def plays_between(
+        self,
+        start_date: t.Union[str, date, None] = None,
+        end_date: t.Union[str, date, None] = None,
+    ) -> np.ndarray:
+        plays = self._all()
+        mask = np.ones(len(plays), dtype=bool)
+        if start_date is not None:
+            mask &= plays["game_date"] >= np.datetime64(start_date, "D")
+        if end_date is not None:
+            mask &= plays["game_date"] <= np.datetime64(end_date, "D")
+        return plays[mask]
+
+    def top_leverage(
+        self,
+        n: int = 10,
+        start_date: t.Union[str, date, None] = None,
+        end_date: t.Union[str, date, None] = None,
+    ) -> np.ndarray:
+        plays = self.plays_between(start_date, end_date)
+        plays = plays[~np.isnan(plays["leverage"])]
+        if len(plays) > n:
+            plays = plays[np.argpartition(-plays["leverage"], n)[:n]]
+        return plays[np.argsort(-plays["leverage"], kind="stable")]
+
+    def top_wpa(
+        self,
+        n: int = 10,
+        start_date: t.Union[str, date, None] = None,
+        end_date: t.Union[str, date, None] = None,
+    ) -> np.ndarray:
+        plays = self.plays_between(start_date, end_date)
+        plays = plays[~np.isnan(plays["wpa"])]
+        swing = np.abs(plays["wpa"])
+        if len(plays) > n:
+            keep = np.argpartition(-swing, n)[:n]
+            plays, swing = plays[keep], swing[keep]
+        return plays[np.argsort(-swing, kind="stable")]
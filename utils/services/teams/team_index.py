@@ -0,0 +1,184 @@
+# utils/services/teams/team_index.py
+
+import bisect
+import difflib
+import re
+import threading
+import typing as t
+import unicodedata
+from collections import defaultdict
+from datetime import date
+
+from schemas.responses import LookupTeamResponse, Team
+from utils.services.getters.getter_service import GetterService
+
+TEAM_FIELDS = (
+    "teams,id,name,teamCode,fileCode,abbreviation,teamName,locationName,shortName,"
+    "clubName"
+)
+
+# The fields statsapi.lookup_team substring-searches.
+SEARCH_FIELDS = (
+    "id",
+    "name",
+    "teamCode",
+    "fileCode",
+    "teamName",
+    "locationName",
+    "shortName",
+)
+
+
+def normalize(value: t.Any) -> str:
+    # Case- and accent-insensitive, punctuation collapsed to single spaces.
+    text = unicodedata.normalize("NFKD", str(value))
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    return " ".join(re.findall(r"[a-z0-9]+", text))
+
+
+class TeamIndex:
+    # One season's teams, indexed for lookups without a network call. Matching
+    # falls through these tiers and returns the first non-empty one:
+    #
+    #   1. id, teamCode, fileCode or abbreviation, exactly
+    #   2. substring of any searched field (what statsapi.lookup_team does)
+    #   3. every query token is a prefix of some name token ("yank" -> Yankees),
+    #      including names from teams_history ("devil rays" -> Rays)
+    #   4. closest name tokens by difflib ratio, for typos ("dodgrs")
+
+    def __init__(
+        self,
+        teams: t.Iterable[dict[str, t.Any]],
+        history: t.Iterable[dict[str, t.Any]] = (),
+        fuzzy_cutoff: float = 0.75,
+    ):
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.teams: dict[int, Team] = {}
+        self._codes: dict[str, set[int]] = defaultdict(set)
+        self._search: list[tuple[int, str]] = []
+        self._tokens: dict[str, set[int]] = defaultdict(set)
+
+        for raw in teams:
+            team = Team.model_validate(raw)
+            self.teams[team.id] = team
+            for key in ("teamCode", "fileCode", "abbreviation"):
+                if raw.get(key):
+                    self._codes[normalize(raw[key])].add(team.id)
+            self._search.append(
+                (team.id, "\n".join(normalize(raw.get(f, "")) for f in SEARCH_FIELDS))
+            )
+            self._add_names(team.id, raw)
+
+        for raw in history:
+            if raw.get("id") in self.teams:
+                self._add_names(raw["id"], raw)
+
+        self._token_list = sorted(self._tokens)
+
+    def _add_names(self, team_id: int, raw: dict[str, t.Any]) -> None:
+        for key in ("name", "teamName", "locationName", "shortName", "clubName"):
+            for token in normalize(raw.get(key, "")).split():
+                self._tokens[token].add(team_id)
+
+    def _prefix_ids(self, token: str) -> set[int]:
+        # Tokens are sorted, so every token starting with `token` is contiguous.
+        ids: set[int] = set()
+        i = bisect.bisect_left(self._token_list, token)
+        while i < len(self._token_list) and self._token_list[i].startswith(token):
+            ids |= self._tokens[self._token_list[i]]
+            i += 1
+        return ids
+
+    def _fuzzy_ids(self, token: str) -> set[int]:
+        ids: set[int] = set()
+        for match in difflib.get_close_matches(
+            token, self._token_list, n=3, cutoff=self.fuzzy_cutoff
+        ):
+            ids |= self._tokens[match]
+        return ids
+
+    def _match(self, query: str) -> list[int]:
+        if not query:
+            return []
+        if query.isdigit() and int(query) in self.teams:
+            return [int(query)]
+        if query in self._codes:
+            return sorted(self._codes[query])
+
+        ids = [team_id for team_id, text in self._search if query in text]
+        if ids:
+            return ids
+
+        for lookup in (self._prefix_ids, self._fuzzy_ids):
+            matched: t.Optional[set[int]] = None
+            for token in query.split():
+                found = lookup(token)
+                matched = found if matched is None else matched & found
+                if not matched:
+                    break
+            if matched:
+                return sorted(matched)
+        return []
+
+    def lookup(self, lookup_value: t.Any) -> LookupTeamResponse:
+        ids = self._match(normalize(lookup_value))
+        return LookupTeamResponse(data=[self.teams[i] for i in ids])
+
+    def get(self, team_id: int) -> t.Optional[Team]:
+        return self.teams.get(team_id)
+
+
+class TeamIndexCache:
+    # Builds each (season, activeStatus, sportIds) index once, on first use.
+
+    def __init__(self, service: t.Optional[GetterService] = None):
+        self.service = service or GetterService()
+        self._indexes: dict[tuple, TeamIndex] = {}
+        self._lock = threading.Lock()
+
+    def _build(self, season: int, activeStatus: str, sportIds: t.Any) -> TeamIndex:
+        teams = self.service._get(
+            "teams",
+            {
+                "season": season,
+                "activeStatus": activeStatus,
+                "sportIds": sportIds,
+                "fields": TEAM_FIELDS,
+            },
+        )["data"].get("teams", [])
+
+        history: list[dict[str, t.Any]] = []
+        if teams:
+            try:
+                history = self.service._get(
+                    "teams_history",
+                    {
+                        "teamIds": ",".join(str(team["id"]) for team in teams),
+                        "endSeason": season,
+                    },
+                )["data"].get("teams", [])
+            except Exception:
+                # Historical names only widen matching; current names still work.
+                history = []
+        return TeamIndex(teams, history)
+
+    def index(
+        self,
+        season: t.Optional[int] = None,
+        activeStatus: str = "Y",
+        sportIds: t.Any = 1,
+    ) -> TeamIndex:
+        # Without a season the calendar year is used, rather than asking the
+        # seasons endpoint on every call like statsapi.latest_season does.
+        key = (int(season or date.today().year), activeStatus, str(sportIds))
+        index = self._indexes.get(key)
+        if index is None:
+            with self._lock:
+                index = self._indexes.get(key)
+                if index is None:
+                    index = self._indexes[key] = self._build(*key)
+        return index
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()